@@ -0,0 +1,161 @@
+"""
+백그라운드 작업 스레드 모듈
+
+오래 걸리는 작업(경로 스캔, 파일 삭제 등)을 Qt 메인 스레드 밖에서 실행하고,
+진행 상황과 결과를 시그널로 전달하는 QThread 모음
+"""
+
+import time
+import threading
+import logging
+from PyQt5.QtCore import Qt, QThread, QEventLoop, pyqtSignal
+from PyQt5.QtWidgets import QProgressDialog
+
+logger = logging.getLogger(__name__)
+
+
+class ScanWorkerThread(QThread):
+    """CapacityFinder 스캔 파이프라인을 실행하는 워커 스레드
+
+    batch_ready: (부분 집계 {username: {'total_size', 'files'}}, 진행 통계 dict)
+    scan_finished: 최종 결과 dict (dic_files 형식)
+    scan_cancelled: 취소로 중단됨
+    scan_failed: 오류 메시지
+    """
+
+    batch_ready = pyqtSignal(object, object)
+    scan_finished = pyqtSignal(object)
+    scan_cancelled = pyqtSignal()
+    scan_failed = pyqtSignal(str)
+
+    def __init__(self, capacity_finder, path, batch_size=2000):
+        super().__init__()
+        self.capacity_finder = capacity_finder
+        self.path = path
+        self.batch_size = batch_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """스캔 취소 요청 (다음 파일 처리 전에 중단)"""
+        self._cancel_event.set()
+
+    def is_cancelled(self):
+        return self._cancel_event.is_set()
+
+    def run(self):
+        # 결과는 스레드 전용 dict 에 모으고, 완료 시에만 메인 스레드로 넘김
+        result = {}
+        try:
+            batches = self.capacity_finder.iter_scan_batches(
+                self.path, batch_size=self.batch_size, cancel_event=self._cancel_event
+            )
+            for batch in batches:
+                self.capacity_finder.merge_scan_batch(result, batch['users'])
+                stats = {
+                    'files_scanned': batch['files_scanned'],
+                    'mb_accounted': batch['mb_accounted'],
+                    'elapsed': batch['elapsed'],
+                }
+                self.batch_ready.emit(batch['users'], stats)
+        except Exception as e:
+            logger.error(f"백그라운드 스캔 오류: {self.path}, 에러: {e}")
+            self.scan_failed.emit(str(e))
+            return
+
+        if self._cancel_event.is_set():
+            self.scan_cancelled.emit()
+        else:
+            self.scan_finished.emit(result)
+
+
+class DeletionWorkerThread(QThread):
+    """DeletionEngine 으로 파일을 삭제하는 워커 스레드
+
+    progress: (완료 수, 전체 수, 삭제한 용량MB) - 너무 자주 보내지 않도록 간격 제한
+    deletion_finished: DeletionEngine.run 결과 dict (취소된 경우도 포함)
+    deletion_failed: 오류 메시지
+    """
+
+    progress = pyqtSignal(int, int, float)
+    deletion_finished = pyqtSignal(object)
+    deletion_failed = pyqtSignal(str)
+
+    PROGRESS_INTERVAL = 0.1  # 초
+
+    def __init__(self, engine, dir_path, files, batch_id=None, quarantine=None):
+        super().__init__()
+        self.engine = engine
+        self.dir_path = dir_path
+        self.files = files
+        self.batch_id = batch_id
+        self.quarantine = quarantine
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+
+    def cancel(self):
+        """삭제 취소 요청 (이미 시작한 삭제는 끝까지 진행)"""
+        self._cancel_event.set()
+
+    def _report(self, done, total, deleted_size):
+        now = time.monotonic()
+        if done == total or now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.progress.emit(done, total, deleted_size)
+
+    def run(self):
+        try:
+            result = self.engine.run(self.dir_path, self.files, progress=self._report,
+                                     cancel_event=self._cancel_event, batch_id=self.batch_id,
+                                     quarantine=self.quarantine)
+        except Exception as e:
+            logger.error(f"백그라운드 삭제 오류: {self.dir_path}, 에러: {e}")
+            self.deletion_failed.emit(str(e))
+            return
+        self.deletion_finished.emit(result)
+
+
+def run_deletion_with_progress(parent, engine, dir_path, files, title="파일 삭제", batch_id=None, quarantine=None):
+    """워커 스레드에서 파일을 삭제하는 동안 진행 대화상자 표시 (완료될 때까지 대기)
+
+    quarantine 을 주면 지우지 않고 휴지통으로 이동한다.
+
+    UI 는 계속 응답하며, 취소 버튼을 누르면 남은 파일은 삭제하지 않는다.
+    메모리 데이터 동기화는 호출한 쪽에서 CapacityFinder.apply_deletion_result 로 한다.
+
+    Returns:
+        dict: DeletionEngine.run 결과 (삭제 중 오류가 나면 예외 발생)
+    """
+    files = list(files)
+    dialog = QProgressDialog(f"🗑️ {len(files)}개 파일 삭제 중...", "취소", 0, max(len(files), 1), parent)
+    dialog.setWindowTitle(title)
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(300)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+
+    worker = DeletionWorkerThread(engine, dir_path, files, batch_id=batch_id, quarantine=quarantine)
+    outcome = {}
+    loop = QEventLoop()
+
+    def on_progress(done, total, deleted_size):
+        dialog.setValue(done)
+        dialog.setLabelText(f"🗑️ 삭제 중... {done}/{total}개 ({deleted_size / 1024:.2f} GB)")
+
+    def on_cancel():
+        dialog.setLabelText("⏹️ 취소 중... (진행 중인 삭제 마무리)")
+        worker.cancel()
+
+    worker.progress.connect(on_progress)
+    worker.deletion_finished.connect(lambda result: outcome.update(result=result))
+    worker.deletion_failed.connect(lambda message: outcome.update(error=message))
+    worker.finished.connect(loop.quit)
+    dialog.canceled.connect(on_cancel)
+
+    worker.start()
+    loop.exec_()
+    worker.wait()
+    dialog.close()
+
+    if 'error' in outcome:
+        raise RuntimeError(outcome['error'])
+    return outcome['result']
@@ -0,0 +1,415 @@
+"""
+메인 용량 트리 모델
+
+dic_files 위의 QAbstractItemModel. 최상위 행은 헤더/안내 행과 사용자 행이고,
+사용자 아래 파일 행은 트리에서 사용자를 펼칠 때(fetchMore) 처음 만든다.
+파일 행은 dic_files 의 파일 정보를 그대로 가리키므로 위젯/아이템을 따로 만들지 않는다.
+정렬은 CapacitySortProxyModel 이 하고, 헤더/안내 행은 정렬 방향과 관계없이 맨 위에 둔다.
+"""
+
+import logging
+from PyQt5.QtCore import Qt, QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtGui import QColor, QFont
+
+logger = logging.getLogger(__name__)
+
+COLUMN_LABELS = ["사용자/파일", "크기", "파일 수"]
+
+SORT_ROLE = Qt.UserRole + 1  # 정렬용 값 (이름 소문자 / 크기 MB / 파일 수)
+
+HEADER_BACKGROUND = QColor(211, 211, 211)  # lightGray
+USER_BACKGROUND = QColor(173, 216, 230)    # lightBlue
+
+
+class _HeaderRow:
+    """헤더/안내 행 (항상 맨 위, 굵게)"""
+
+    __slots__ = ('texts', 'position')
+
+    def __init__(self, texts):
+        self.texts = texts
+        self.position = 0
+
+
+class _UserRow:
+    """사용자 행 - rows 는 펼치기 전까지 None (파일 행 미생성)"""
+
+    __slots__ = ('username', 'files', 'size', 'file_count', 'rows', 'position')
+
+    def __init__(self, username, files, size, file_count):
+        self.username = username
+        self.files = files
+        self.size = size
+        self.file_count = file_count
+        self.rows = None
+        self.position = 0
+
+
+class CapacityTreeModel(QAbstractItemModel):
+    """사용자별 파일 용량 트리 모델
+
+    사용법:
+        model = CapacityTreeModel(format_file_size)
+        model.set_header("=== 제목 ===", "전체: 1.00 GB", "10개 파일")
+        model.set_users(dic_files.items())     # 새 스캔 결과
+        model.upsert_user(username, user_data)  # 바뀐 사용자만
+        model.remove_user(username)
+    """
+
+    def __init__(self, format_size, parent=None):
+        super().__init__(parent)
+        self.format_size = format_size
+        self._rows = []   # 최상위 행 (_HeaderRow / _UserRow)
+        self._users = {}  # {username: _UserRow}
+        self._header = None
+        self._ratings = {}
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    # === QAbstractItemModel ===
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, None)
+        user = self._user_at(parent)
+        if user is not None:
+            return self.createIndex(row, column, user)
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        user = index.internalPointer()
+        if user is None:
+            return QModelIndex()
+        return self.createIndex(user.position, 0, None)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._rows)
+        if parent.column() > 0:
+            return 0
+        user = self._user_at(parent)
+        return len(user.rows) if user is not None and user.rows is not None else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMN_LABELS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self._rows)
+        if parent.column() > 0:
+            return False
+        user = self._user_at(parent)
+        return user is not None and bool(user.files)
+
+    def canFetchMore(self, parent):
+        user = self._user_at(parent)
+        return user is not None and user.rows is None and bool(user.files)
+
+    def fetchMore(self, parent):
+        """사용자를 펼칠 때 파일 행 생성 (프록시가 정렬해서 보여줌)"""
+        user = self._user_at(parent)
+        if user is None or user.rows is not None:
+            return
+        rows = list(user.files)
+        if not rows:
+            user.rows = rows
+            return
+        self.beginInsertRows(parent, 0, len(rows) - 1)
+        user.rows = rows
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(COLUMN_LABELS):
+            return COLUMN_LABELS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        user = index.internalPointer()
+
+        if user is not None:
+            # 파일 행
+            file_info = user.rows[index.row()]
+            if role == Qt.DisplayRole:
+                if column == 0:
+                    return file_info['name']
+                if column == 1:
+                    return self.format_size(file_info['size'])
+                return ""
+            if role == SORT_ROLE:
+                if column == 0:
+                    return file_info['name'].lower()
+                if column == 1:
+                    return file_info['size']
+                return index.row()
+            return None
+
+        row = self._rows[index.row()]
+        if isinstance(row, _HeaderRow):
+            if role == Qt.DisplayRole:
+                return row.texts[column]
+            if role == Qt.BackgroundRole:
+                return HEADER_BACKGROUND
+            if role == Qt.FontRole:
+                return self._header_font
+            return None
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return self._display_name(row.username)
+            if column == 1:
+                return self.format_size(row.size)
+            return str(row.file_count)
+        if role == Qt.BackgroundRole:
+            return USER_BACKGROUND
+        if role == Qt.ToolTipRole and column == 0:
+            return self._rating_tooltip(row.username)
+        if role == SORT_ROLE:
+            if column == 0:
+                return row.username.lower()
+            if column == 1:
+                return row.size
+            return row.file_count
+        return None
+
+    # === 헤더/안내 행 ===
+
+    def set_header(self, title, total_text, count_text):
+        """맨 위 헤더 행 설정 (있으면 텍스트만 갱신, title 이 None 이면 제목 유지)"""
+        if title is None:
+            title = self._header.texts[0] if self._header is not None else ""
+        texts = [title, total_text, count_text]
+        if self._header is not None:
+            self._header.texts = texts
+            self.dataChanged.emit(self.index(self._header.position, 0),
+                                  self.index(self._header.position, len(COLUMN_LABELS) - 1))
+            return
+        self._header = _HeaderRow(texts)
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, self._header)
+        self._renumber(0)
+        self.endInsertRows()
+
+    def has_header(self):
+        return self._header is not None
+
+    def add_message(self, text):
+        """헤더 모양의 안내 행 추가 (스캔 취소 등)"""
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        row = _HeaderRow([text, "", ""])
+        row.position = position
+        self._rows.append(row)
+        self.endInsertRows()
+
+    # === 사용자 행 ===
+
+    def clear(self):
+        """모든 행 제거"""
+        self.beginResetModel()
+        self._rows = []
+        self._users = {}
+        self._header = None
+        self.endResetModel()
+
+    def set_users(self, users):
+        """사용자 행 전체 교체 (새 스캔 결과) - 헤더/안내 행은 유지
+
+        Args:
+            users: [(username, user_data), ...] - user_data 는 dic_files 값 ({'files', 'total_size'})
+        """
+        self.beginResetModel()
+        self._rows = [row for row in self._rows if isinstance(row, _HeaderRow)]
+        self._users = {}
+        for username, user_data in users:
+            user = _UserRow(username, user_data['files'], user_data['total_size'], len(user_data['files']))
+            self._users[username] = user
+            self._rows.append(user)
+        self._renumber(0)
+        self.endResetModel()
+
+    def upsert_user(self, username, user_data):
+        """사용자 행 추가/갱신 - 펼친 적 있는 사용자는 사라진/새 파일 행만 제거/추가"""
+        user = self._users.get(username)
+        files = user_data['files']
+        if user is None:
+            position = len(self._rows)
+            self.beginInsertRows(QModelIndex(), position, position)
+            user = _UserRow(username, files, user_data['total_size'], len(files))
+            user.position = position
+            self._users[username] = user
+            self._rows.append(user)
+            self.endInsertRows()
+            return
+
+        user.files = files
+        user.size = user_data['total_size']
+        user.file_count = len(files)
+        self.dataChanged.emit(self.index(user.position, 0), self.index(user.position, len(COLUMN_LABELS) - 1))
+        if user.rows is not None:
+            self._sync_file_rows(user)
+
+    def set_user_preview(self, username, size, file_count):
+        """스캔 중 부분 집계 - 파일 행 없이 크기/파일 수만 표시"""
+        user = self._users.get(username)
+        if user is None:
+            self.upsert_user(username, {'files': [], 'total_size': size})
+            user = self._users[username]
+        user.size = size
+        user.file_count = file_count
+        self.dataChanged.emit(self.index(user.position, 1), self.index(user.position, 2))
+
+    def remove_user(self, username):
+        """사용자 행 제거 (파일 행 포함)"""
+        user = self._users.pop(username, None)
+        if user is None:
+            return
+        self.beginRemoveRows(QModelIndex(), user.position, user.position)
+        del self._rows[user.position]
+        self._renumber(user.position)
+        self.endRemoveRows()
+
+    def changed_users(self, dic_files):
+        """표시한 내용과 다른 사용자 (추가/삭제 + 파일 목록 객체/파일 수/크기 변경)"""
+        changed = {username for username in self._users if username not in dic_files}
+        for username, user_data in dic_files.items():
+            user = self._users.get(username)
+            if (user is None or user.files is not user_data['files']
+                    or user.file_count != len(user_data['files'])
+                    or user.size != user_data['total_size']):
+                changed.add(username)
+        return changed
+
+    def usernames(self):
+        return list(self._users)
+
+    def user_index(self, username):
+        """사용자 행의 인덱스 (없으면 무효 인덱스)"""
+        user = self._users.get(username)
+        return self.index(user.position, 0) if user is not None else QModelIndex()
+
+    def username(self, index):
+        """사용자 행이면 사용자명, 아니면 None"""
+        user = self._user_at(index)
+        return user.username if user is not None else None
+
+    def file_name(self, index):
+        """파일 행이면 파일명, 아니면 None"""
+        if not index.isValid() or index.internalPointer() is None:
+            return None
+        return index.internalPointer().rows[index.row()]['name']
+
+    def is_pinned(self, index):
+        """헤더/안내 행인지 (정렬과 관계없이 맨 위)"""
+        return (index.isValid() and index.internalPointer() is None
+                and isinstance(self._rows[index.row()], _HeaderRow))
+
+    # === 레이팅 표시 ===
+
+    def set_ratings(self, ratings):
+        """사용자 레이팅 (별 표시/툴팁) 갱신"""
+        self._ratings = ratings or {}
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0),
+                                  [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def _display_name(self, username):
+        rating_info = self._ratings.get(username)
+        if rating_info is None:
+            return username
+        rating_value = rating_info.get('rating', 0)
+        return f"{username} {'⭐' * rating_value} ({rating_value}/5)"
+
+    def _rating_tooltip(self, username):
+        rating_info = self._ratings.get(username)
+        if rating_info is None:
+            return None
+        comment = rating_info.get('comment', '')
+        last_rating = rating_info.get('last_rating', '')
+        if not comment and not last_rating:
+            return None
+        tooltip_text = f"레이팅: {rating_info.get('rating', 0)}/5"
+        if comment:
+            tooltip_text += f"\n코멘트: {comment}"
+        if last_rating:
+            tooltip_text += f"\n작성일: {last_rating}"
+        return tooltip_text
+
+    # === 내부 ===
+
+    def _user_at(self, index):
+        """최상위 사용자 행의 _UserRow (그 외 None)"""
+        if not index.isValid() or index.internalPointer() is not None:
+            return None
+        row = self._rows[index.row()]
+        return row if isinstance(row, _UserRow) else None
+
+    def _renumber(self, start):
+        for position in range(start, len(self._rows)):
+            self._rows[position].position = position
+
+    def _sync_file_rows(self, user):
+        """펼친 사용자의 파일 행을 파일 목록과 맞춤 (남은 행은 유지 → 펼침/선택 유지)"""
+        parent = self.index(user.position, 0)
+        current = {file_info['name']: file_info for file_info in user.files}
+        rows = user.rows
+
+        # 사라진 파일 행 제거 (연속 구간 단위, 뒤에서부터)
+        end = len(rows) - 1
+        while end >= 0:
+            if rows[end]['name'] in current:
+                end -= 1
+                continue
+            start = end
+            while start > 0 and rows[start - 1]['name'] not in current:
+                start -= 1
+            self.beginRemoveRows(parent, start, end)
+            del rows[start:end + 1]
+            self.endRemoveRows()
+            end = start - 1
+
+        # 남은 행은 최신 파일 정보로 (크기 변경 반영)
+        for position, file_info in enumerate(rows):
+            rows[position] = current.pop(file_info['name'])
+        if rows:
+            self.dataChanged.emit(self.index(0, 1, parent), self.index(len(rows) - 1, 1, parent))
+
+        # 새 파일 행 추가 (프록시가 정렬 위치로 옮김)
+        if current:
+            new_rows = [file_info for file_info in user.files if file_info['name'] in current]
+            self.beginInsertRows(parent, len(rows), len(rows) + len(new_rows) - 1)
+            rows.extend(new_rows)
+            self.endInsertRows()
+
+
+class CapacitySortProxyModel(QSortFilterProxyModel):
+    """용량 트리 정렬 프록시 - SORT_ROLE 값으로 정렬
+
+    - 헤더/안내 행은 정렬 방향과 관계없이 맨 위 (추가한 순서)
+    - 파일 행은 파일 수 컬럼 기준이면 원래 순서 유지
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSortRole(SORT_ROLE)
+        self.setDynamicSortFilter(True)
+
+    def lessThan(self, left, right):
+        ascending = self.sortOrder() == Qt.AscendingOrder
+        model = self.sourceModel()
+        left_pinned = model.is_pinned(left)
+        right_pinned = model.is_pinned(right)
+        if left_pinned and right_pinned:
+            return left.row() < right.row() if ascending else left.row() > right.row()
+        if left_pinned or right_pinned:
+            return left_pinned == ascending
+
+        if left.parent().isValid() and left.column() == 2:
+            return left.row() < right.row() if ascending else left.row() > right.row()
+        return super().lessThan(left, right)
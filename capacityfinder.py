@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+헤드리스 CLI 모듈
+
+GUI(PyQt5) 없이 CapacityFinder 와 IntelligentCurationSystem 을 사용해서
+스캔 결과, 우선순위 삭제 리스트, 자동 삭제 추천을 JSON/CSV 로 출력한다.
+cron 등에서 정기 리포트를 만들 때 사용.
+
+사용 예:
+    python -m capacityfinder scan /mnt/recordings
+    python -m capacityfinder report /mnt/recordings --count 200 --balanced --format csv
+    python -m capacityfinder suggest /mnt/recordings --target-gb 50 -o suggest.json
+    python -m capacityfinder suggest /mnt/recordings --target-gb 50 --knapsack
+"""
+
+import os
+import sys
+import csv
+import json
+import logging
+import argparse
+
+# 명령별 CSV 컬럼
+SCAN_FIELDS = ['username', 'file_count', 'total_size_mb']
+FILE_FIELDS = ['rank', 'username', 'name', 'size', 'composite_score', 'file_score', 'rating_score']
+
+
+def build_parser():
+    """명령행 인자 파서 생성"""
+    parser = argparse.ArgumentParser(
+        prog='capacityfinder',
+        description='CapacityFinder 헤드리스 리포트 (GUI 없이 스캔/점수/추천 출력)'
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('path', help='스캔할 녹화 폴더 경로')
+    common.add_argument('--format', choices=['json', 'csv'], default='json', help='출력 형식 (기본: json)')
+    common.add_argument('-o', '--output', help='출력 파일 경로 (기본: 표준 출력)')
+    common.add_argument('--data-dir', help='레이팅/키워드/보호 파일, 스캔 인덱스가 있는 폴더 (기본: 현재 폴더)')
+    common.add_argument('--scan-mode', choices=['scandir', 'threadpool'], default='scandir', help='스캔 방식')
+    common.add_argument('-v', '--verbose', action='store_true', help='진행 로그를 표준 에러로 출력')
+
+    subparsers.add_parser('scan', parents=[common], help='사용자별 파일 수/총 용량')
+
+    report = subparsers.add_parser('report', parents=[common], help='우선순위 삭제 리스트')
+    report.add_argument('--count', type=int, default=100, help='리스트에 포함할 파일 수 (기본: 100)')
+    report.add_argument('--balanced', action='store_true', help='사용자별 균등 분배 모드')
+
+    suggest = subparsers.add_parser('suggest', parents=[common], help='목표 용량 기준 자동 삭제 추천')
+    suggest.add_argument('--target-gb', type=float, default=10, help='목표 절약 용량 GB (기본: 10)')
+    suggest.add_argument('--knapsack', action='store_true', help='GB 당 점수 손실이 가장 적은 조합으로 선택')
+
+    return parser
+
+
+def configure_logging(verbose):
+    """콘솔 로그 수준 조정 (파일 로그는 main 의 설정 유지)"""
+    level = logging.INFO if verbose else logging.WARNING
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in root.handlers:
+        if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
+            handler.setLevel(level)
+
+
+def collect_user_totals(finder):
+    """사용자별 합계 (용량 큰 순)"""
+    rows = [
+        {
+            'username': username,
+            'file_count': len(user_data['files']),
+            'total_size_mb': round(user_data['total_size'], 3),
+        }
+        for username, user_data in finder.dic_files.items()
+    ]
+    rows.sort(key=lambda row: row['total_size_mb'], reverse=True)
+    return rows
+
+
+def run_command(args, finder):
+    """명령 실행 → (JSON 으로 출력할 결과, CSV 행 목록, CSV 컬럼)"""
+    timings = finder.last_scan_timings
+    scan_summary = {
+        'path': finder.current_path,
+        'user_count': len(finder.dic_files),
+        'file_count': sum(len(user_data['files']) for user_data in finder.dic_files.values()),
+        'total_size_mb': round(sum(user_data['total_size'] for user_data in finder.dic_files.values()), 3),
+        'scan_seconds': round(timings.get('total', 0.0), 3),
+    }
+
+    if args.command == 'scan':
+        users = collect_user_totals(finder)
+        return {'scan': scan_summary, 'users': users}, users, SCAN_FIELDS
+
+    if args.command == 'report':
+        result = finder.get_priority_deletion_list(count_limit=args.count, balanced_mode=args.balanced)
+        files = result['priority_files']
+    else:
+        result = finder.intelligent_system.get_auto_deletion_suggestions(
+            finder, args.target_gb, mode='knapsack' if args.knapsack else 'threshold'
+        )
+        files = result['suggested_files']
+
+    rows = [dict(file_data, rank=rank) for rank, file_data in enumerate(files, start=1)]
+    return {'scan': scan_summary, args.command: result}, rows, FILE_FIELDS
+
+
+def write_output(args, payload, rows, fieldnames):
+    """JSON 또는 CSV 로 출력"""
+    stream = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        if args.format == 'csv':
+            writer = csv.DictWriter(stream, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(payload, stream, ensure_ascii=False, indent=2, default=str)
+            stream.write('\n')
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+def main(argv=None):
+    """CLI 진입점 - 종료 코드 반환"""
+    args = build_parser().parse_args(argv)
+
+    path = os.path.abspath(args.path)
+    if not os.path.isdir(path):
+        print(f"폴더를 찾을 수 없습니다: {path}", file=sys.stderr)
+        return 2
+    if args.output:
+        args.output = os.path.abspath(args.output)
+
+    # 레이팅/키워드/인덱스 파일은 상대 경로로 열리므로 데이터 폴더로 이동 후 로드
+    if args.data_dir:
+        os.chdir(args.data_dir)
+
+    from main import CapacityFinder
+    configure_logging(args.verbose)
+
+    finder = CapacityFinder()
+    finder.scan_mode = args.scan_mode
+    try:
+        finder.scan_path(path)
+        payload, rows, fieldnames = run_command(args, finder)
+        write_output(args, payload, rows, fieldnames)
+    except BrokenPipeError:
+        # `| head` 등으로 출력이 먼저 닫힌 경우 - 종료 시 추가 오류 출력 방지
+        sys.stdout = open(os.devnull, 'w')
+        return 1
+    finally:
+        finder.intelligent_system.parallel_scorer.close()
+        if finder.scan_index:
+            finder.scan_index.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+파일 삭제 엔진 모듈
+
+여러 화면에서 파일마다 os.path.exists + os.remove 를 순서대로 호출하던 삭제 루프를 하나로 모은 엔진.
+NAS(SMB) 에서는 호출 하나가 왕복 한 번이므로, 삭제를 제한된 크기의 스레드 풀에서 동시에 실행하고
+동시 작업 수는 io_concurrency 의 적응형 제어기로 조절한다.
+
+삭제 전후 상황은 추가 전용 저널(JSON Lines)에 기록한다.
+    {"op": "begin", "batch": ..., "dir": ..., "mode": "delete" | "quarantine", "files": [[파일명, 크기MB], ...], "time": ...}
+    {"op": "done", "batch": ..., "name": ..., "status": "deleted" | "missing" | "error", "error": ...}
+    {"op": "end", "batch": ..., "reason": "completed" | "cancelled" | "abandoned"}
+end 기록이 없는 배치는 중간에 끊긴 것이므로, 다음 실행에서 남은 파일만 이어서 삭제할 수 있다.
+
+quarantine 을 주면 파일을 지우지 않고 같은 볼륨의 휴지통 폴더로 이름만 바꿔 옮긴다 (quarantine 모듈 참고).
+
+Qt 에 의존하지 않으므로 CLI 에서도 그대로 사용할 수 있다.
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from io_concurrency import get_io_controller, is_network_path
+from quarantine import Quarantine
+
+logger = logging.getLogger(__name__)
+
+# 파일 하나의 삭제 결과
+STATUS_DELETED = 'deleted'
+STATUS_MISSING = 'missing'
+STATUS_ERROR = 'error'
+STATUS_CANCELLED = 'cancelled'  # 취소로 시도하지 않음 (저널에는 기록하지 않음)
+
+# 삭제 방식 (바로 삭제 / 휴지통으로 이동)
+MODE_DELETE = 'delete'
+MODE_QUARANTINE = 'quarantine'
+
+# 삭제 동시 작업 수 (네트워크 경로는 낮게 시작해서 제어기가 늘림)
+LOCAL_DELETE_CONCURRENCY = 8
+NETWORK_DELETE_CONCURRENCY = 4
+MAX_DELETE_CONCURRENCY = 16
+
+
+class DeletionJournal:
+    """삭제 배치 저널 (추가 전용 JSON Lines, 스레드 안전)
+
+    기록할 때마다 flush 하고, 배치 시작/끝은 fsync 까지 해서 비정상 종료 후에도 남은 파일을 알 수 있다.
+    진행 중인 배치가 하나도 없으면 파일을 비워서 크기가 계속 커지지 않게 한다.
+    """
+
+    def __init__(self, journal_file="deletion_journal.jsonl"):
+        self.journal_file = journal_file
+        self._lock = threading.RLock()
+        self._tail_checked = False  # 기록 도중 끊긴 마지막 줄 뒤에 이어 쓰지 않도록 처음 한 번 확인
+
+    def begin(self, batch_id, dir_path, files, mode=MODE_DELETE):
+        """배치 시작 기록 (삭제할 파일 전체 목록 포함)"""
+        self._append({
+            'op': 'begin',
+            'batch': batch_id,
+            'dir': dir_path,
+            'mode': mode,
+            'files': [[file_info['name'], file_info['size']] for file_info in files],
+            'time': time.time(),
+        }, sync=True)
+
+    def record(self, batch_id, file_name, status, error=None):
+        """파일 하나의 삭제 결과 기록"""
+        entry = {'op': 'done', 'batch': batch_id, 'name': file_name, 'status': status}
+        if error:
+            entry['error'] = error
+        self._append(entry)
+
+    def end(self, batch_id, reason='completed'):
+        """배치 종료 기록 - 남은 배치가 없으면 저널 비움"""
+        # 확인과 비우기 사이에 다른 배치의 시작 기록이 들어오지 않도록 잠금 안에서 처리
+        with self._lock:
+            self._append({'op': 'end', 'batch': batch_id, 'reason': reason}, sync=True)
+            if not self.pending_batches():
+                self.clear()
+
+    def abandon(self, batch_id):
+        """끊긴 배치를 이어서 삭제하지 않고 종료 처리"""
+        logger.info(f"🗑️ 삭제 배치 포기: {batch_id}")
+        self.end(batch_id, reason='abandoned')
+
+    def clear(self):
+        """저널 비우기"""
+        with self._lock:
+            try:
+                with open(self.journal_file, 'w', encoding='utf-8'):
+                    pass
+            except OSError as e:
+                logger.error(f"삭제 저널 초기화 오류: {self.journal_file}, 에러: {e}")
+
+    def pending_batches(self):
+        """끝나지 않은 배치 목록 (시작 순서)
+
+        Returns:
+            list: [{'batch', 'dir', 'mode', 'time', 'files': [{'name', 'size'}, ...]}, ...]
+                  files 는 아직 삭제되지 않은 파일만 (오류가 났던 파일은 다시 시도)
+        """
+        batches = {}
+        finished = {}
+        with self._lock:
+            if not os.path.exists(self.journal_file):
+                return []
+            try:
+                with open(self.journal_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            continue  # 기록 도중 끊긴 마지막 줄
+                        op = entry.get('op')
+                        batch_id = entry.get('batch')
+                        if op == 'begin':
+                            batches[batch_id] = entry
+                            finished[batch_id] = set()
+                        elif op == 'done' and batch_id in finished:
+                            if entry.get('status') in (STATUS_DELETED, STATUS_MISSING):
+                                finished[batch_id].add(entry.get('name'))
+                        elif op == 'end':
+                            batches.pop(batch_id, None)
+            except OSError as e:
+                logger.error(f"삭제 저널 읽기 오류: {self.journal_file}, 에러: {e}")
+                return []
+
+        pending = []
+        for batch_id, entry in batches.items():
+            done_names = finished[batch_id]
+            pending.append({
+                'batch': batch_id,
+                'dir': entry['dir'],
+                'mode': entry.get('mode', MODE_DELETE),
+                'time': entry.get('time'),
+                'files': [{'name': name, 'size': size} for name, size in entry['files']
+                          if name not in done_names],
+            })
+        return pending
+
+    def _terminate_partial_line(self):
+        """저널이 줄바꿈 없이 끝나면 (기록 도중 종료) 줄바꿈부터 써야 함"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return ''
+                f.seek(-1, os.SEEK_END)
+                return '' if f.read(1) == b'\n' else '\n'
+        except OSError:
+            return ''
+
+    def _append(self, entry, sync=False):
+        # 잘못된 UTF-8 파일명(surrogate escape)도 쓸 수 있도록 ASCII 로 기록 (json.loads 로 그대로 복원됨)
+        line = json.dumps(entry) + '\n'
+        with self._lock:
+            try:
+                if not self._tail_checked:
+                    line = self._terminate_partial_line() + line
+                    self._tail_checked = True
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write(line)
+                    f.flush()
+                    if sync:
+                        os.fsync(f.fileno())
+            except (OSError, ValueError) as e:
+                # 저널 기록 실패가 삭제 자체를 막으면 안 됨 (UnicodeError 는 ValueError)
+                logger.error(f"삭제 저널 기록 오류: {self.journal_file}, 에러: {e}")
+
+
+class DeletionEngine:
+    """저널 기반 병렬 파일 삭제 엔진
+
+    사용법:
+        engine = DeletionEngine()
+        result = engine.run(current_path, files, progress=callback, cancel_event=event)
+    files 는 'name'/'size' 를 읽을 수 있는 항목(FileRecord, dict 등)이며 결과 목록에 그대로 담긴다.
+    """
+
+    def __init__(self, journal=None):
+        self.journal = journal if journal is not None else DeletionJournal()
+
+    def run(self, dir_path, files, progress=None, cancel_event=None, batch_id=None, quarantine=None):
+        """파일 삭제 실행 (호출한 스레드에서 완료까지 대기)
+
+        Args:
+            dir_path: 파일들이 있는 디렉토리
+            files: 삭제할 파일 목록
+            progress: progress(완료 수, 전체 수, 삭제한 용량MB) 콜백 (호출한 스레드에서 호출됨)
+            cancel_event: set 되면 아직 시작하지 않은 삭제는 건너뜀
+            batch_id: 저널에 이미 있는 배치를 이어서 실행할 때의 배치 ID
+            quarantine: 지우는 대신 옮길 Quarantine (dir_path 의 휴지통)
+
+        Returns:
+            dict: deleted_files / missing_files / failed_files [(파일, 오류 메시지)] (입력 순서),
+                  deleted_count, deleted_size (MB), cancelled, quarantined, batch
+                  (휴지통으로 옮긴 파일도 deleted_files 에 담김)
+        """
+        files = list(files)
+        total = len(files)
+        if batch_id is None:
+            batch_id = uuid.uuid4().hex
+            self.journal.begin(batch_id, dir_path, files, MODE_QUARANTINE if quarantine else MODE_DELETE)
+        else:
+            logger.info(f"🗑️ 중단된 삭제 배치 이어서 실행: {batch_id} ({total}개 파일)")
+
+        if quarantine is not None:
+            operation, op_args = _stash, (quarantine,)
+        else:
+            operation, op_args = _unlink, (dir_path,)
+
+        controller = get_io_controller(
+            dir_path, 'rename' if quarantine is not None else 'unlink',
+            initial=NETWORK_DELETE_CONCURRENCY if is_network_path(dir_path) else LOCAL_DELETE_CONCURRENCY,
+            max_limit=MAX_DELETE_CONCURRENCY,
+        )
+
+        start = time.perf_counter()
+        statuses = [None] * total
+        errors = {}
+        done = 0
+        deleted_size = 0.0
+
+        if total:
+            with ThreadPoolExecutor(max_workers=min(controller.max_limit, total)) as executor:
+                futures = {
+                    executor.submit(self._delete_one, controller, operation, op_args, file_info['name'], cancel_event): index
+                    for index, file_info in enumerate(files)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    status, error = future.result()
+                    statuses[index] = status
+                    file_name = files[index]['name']
+                    if status == STATUS_CANCELLED:
+                        continue
+                    self.journal.record(batch_id, file_name, status, error)
+                    if status == STATUS_DELETED:
+                        deleted_size += files[index]['size']
+                        logger.debug(f"삭제 완료: {file_name}")
+                    elif status == STATUS_MISSING:
+                        logger.warning(f"파일을 찾을 수 없음: {file_name}")
+                    else:
+                        errors[index] = error
+                        logger.error(f"파일 삭제 오류: {file_name}, 에러: {error}")
+                    done += 1
+                    if progress:
+                        progress(done, total, deleted_size)
+
+        cancelled = STATUS_CANCELLED in statuses
+        result = {
+            'deleted_files': [files[i] for i, status in enumerate(statuses) if status == STATUS_DELETED],
+            'missing_files': [files[i] for i, status in enumerate(statuses) if status == STATUS_MISSING],
+            'failed_files': [(files[i], errors[i]) for i in sorted(errors)],
+            'deleted_size': deleted_size,
+            'cancelled': cancelled,
+            'quarantined': quarantine is not None,
+            'batch': batch_id,
+        }
+        result['deleted_count'] = len(result['deleted_files'])
+
+        if quarantine is not None:
+            quarantine.record(batch_id, result['deleted_files'])
+        self.journal.end(batch_id, reason='cancelled' if cancelled else 'completed')
+
+        logger.info(f"{'♻️ 휴지통 이동' if quarantine is not None else '🗑️ 삭제'} 완료: {result['deleted_count']}/{total}개 파일, {deleted_size / 1024:.2f}GB, "
+                    f"없음 {len(result['missing_files'])}개, 오류 {len(errors)}개"
+                    f"{', 취소됨' if cancelled else ''} ({time.perf_counter() - start:.2f}초)")
+        return result
+
+    def pending_batches(self):
+        """저널에 남은 중단된 배치 목록 (DeletionJournal.pending_batches 참고)"""
+        return self.journal.pending_batches()
+
+    def resume(self, batch, progress=None, cancel_event=None):
+        """중단된 배치의 남은 파일 삭제 (휴지통 배치는 휴지통으로 이동)"""
+        return self.run(batch['dir'], batch['files'], progress=progress, cancel_event=cancel_event,
+                        batch_id=batch['batch'], quarantine=self.batch_quarantine(batch))
+
+    @staticmethod
+    def batch_quarantine(batch):
+        """중단된 배치를 이어서 실행할 때 사용할 휴지통 (바로 삭제하던 배치면 None)"""
+        return Quarantine(batch['dir']) if batch.get('mode') == MODE_QUARANTINE else None
+
+    @staticmethod
+    def _delete_one(controller, operation, op_args, file_name, cancel_event):
+        """워커 스레드: 파일 하나 삭제 → (상태, 오류 메시지)"""
+        if cancel_event is not None and cancel_event.is_set():
+            return STATUS_CANCELLED, None
+        try:
+            return controller.run(operation, *op_args, file_name), None
+        except OSError as e:
+            return STATUS_ERROR, str(e)
+
+
+def _unlink(dir_path, file_name):
+    """파일 삭제 - 이미 없는 파일은 오류가 아니므로 동시성 제어기에 실패로 알리지 않음"""
+    try:
+        os.remove(os.path.join(dir_path, file_name))
+        return STATUS_DELETED
+    except FileNotFoundError:
+        return STATUS_MISSING
+
+
+def _stash(quarantine, file_name):
+    """파일을 휴지통으로 이동 (_unlink 와 같은 상태 반환)"""
+    try:
+        quarantine.stash(file_name)
+        return STATUS_DELETED
+    except FileNotFoundError:
+        return STATUS_MISSING
@@ -0,0 +1,313 @@
+"""
+삭제 후보 선택 모듈
+
+사용자별로 점수 낮은 순 정렬된 후보 목록({username: [file_data, ...]})에서
+삭제 추천/우선순위 리스트에 넣을 파일을 고르는 알고리즘 모음.
+file_data 는 build_scored_file_list 가 만든 dict ('size', 'composite_score', 'username' 등)를 사용한다.
+
+Qt 에 의존하지 않으므로 CLI 에서도 그대로 사용할 수 있다.
+"""
+
+import heapq
+import bisect
+import itertools
+from collections import Counter
+from typing import NamedTuple
+
+# 자동 삭제 추천 전략별 사용자 상한 비율 / 최대 복합 점수
+NORMAL_CAP_RATIO = 0.9       # 기준 이하 후보의 90%
+NORMAL_MAX_SCORE = 0.65
+AGGRESSIVE_CAP_RATIO = 0.95  # 사용자 후보 전체의 95%
+AGGRESSIVE_MAX_SCORE = 0.85
+KNAPSACK_CAP_RATIO = 0.9     # 사용자 후보 전체의 90%
+KNAPSACK_MAX_SCORE = 0.85
+
+
+class FairShareAllocator:
+    """사용자별 커서와 우선순위 큐로 라운드 로빈처럼 골고루 파일을 꺼내는 분배기
+
+    모든 사용자가 k 개씩 받은 뒤에야 k+1 번째 파일을 받으며,
+    같은 라운드 안에서는 다음 파일의 점수가 낮은 사용자가 먼저 받는다.
+    사용자별 상한(caps)에 닿거나 후보가 떨어진 사용자는 빠진다.
+    파일 n 개, 사용자 U 명일 때 O(n log U), 라운드 수 제한 없음.
+
+    사용법:
+        allocator = FairShareAllocator(user_candidates, caps)
+        for file_data in allocator:
+            ...  # 충분히 골랐으면 break
+        allocator.selected_counts  # {username: 꺼낸 파일 수}
+    """
+
+    def __init__(self, user_candidates, caps=None, score_key='composite_score'):
+        """
+        Args:
+            user_candidates: {username: [file_data, ...]} (사용자별로 점수 낮은 순 정렬)
+            caps: {username: 최대 선택 수} (없는 사용자는 후보 전체)
+            score_key: 같은 라운드 안의 순서를 정할 점수 키
+        """
+        self.user_candidates = user_candidates
+        self.score_key = score_key
+        self.limits = {}
+        for username, files in user_candidates.items():
+            limit = len(files)
+            if caps is not None and username in caps:
+                limit = min(limit, caps[username])
+            self.limits[username] = limit
+        self.selected_counts = Counter()
+
+    def __iter__(self):
+        score_key = self.score_key
+        # (라운드 = 그 사용자에게서 이미 꺼낸 수, 다음 파일 점수, 사용자 순서, 사용자명)
+        heap = [
+            (0, files[0][score_key], order, username)
+            for order, (username, files) in enumerate(self.user_candidates.items())
+            if self.limits[username] > 0
+        ]
+        heapq.heapify(heap)
+
+        while heap:
+            cursor, _, order, username = heapq.heappop(heap)
+            files = self.user_candidates[username]
+            self.selected_counts[username] += 1
+            yield files[cursor]
+
+            cursor += 1
+            if cursor < self.limits[username]:
+                heapq.heappush(heap, (cursor, files[cursor][score_key], order, username))
+
+
+def ratio_caps(user_candidates, ratio):
+    """사용자별 상한 = 후보 수 * ratio (최소 1개)"""
+    return {username: max(1, int(len(files) * ratio)) for username, files in user_candidates.items()}
+
+
+def summarize_by_user(selected_files):
+    """선택된 파일의 사용자별 {'count', 'size'} 통계"""
+    user_stats = {}
+    for file_data in selected_files:
+        stats = user_stats.get(file_data['username'])
+        if stats is None:
+            stats = user_stats[file_data['username']] = {'count': 0, 'size': 0}
+        stats['count'] += 1
+        stats['size'] += file_data['size']
+    return user_stats
+
+
+class TargetSavingsSelector:
+    """목표 절약 용량을 채우는 삭제 후보 선택기
+
+    후보 전체를 점수순으로 한 번만 합치고, 사용자별 점수 목록과 크기 누적합을 만들어 두면
+    "점수 t 이하 파일로 (사용자별 상한 안에서) 얼마나 확보할 수 있는가"를 사용자당 이진 탐색으로 구할 수 있다.
+    이 값은 t 에 대해 단조 증가하므로, 목표를 채우는 가장 낮은 점수 기준도 이진 탐색으로 찾는다.
+    """
+
+    def __init__(self, user_candidates, score_key='composite_score'):
+        """
+        Args:
+            user_candidates: {username: [file_data, ...]} (사용자별로 점수 낮은 순 정렬)
+        """
+        self.user_candidates = user_candidates
+        self.score_key = score_key
+        self._scores = {}
+        self._prefix_sizes = {}
+        for username, files in user_candidates.items():
+            self._scores[username] = [file_data[score_key] for file_data in files]
+            self._prefix_sizes[username] = list(itertools.accumulate((file_data['size'] for file_data in files), initial=0))
+        # 같은 점수는 사용자 순서를 유지하며 합침 (전체 정렬과 같은 순서)
+        self.ordered = list(heapq.merge(*user_candidates.values(), key=lambda file_data: file_data[score_key]))
+        self.thresholds = sorted({file_data[score_key] for file_data in self.ordered})
+
+    @staticmethod
+    def relative_cap(ratio):
+        """기준 이하 후보 수의 ratio 배까지 (최소 1개)"""
+        return lambda eligible, total: min(eligible, max(1, int(eligible * ratio)))
+
+    @staticmethod
+    def total_cap(ratio):
+        """사용자 후보 전체 수의 ratio 배까지 (최소 1개)"""
+        return lambda eligible, total: min(eligible, max(1, int(total * ratio)))
+
+    def user_limits(self, threshold, cap):
+        """기준 점수 이하에서 사용자별로 고를 수 있는 파일 수 {username: 개수}"""
+        limits = {}
+        for username, scores in self._scores.items():
+            eligible = bisect.bisect_right(scores, threshold)
+            limits[username] = cap(eligible, len(scores)) if eligible else 0
+        return limits
+
+    def available(self, threshold, cap):
+        """기준 점수 이하 파일을 상한 안에서 모두 골랐을 때의 용량 (점수 낮은 순으로 고르므로 누적합)"""
+        return sum(self._prefix_sizes[username][limit] for username, limit in self.user_limits(threshold, cap).items())
+
+    def find_threshold(self, target, cap, max_score):
+        """target 용량을 채우는 가장 낮은 점수 기준 (max_score 이하에서 못 채우면 None)"""
+        high = bisect.bisect_right(self.thresholds, max_score)
+        if high == 0 or self.available(self.thresholds[high - 1], cap) < target:
+            return None
+        low = 0
+        high -= 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.available(self.thresholds[middle], cap) >= target:
+                high = middle
+            else:
+                low = middle + 1
+        return self.thresholds[low]
+
+    def select(self, threshold, cap, target):
+        """기준 점수 이하 파일을 점수 낮은 순으로, 사용자별 상한 안에서 target 을 채울 때까지 선택"""
+        limits = self.user_limits(threshold, cap)
+        counts = Counter()
+        selected = []
+        savings = 0
+        for file_data in self.ordered:
+            if savings >= target or file_data[self.score_key] > threshold:
+                break
+            username = file_data['username']
+            if counts[username] >= limits[username]:
+                continue
+            selected.append(file_data)
+            savings += file_data['size']
+            counts[username] += 1
+        return selected
+
+    def select_knapsack(self, target, cap, max_score):
+        """용량당 점수 손실이 가장 적은 조합으로 target 을 채우는 선택 (최소 비용 배낭 문제의 근사)
+
+        점수/용량 비율이 낮은 파일부터 채운 뒤, 넘친 만큼 점수가 높은 파일을 다시 빼서 손실을 줄인다.
+        사용자별 상한은 max_score 이하 후보 수 기준.
+        """
+        limits = self.user_limits(max_score, cap)
+        score_key = self.score_key
+        eligible = [file_data for file_data in self.ordered if file_data[score_key] <= max_score]
+        eligible.sort(key=lambda file_data: file_data[score_key] / file_data['size'] if file_data['size'] > 0 else float('inf'))
+
+        counts = Counter()
+        selected = []
+        savings = 0
+        for file_data in eligible:
+            if savings >= target:
+                break
+            username = file_data['username']
+            if counts[username] >= limits[username]:
+                continue
+            selected.append(file_data)
+            savings += file_data['size']
+            counts[username] += 1
+
+        # 목표를 넘긴 만큼 점수가 높은 파일부터 빼기
+        if savings > target:
+            kept = []
+            for file_data in sorted(selected, key=lambda file_data: file_data[score_key], reverse=True):
+                if savings - file_data['size'] >= target:
+                    savings -= file_data['size']
+                else:
+                    kept.append(file_data)
+            selected = kept
+
+        selected.sort(key=lambda file_data: file_data[score_key])
+        return selected
+
+    # === 절약 곡선 ===
+
+    def savings_curve(self, cap, max_score=1.0):
+        """점수 기준별 (삭제 파일 수, 절약 용량, 점수 손실) 곡선을 후보 한 번 순회로 계산
+
+        기준 t 의 점은 available(t, cap) 과 같은 선택(사용자별로 점수 낮은 파일부터 상한까지)을 나타낸다.
+        """
+        score_key = self.score_key
+        prefix_scores = {
+            username: list(itertools.accumulate((file_data[score_key] for file_data in files), initial=0.0))
+            for username, files in self.user_candidates.items()
+        }
+        eligible = Counter()
+        limits = Counter()
+        file_count = 0
+        savings = 0.0
+        score_loss = 0.0
+        points = []
+
+        for index, file_data in enumerate(self.ordered):
+            score = file_data[score_key]
+            if score > max_score:
+                break
+            username = file_data['username']
+            eligible[username] += 1
+            old_limit = limits[username]
+            new_limit = cap(eligible[username], len(self._scores[username]))
+            if new_limit != old_limit:
+                limits[username] = new_limit
+                file_count += new_limit - old_limit
+                savings += self._prefix_sizes[username][new_limit] - self._prefix_sizes[username][old_limit]
+                score_loss += prefix_scores[username][new_limit] - prefix_scores[username][old_limit]
+            # 같은 점수가 이어지면 마지막 파일에서만 점 추가
+            next_index = index + 1
+            if next_index == len(self.ordered) or self.ordered[next_index][score_key] != score:
+                points.append(CurvePoint(score, file_count, savings, score_loss))
+
+        return SavingsCurve(points)
+
+    def knapsack_curve(self, cap, max_score=1.0):
+        """select_knapsack 의 채우는 순서(MB 당 점수 낮은 순) 기준 곡선 - threshold 는 MB 당 점수"""
+        limits = self.user_limits(max_score, cap)
+        score_key = self.score_key
+        eligible = [file_data for file_data in self.ordered if file_data[score_key] <= max_score and file_data['size'] > 0]
+        eligible.sort(key=lambda file_data: file_data[score_key] / file_data['size'])
+
+        counts = Counter()
+        file_count = 0
+        savings = 0.0
+        score_loss = 0.0
+        points = []
+        for file_data in eligible:
+            username = file_data['username']
+            if counts[username] >= limits[username]:
+                continue
+            counts[username] += 1
+            file_count += 1
+            savings += file_data['size']
+            score_loss += file_data[score_key]
+            points.append(CurvePoint(file_data[score_key] / file_data['size'], file_count, savings, score_loss))
+        return SavingsCurve(points)
+
+
+class CurvePoint(NamedTuple):
+    """절약 곡선의 한 점 - 기준까지 삭제했을 때의 누적값"""
+    threshold: float   # 점수 기준 (knapsack 곡선은 MB 당 점수)
+    file_count: int    # 삭제 파일 수
+    savings_mb: float  # 절약 용량 (MB)
+    score_loss: float  # 삭제 파일의 복합 점수 합
+
+
+class SavingsCurve:
+    """기준이 느슨해질수록 늘어나는 절약 용량 곡선 - 임의 목표 용량을 이진 탐색으로 바로 조회"""
+
+    def __init__(self, points):
+        self.points = points
+        self._savings = [point.savings_mb for point in points]
+
+    def __len__(self):
+        return len(self.points)
+
+    @property
+    def max_savings_mb(self):
+        return self._savings[-1] if self._savings else 0.0
+
+    def at_target(self, target_mb):
+        """target_mb 이상을 절약하는 첫 점 (곡선 끝까지 못 채우면 마지막 점, 빈 곡선이면 None)"""
+        if not self.points:
+            return None
+        index = bisect.bisect_left(self._savings, target_mb)
+        return self.points[min(index, len(self.points) - 1)]
+
+    def sample(self, count=10):
+        """표시용으로 절약 용량 기준 고르게 뽑은 점들"""
+        if not self.points or count <= 0:
+            return []
+        step = self.max_savings_mb / count
+        samples = []
+        for i in range(1, count + 1):
+            point = self.at_target(step * i)
+            if not samples or samples[-1] is not point:
+                samples.append(point)
+        return samples
@@ -0,0 +1,132 @@
+"""
+파일 레코드 모듈
+
+dic_files 의 파일 항목을 파일마다 dict 로 만들지 않고 __slots__ 객체로 저장해서
+수십만 개 파일 규모에서도 메모리 사용량을 줄이기 위한 모듈.
+기존 다이얼로그들이 사용하던 file_info['name'] / file_info['size'] /
+file_info.get(...) 형태의 접근은 그대로 지원한다.
+
+파일명에서 얻는 메타데이터(사이트, 녹화 시각, epoch 초, 날짜)는 스캔 시 한 번만
+채워두고, 분석 코드는 파일명을 다시 파싱하지 않고 이 필드를 읽는다.
+"""
+
+import sys
+
+from filename_parser import parse_filename, parse_date_part
+
+
+class FileRecord:
+    """파일 한 개의 정보 (dict 처럼 읽고 쓸 수 있는 경량 레코드)
+
+    name: 파일명
+    size: 크기 (MB)
+    site: 사이트명 (파일명 그대로의 대소문자)
+    date_time: 녹화 시각 (시간대 포함 datetime, 날짜가 잘못되면 None)
+    epoch: date_time 의 epoch 초 (정렬/비교용)
+    day: 녹화 날짜 문자열 'YYYY-MM-DD'
+    """
+
+    __slots__ = ('name', 'size', 'site', 'date_time', 'epoch', 'day')
+
+    def __init__(self, name, size, site=None, date_time=None, day=None):
+        self.name = name
+        self.size = size
+        self.site = site
+        self.date_time = date_time
+        self.epoch = date_time.timestamp() if date_time is not None else None
+        self.day = day
+
+    @classmethod
+    def from_name(cls, name, size):
+        """파일명을 파싱해서 메타데이터를 채운 레코드 생성 (파서 캐시 사용)"""
+        parsed = parse_filename(name)
+        if parsed is None:
+            return cls(name, size)
+        return cls(name, size, parsed.site, parsed.date_time, parsed.day)
+
+    @classmethod
+    def from_index(cls, name, size, site, date_part):
+        """스캔 인덱스에 저장된 사이트/날짜 문자열로 레코드 생성 (파일명 재파싱 없음)"""
+        if not date_part:
+            return cls(name, size, site)
+        return cls(name, size, site, parse_date_part(date_part), sys.intern(date_part.split('T')[0]))
+
+    # === dict 호환 접근 ===
+
+    def __getitem__(self, key):
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        if key in self.__slots__:
+            return getattr(self, key, default)
+        return default
+
+    def keys(self):
+        return list(self.__slots__)
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self.__slots__]
+
+    def to_dict(self):
+        """일반 dict 로 변환 (저장/직렬화용)"""
+        return dict(self.items())
+
+    def __repr__(self):
+        return f"FileRecord(name={self.name!r}, size={self.size!r}, site={self.site!r}, day={self.day!r})"
+
+
+class UserFileStats:
+    """사용자 파일 목록의 점수 계산용 통계 (한 번 계산해서 파일마다 재사용)
+
+    file_count: 파일 수
+    min_size / max_size: 파일 크기 최소/최대 (MB)
+    oldest / newest: 녹화 시각 최소/최대 (날짜가 있는 파일 기준, 없으면 None)
+    day_counts: {날짜 문자열: 그 날짜의 파일 수} (날짜가 있는 파일 기준)
+    """
+
+    __slots__ = ('file_count', 'min_size', 'max_size', 'oldest', 'newest', 'day_counts')
+
+    def __init__(self, files):
+        self.file_count = len(files)
+        self.min_size = None
+        self.max_size = None
+        self.oldest = None
+        self.newest = None
+        self.day_counts = {}
+
+        day_counts = self.day_counts
+        for file_info in files:
+            size = file_info['size']
+            if self.min_size is None or size < self.min_size:
+                self.min_size = size
+            if self.max_size is None or size > self.max_size:
+                self.max_size = size
+
+            date_time = file_info.date_time
+            if date_time is None:
+                continue
+            if self.oldest is None or date_time < self.oldest:
+                self.oldest = date_time
+            if self.newest is None or date_time > self.newest:
+                self.newest = date_time
+            day_counts[file_info.day] = day_counts.get(file_info.day, 0) + 1
+
+    def same_day_count(self, file_info):
+        """file_info 와 같은 날짜에 녹화된 파일 수 (자기 자신 포함)"""
+        if file_info.date_time is None:
+            return 0
+        return self.day_counts.get(file_info.day, 0)
+
+    def __repr__(self):
+        return (f"UserFileStats(files={self.file_count}, size={self.min_size}~{self.max_size}, "
+                f"days={len(self.day_counts)})")
@@ -0,0 +1,298 @@
+"""
+파일 시스템 감시 모듈
+
+녹화 폴더에 새로 생기거나 삭제/이름변경된 파일을 감지해서
+전체 재스캔 없이 변경분만 전달하는 감시기.
+Linux 에서는 inotify 를 사용하고, 그 외 환경(또는 inotify 사용 불가 시)에서는
+디렉토리 수정시각 기반 폴링으로 동작한다.
+"""
+
+import os
+import sys
+import time
+import struct
+import select
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _load_inotify():
+    """libc 의 inotify 함수 로드 (Linux 가 아니거나 실패하면 None)"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except Exception as e:
+        logger.warning(f"inotify 로드 실패 - 폴링 방식 사용: {e}")
+        return None
+
+
+class FileChanges:
+    """디바운스 구간 동안 모인 변경분
+
+    created: {파일명: (크기MB, 수정시각)} - 새로 생겼거나 크기가 바뀐 파일
+    deleted: {파일명, ...} - 사라진 파일 (이름변경의 이전 이름 포함)
+    """
+
+    def __init__(self, created=None, deleted=None, full_rescan=False):
+        self.created = created or {}
+        self.deleted = deleted or set()
+        self.full_rescan = full_rescan  # 이벤트 유실 등으로 전체 재스캔이 필요한 경우
+
+    def __bool__(self):
+        return bool(self.created or self.deleted or self.full_rescan)
+
+    def __repr__(self):
+        return f"FileChanges(created={len(self.created)}, deleted={len(self.deleted)}, full_rescan={self.full_rescan})"
+
+
+class DirectoryWatcher:
+    """디렉토리 변경을 감시해서 디바운스된 변경분을 콜백으로 전달하는 감시기
+
+    콜백은 감시 스레드에서 호출되므로, GUI 갱신은 호출 측에서 메인 스레드로 넘겨야 함
+    """
+
+    def __init__(self, path, on_changes, mode='auto', debounce=1.0, max_delay=5.0, poll_interval=5.0):
+        """
+        Args:
+            path: 감시할 디렉토리
+            on_changes: FileChanges 를 받는 콜백
+            mode: 'auto' (가능하면 inotify), 'inotify', 'poll'
+            debounce: 마지막 이벤트 후 이 시간(초) 동안 조용하면 변경분 전달
+            max_delay: 이벤트가 계속 들어와도 이 시간(초)이 지나면 전달
+            poll_interval: 폴링 방식의 확인 주기(초)
+        """
+        self.path = path
+        self.on_changes = on_changes
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+
+        self._libc = _load_inotify() if mode in ('auto', 'inotify') else None
+        if mode == 'inotify' and self._libc is None:
+            logger.warning("inotify 를 사용할 수 없어 폴링 방식으로 전환")
+        self.mode = 'inotify' if self._libc is not None else 'poll'
+
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._touched = set()    # 생성/수정/이동되어 들어온 파일명 (전달 시 stat)
+        self._deleted = set()
+        self._first_event_time = None
+        self._last_event_time = None
+
+    def start(self):
+        """감시 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        target = self._run_inotify if self.mode == 'inotify' else self._run_polling
+        self._thread = threading.Thread(target=target, name='DirectoryWatcher', daemon=True)
+        self._thread.start()
+        logger.info(f"👁️ 폴더 감시 시작 ({self.mode}): {self.path}")
+
+    def stop(self):
+        """감시 스레드 종료"""
+        self._stop_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        logger.info(f"👁️ 폴더 감시 종료: {self.path}")
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    # === 이벤트 누적 / 디바운스 ===
+
+    def _note_touched(self, name):
+        self._deleted.discard(name)
+        self._touched.add(name)
+        self._mark_event()
+
+    def _note_deleted(self, name):
+        self._touched.discard(name)
+        self._deleted.add(name)
+        self._mark_event()
+
+    def _mark_event(self):
+        now = time.monotonic()
+        if self._first_event_time is None:
+            self._first_event_time = now
+        self._last_event_time = now
+
+    def _flush_due(self):
+        if self._first_event_time is None:
+            return False
+        now = time.monotonic()
+        return (now - self._last_event_time >= self.debounce or
+                now - self._first_event_time >= self.max_delay)
+
+    def _flush(self, full_rescan=False):
+        """모인 이벤트를 FileChanges 로 묶어 콜백 호출 (변경 파일만 stat)"""
+        created = {}
+        deleted = set(self._deleted)
+        for name in self._touched:
+            try:
+                stat_result = os.stat(os.path.join(self.path, name))
+            except FileNotFoundError:
+                deleted.add(name)  # 생성 직후 다시 사라진 파일
+                continue
+            except OSError as e:
+                logger.error(f"감시 파일 정보 오류: {name}, 에러: {e}")
+                continue
+            created[name] = (stat_result.st_size / (1024 * 1024), stat_result.st_mtime)
+
+        self._touched = set()
+        self._deleted = set()
+        self._first_event_time = None
+        self._last_event_time = None
+
+        changes = FileChanges(created, deleted, full_rescan)
+        if changes:
+            logger.debug(f"👁️ 변경분 전달: {changes}")
+            try:
+                self.on_changes(changes)
+            except Exception as e:
+                logger.error(f"변경분 콜백 오류: {e}")
+
+    def _wait_timeout(self, idle_timeout):
+        """다음 대기 시간 - 대기 중인 변경분이 있으면 디바운스 마감까지만"""
+        if self._first_event_time is None:
+            return idle_timeout
+        now = time.monotonic()
+        due = min(self._last_event_time + self.debounce, self._first_event_time + self.max_delay)
+        return max(0.0, min(idle_timeout, due - now))
+
+    # === inotify 방식 ===
+
+    def _run_inotify(self):
+        libc = self._libc
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            logger.warning("inotify 초기화 실패 - 폴링 방식으로 전환")
+            self.mode = 'poll'
+            self._run_polling()
+            return
+
+        try:
+            wd = libc.inotify_add_watch(fd, os.fsencode(self.path), WATCH_MASK)
+            if wd < 0:
+                logger.warning(f"inotify 감시 등록 실패 - 폴링 방식으로 전환: {self.path}")
+                self.mode = 'poll'
+                self._run_polling()
+                return
+
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select([fd], [], [], self._wait_timeout(0.5))
+                if readable:
+                    try:
+                        data = os.read(fd, 64 * 1024)
+                    except BlockingIOError:
+                        data = b''
+                    if self._handle_inotify_data(data):
+                        return  # 감시 대상 디렉토리가 사라짐
+                if self._flush_due():
+                    self._flush()
+        except Exception as e:
+            logger.error(f"inotify 감시 오류: {e}")
+        finally:
+            os.close(fd)
+
+    def _handle_inotify_data(self, data):
+        """inotify 이벤트 버퍼 파싱 - 디렉토리 자체가 사라지면 True"""
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = data[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+
+            if mask & IN_Q_OVERFLOW:
+                # 이벤트 유실 - 변경분을 신뢰할 수 없으므로 전체 재스캔 요청
+                logger.warning("inotify 이벤트 큐 넘침 - 전체 재스캔 요청")
+                self._flush(full_rescan=True)
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                logger.warning(f"감시 중인 폴더가 사라짐: {self.path}")
+                self._flush(full_rescan=True)
+                return True
+            if mask & IN_ISDIR or not raw_name:
+                continue
+
+            name = os.fsdecode(raw_name)
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                self._note_deleted(name)
+            else:
+                self._note_touched(name)
+        return False
+
+    # === 폴링 방식 ===
+
+    def _snapshot(self):
+        """디렉토리 스냅샷 {파일명: (크기, 수정시각)}"""
+        snapshot = {}
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat_result = entry.stat()
+                        snapshot[entry.name] = (stat_result.st_size, stat_result.st_mtime)
+                except OSError:
+                    continue
+        return snapshot
+
+    def _run_polling(self):
+        try:
+            last_mtime_ns = os.stat(self.path).st_mtime_ns
+            previous = self._snapshot()
+        except OSError as e:
+            logger.error(f"폴더 감시 시작 실패: {self.path}, 에러: {e}")
+            return
+
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                # 디렉토리 수정시각이 그대로면 stat 1회로 끝
+                mtime_ns = os.stat(self.path).st_mtime_ns
+                if mtime_ns == last_mtime_ns:
+                    continue
+                last_mtime_ns = mtime_ns
+                current = self._snapshot()
+            except OSError as e:
+                logger.error(f"폴더 감시 오류: {self.path}, 에러: {e}")
+                continue
+
+            for name, info in current.items():
+                if previous.get(name) != info:
+                    self._touched.add(name)
+            self._deleted.update(name for name in previous if name not in current)
+            previous = current
+
+            if self._touched or self._deleted:
+                self._mark_event()
+                self._flush()
@@ -0,0 +1,146 @@
+"""
+파일명 파서 모듈
+
+녹화 파일명(사이트-채널-날짜 / 채널-사이트-날짜 등)을 한 번에 파싱하는 공용 파서.
+정규식은 모듈 로드 시 한 번만 컴파일하고, 결과는 불변 레코드로 캐시해서
+CapacityFinder, 각 다이얼로그가 같은 파일명을 반복 파싱하지 않도록 한다.
+
+예: chaturbate-john_doe-2025-06-26T15_09_46+09_00.mp4
+    -> ParsedName(site='chaturbate', channel='john_doe',
+                  date_time=datetime(2025, 6, 26, 15, 9, 46, tzinfo=+09:00),
+                  day='2025-06-26', date_part='2025-06-26T15_09_46+09_00')
+"""
+
+import re
+import sys
+import logging
+from datetime import datetime
+from enum import Enum
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SiteType(Enum):
+    """지원하는 성인 플랫폼 목록"""
+    CHATURBATE = "chaturbate"
+    STRIPCHAT = "stripchat"
+    CAMSODA = "camsoda"
+    MYFREECAMS = "myfreecams"
+    CAM4 = "cam4"
+    BONGACAMS = "bongacams"
+    LIVEJASMIN = "livejasmin"
+    FLIRT4FREE = "flirt4free"
+    XHAMSTERLIVE = "xhamsterlive"
+    STREAMATE = "streamate"
+    CAMGIRLS = "camgirls"
+    IMLIVE = "imlive"
+    CAMS = "cams"
+    JERKMATE = "jerkmate"
+    AMATEUR = "amateur"
+
+    @classmethod
+    def get_all_sites(cls):
+        """모든 사이트명을 리스트로 반환"""
+        return [site.value for site in cls]
+
+    @classmethod
+    def is_valid_site(cls, site_name):
+        """주어진 문자열이 유효한 사이트명인지 확인"""
+        return site_name.lower() in _VALID_SITES
+
+
+_VALID_SITES = frozenset(SiteType.get_all_sites())
+
+# 날짜 패턴 (2025-06-26T15_09_46+09_00 형식)
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}_\d{2}_\d{2}[+-]\d{2}_\d{2}')
+
+# 확장자 앞부분에서 첫 번째 날짜까지 한 번에 매칭 (접두부는 최소 매칭)
+_NAME_PATTERN = re.compile(
+    r'^(?P<prefix>[^.]*?)(?P<date>\d{4}-\d{2}-\d{2}T\d{2}_\d{2}_\d{2}[+-]\d{2}_\d{2})'
+)
+
+# '-' 로 구분된 조각 중 사이트명과 정확히 일치하는 첫 조각 (긴 이름 우선)
+_SITE_PATTERN = re.compile(
+    r'(?:^|-)(?P<site>' + '|'.join(sorted(_VALID_SITES, key=len, reverse=True)) + r')(?=-|$)',
+    re.IGNORECASE | re.ASCII
+)
+
+
+class ParsedName(NamedTuple):
+    """파일명 파싱 결과 (불변)
+
+    site/channel 은 파일명 구조가 맞지 않으면 None,
+    date_time 은 날짜 문자열이 실제 날짜로 변환되지 않으면 None
+    """
+    site: Optional[str]
+    channel: Optional[str]
+    date_time: Optional[datetime]
+    day: str
+    date_part: str
+
+
+def parse_date_part(date_part):
+    """날짜 문자열을 시간대 포함 datetime 으로 변환 (잘못된 날짜면 None)"""
+    try:
+        # 2025-06-26T15_09_46+09_00 -> datetime 변환
+        return datetime.fromisoformat(date_part.replace('_', ':'))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1 << 18)
+def parse_filename(file_name):
+    """파일명을 파싱해서 ParsedName 반환 (날짜 패턴이 없으면 None)"""
+    if not file_name:
+        return None
+
+    match = _NAME_PATTERN.match(file_name)
+    if match:
+        date_part = match.group('date')
+    else:
+        # 확장자 뒤쪽에만 날짜가 있는 경우 - 날짜만 추출 (사이트/채널 없음)
+        date_match = DATE_PATTERN.search(file_name)
+        if not date_match:
+            return None
+        date_part = date_match.group()
+    day = date_part.split('T')[0]
+
+    date_time = parse_date_part(date_part)
+    if date_time is None:
+        logger.error(f"날짜 추출 오류: {file_name}, 잘못된 날짜: {date_part}")
+
+    site = None
+    channel = None
+
+    # 날짜 이전 부분을 '-' 로 나눴을 때 두 조각 이상이어야 사이트/채널 구분 가능
+    before_date = match.group('prefix').rstrip('-') if match else ''
+    if '-' in before_date:
+        site_match = _SITE_PATTERN.search(before_date)
+        if site_match:
+            site = sys.intern(site_match.group('site'))
+            # 사이트 조각을 뺀 나머지 조각들을 '-' 로 다시 결합
+            head = before_date[:site_match.start()]
+            tail = before_date[site_match.end():]
+            if not site_match.group(0).startswith('-'):
+                tail = tail[1:]  # 맨 앞 조각이 사이트인 경우 뒤쪽 구분자 제거
+            channel = sys.intern(head + tail)
+
+    return ParsedName(site, channel, date_time, sys.intern(day), date_part)
+
+
+def to_name_fields(parsed):
+    """ParsedName → (채널명, 사이트, 날짜 문자열) (사이트/채널이 없으면 None)"""
+    if parsed is None or not parsed.site or not parsed.channel:
+        return None
+    return parsed.channel, parsed.site, parsed.date_part
+
+
+def parse_names_chunk(names):
+    """프로세스 풀 작업 단위: 파일명 목록 → [(채널명, 사이트, 날짜 문자열) 또는 None, ...]
+
+    워커 프로세스에서 한 번씩만 보는 이름들이라 캐시를 거치지 않고 파싱
+    """
+    parse = parse_filename.__wrapped__
+    return [to_name_fields(parse(name)) for name in names]
@@ -2,8 +2,9 @@ import sys
 import os
 import subprocess
 import logging
+from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QTreeWidget, QTreeWidgetItem, QLineEdit, 
+                             QHBoxLayout, QTreeView, QLineEdit, 
                              QPushButton, QLabel, QMessageBox, QComboBox, QSplitter,
                              QDialog, QMenu, QAction)
 from path_dialog import PathSelectionDialog
@@ -14,15 +15,23 @@ from visual_selection_dialog import VisualSelectionDialog
 from video_timeline_dialog import VideoTimelineDialog
 from rating_dialog import RatingDialog
 from intelligent_cleanup_dialog import IntelligentCleanupDialog
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor
+from quarantine_dialog import QuarantineDialog
+from background_workers import ScanWorkerThread, run_deletion_with_progress
+from capacity_tree_model import CapacityTreeModel, CapacitySortProxyModel
+from PyQt5.QtCore import Qt, pyqtSignal
 import json
 
 # 로거 설정 (순환 임포트 방지)
 import logging
 logger = logging.getLogger(__name__)
 
+# 메뉴 선택(휴지통 모드 등)을 재시작 후에도 유지하기 위한 설정 파일
+APP_SETTINGS_FILE = "app_settings.json"
+
 class MainWindow(QMainWindow):
+    # 폴더 감시 스레드 → 메인 스레드로 변경분 전달
+    files_changed = pyqtSignal(object)
+
     def __init__(self, on_path_confirmed=None, path_history=None):
         super().__init__()
         logger.info("MainWindow 초기화 시작")
@@ -30,10 +39,15 @@ class MainWindow(QMainWindow):
         self.path_history = path_history  # 경로 기록 관리자
         self.current_path = None  # 현재 경로 저장을 위해 추가
         self.capacity_finder = None  # CapacityFinder 인스턴스 참조 저장
-        # 정렬을 위한 사용자 데이터 저장
-        self.users_data = {}  # {username: {user_data: dict, formatted_size: str}}
         self.current_sort_column = 1  # 기본값: 크기로 정렬 (0: 이름, 1: 크기, 2: 파일 수)
         self.current_sort_order = Qt.DescendingOrder  # 기본값: 내림차순
+        self.displayed_files = None  # 트리에 표시 중인 dic_files (같은 객체면 바뀐 사용자 행만 갱신)
+        
+        # 백그라운드 스캔 상태
+        self.scan_worker = None
+        self._scan_callbacks = (None, None)  # (on_finished, on_cancelled)
+        self._scan_preview = {}  # {username: [total_size, file_count]} 스캔 중 임시 집계
+        self._pending_file_changes = []  # 스캔 중에 들어온 감시기 변경분 (스캔 완료 후 반영)
         
         # 전체 통계 정보 저장
         self.total_size_formatted = ""
@@ -47,34 +61,53 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(main_widget)
         layout = QVBoxLayout(main_widget)
 
-        # 트리 위젯 (4/5 크기)
-        self.tree_widget = QTreeWidget()
-        self.tree_widget.setHeaderLabels(["사용자/파일", "크기", "파일 수"])
-        self.tree_widget.setColumnWidth(0, 400)
-        self.tree_widget.setColumnWidth(1, 150)
-        self.tree_widget.setColumnWidth(2, 100)
-        
-        # 정렬 기능 활성화
-        self.tree_widget.setSortingEnabled(False)  # 기본 정렬은 비활성화하고 커스텀 정렬 사용
+        # 트리 뷰 (4/5 크기) - dic_files 모델 위에서 정렬 프록시로 표시, 파일 행은 펼칠 때 생성
+        self.tree_model = CapacityTreeModel(self.format_file_size, self)
+        self.tree_proxy = CapacitySortProxyModel(self)
+        self.tree_proxy.setSourceModel(self.tree_model)
+        
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.tree_proxy)
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setColumnWidth(0, 400)
+        self.tree_view.setColumnWidth(1, 150)
+        self.tree_view.setColumnWidth(2, 100)
+        
+        # 정렬은 헤더 클릭 시 프록시에서 (새 컬럼은 내림차순부터)
+        self.tree_view.setSortingEnabled(False)
+        self.tree_proxy.sort(self.current_sort_column, self.current_sort_order)
         
         # 헤더 클릭 이벤트 연결
-        header = self.tree_widget.header()
+        header = self.tree_view.header()
         header.sectionClicked.connect(self.on_header_clicked)
         header.setSectionsClickable(True)
         
         # 더블클릭 이벤트 연결
-        self.tree_widget.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.tree_view.doubleClicked.connect(self.on_item_double_clicked)
         
         # 우클릭 컨텍스트 메뉴 설정
-        self.tree_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.tree_widget.customContextMenuRequested.connect(self.show_context_menu)
+        self.tree_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tree_view.customContextMenuRequested.connect(self.show_context_menu)
         
-        layout.addWidget(self.tree_widget, 4)
+        layout.addWidget(self.tree_view, 4)
 
         # 현재 경로 표시 라벨
         self.path_label = QLabel("현재 경로: 설정되지 않음")
         self.path_label.setStyleSheet("QLabel { padding: 10px; background-color: #2c3e50; color: #ffffff; border: 2px solid #34495e; border-radius: 5px; font-weight: bold; }")
         layout.addWidget(self.path_label)
+        
+        # 스캔 진행 표시 (백그라운드 스캔 중에만 보임)
+        self.scan_status_widget = QWidget()
+        scan_status_layout = QHBoxLayout(self.scan_status_widget)
+        scan_status_layout.setContentsMargins(10, 0, 10, 0)
+        self.scan_status_label = QLabel("")
+        self.scan_status_label.setStyleSheet("QLabel { color: #2c3e50; font-weight: bold; }")
+        self.cancel_scan_button = QPushButton("⏹️ 스캔 취소")
+        self.cancel_scan_button.clicked.connect(self.cancel_background_scan)
+        scan_status_layout.addWidget(self.scan_status_label, 1)
+        scan_status_layout.addWidget(self.cancel_scan_button)
+        self.scan_status_widget.hide()
+        layout.addWidget(self.scan_status_widget)
 
         # 경로 선택 버튼 레이아웃
         path_button_layout = QHBoxLayout()
@@ -184,9 +217,30 @@ class MainWindow(QMainWindow):
         intelligent_cleanup_action.triggered.connect(self.open_intelligent_cleanup_dialog)
         self.analysis_menu.addAction(intelligent_cleanup_action)
         
+        self.analysis_menu.addSeparator()
+        
+        # 실시간 폴더 감시 (새 녹화 파일 자동 반영)
+        self.live_watch_action = QAction("👁️ 폴더 실시간 감시", self)
+        self.live_watch_action.setCheckable(True)
+        self.live_watch_action.toggled.connect(self.toggle_live_watch)
+        self.analysis_menu.addAction(self.live_watch_action)
+        
+        # 휴지통 모드 (삭제 대신 같은 볼륨의 휴지통으로 이동, 되돌리기 가능)
+        self.quarantine_action = QAction("♻️ 삭제 대신 휴지통으로 이동", self)
+        self.quarantine_action.setCheckable(True)
+        self.quarantine_action.setChecked(self.load_app_settings().get('use_quarantine', False))
+        self.quarantine_action.toggled.connect(self.toggle_quarantine_mode)
+        self.analysis_menu.addAction(self.quarantine_action)
+        
+        quarantine_manage_action = QAction("♻️ 휴지통 관리 (되돌리기)", self)
+        quarantine_manage_action.triggered.connect(self.open_quarantine_dialog)
+        self.analysis_menu.addAction(quarantine_manage_action)
+        
         # 버튼에 메뉴 연결
         self.analysis_tools_button.setMenu(self.analysis_menu)
         
+        self.files_changed.connect(self.on_files_changed)
+        
         path_button_layout.addWidget(self.select_path_button, 3)
         path_button_layout.addWidget(self.quick_rescan_button, 1)
         path_button_layout.addWidget(self.analysis_tools_button, 2)
@@ -232,6 +286,8 @@ class MainWindow(QMainWindow):
     def set_capacity_finder(self, capacity_finder):
         """CapacityFinder 인스턴스 설정"""
         self.capacity_finder = capacity_finder
+        if capacity_finder:
+            capacity_finder.use_quarantine = self.quarantine_action.isChecked()
         # 데이터가 있을 때만 분석도구 버튼 활성화
         if capacity_finder and capacity_finder.dic_files:
             self.analysis_tools_button.setEnabled(True)
@@ -325,6 +381,25 @@ class MainWindow(QMainWindow):
         dialog = IntelligentCleanupDialog(self.capacity_finder, self)
         dialog.exec_()  # 모달 창으로 실행, 결과 처리는 다이얼로그 내부에서
 
+    def open_quarantine_dialog(self):
+        """휴지통 관리 다이얼로그 열기"""
+        if not self.capacity_finder or not self.capacity_finder.get_quarantine():
+            QMessageBox.warning(self, "데이터 없음", "먼저 경로를 선택하고 파일을 분석해주세요.")
+            return
+        
+        dialog = QuarantineDialog(self.capacity_finder, self)
+        dialog.files_restored.connect(self.apply_user_changes)
+        dialog.exec_()
+
+    def toggle_quarantine_mode(self, checked):
+        """휴지통 모드 켜기/끄기"""
+        if self.capacity_finder:
+            self.capacity_finder.use_quarantine = checked
+        settings = self.load_app_settings()
+        settings['use_quarantine'] = checked
+        self.save_app_settings(settings)
+        logger.info(f"♻️ 휴지통 모드 {'켜짐' if checked else '꺼짐 (바로 삭제)'}")
+
     def process_site_comparison_result(self, result):
         """사이트 비교 결과 처리"""
         if not result.get('files_to_delete'):
@@ -355,39 +430,15 @@ class MainWindow(QMainWindow):
 
     def execute_site_comparison_deletions(self, files_to_delete, total_savings, username):
         """사이트 비교 결과에 따른 파일 삭제 실행"""
-        if not self.current_path:
-            QMessageBox.warning(self, "오류", "현재 경로가 설정되지 않았습니다.")
+        result = self._delete_files_with_progress(files_to_delete, "사이트 비교 정리")
+        if result is None:
             return
         
-        deleted_count = 0
-        failed_count = 0
-        
-        for file_info in files_to_delete:
-            file_path = os.path.join(self.current_path, file_info['name'])
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.info(f"삭제됨: {file_info['name']}")
-                else:
-                    failed_count += 1
-                    logger.warning(f"파일 없음: {file_info['name']}")
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"삭제 실패: {file_info['name']}, 오류: {e}")
-        
         # 결과 메시지
         result_msg = f"사용자 '{username}' 파일 정리 완료!\n\n"
-        result_msg += f"삭제된 파일: {deleted_count}개\n"
-        if failed_count > 0:
-            result_msg += f"삭제 실패: {failed_count}개\n"
-        result_msg += f"절약된 용량: {self.format_file_size(total_savings)}"
+        result_msg += self._format_deletion_result(result)
         
         QMessageBox.information(self, "삭제 완료", result_msg)
-        
-        # 현재 경로 재탐색
-        if self.on_path_confirmed:
-            self.on_path_confirmed(self.current_path)
 
     def process_visual_selection_result(self, result):
         """비주얼 선별 결과 처리"""
@@ -421,43 +472,63 @@ class MainWindow(QMainWindow):
 
     def execute_visual_selection_deletions(self, files_to_delete, total_savings, username):
         """비주얼 선별 결과에 따른 파일 삭제 실행"""
-        if not self.current_path:
-            QMessageBox.warning(self, "오류", "현재 경로가 설정되지 않았습니다.")
+        result = self._delete_files_with_progress(files_to_delete, "비주얼 선별 정리")
+        if result is None:
             return
         
-        deleted_count = 0
-        failed_count = 0
-        
-        for file_info in files_to_delete:
-            file_path = os.path.join(self.current_path, file_info['name'])
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.info(f"삭제됨: {file_info['name']}")
-                else:
-                    failed_count += 1
-                    logger.warning(f"파일 없음: {file_info['name']}")
-            except Exception as e:
-                failed_count += 1
-                logger.error(f"삭제 실패: {file_info['name']}, 오류: {e}")
-        
         # 결과 메시지
         result_msg = f"사용자 '{username}' 비주얼 선별 완료!\n\n"
-        result_msg += f"삭제된 파일: {deleted_count}개\n"
-        if failed_count > 0:
-            result_msg += f"삭제 실패: {failed_count}개\n"
-        result_msg += f"절약된 용량: {self.format_file_size(total_savings)}"
+        result_msg += self._format_deletion_result(result)
         
         QMessageBox.information(self, "비주얼 선별 완료", result_msg)
-        
-        # 현재 경로 재탐색
-        if self.on_path_confirmed:
-            self.on_path_confirmed(self.current_path)
-
 
+    def _delete_files_with_progress(self, files, title):
+        """현재 경로의 파일들을 삭제 엔진으로 삭제하고 메모리 데이터/트리 동기화 (진행 대화상자 표시)
+        
+        트리는 파일이 지워진 사용자 행만 갱신한다 (재탐색 없음).
+        
+        Returns:
+            dict: DeletionEngine.run 결과 (삭제할 수 없으면 None)
+        """
+        if not self.current_path or not self.capacity_finder:
+            QMessageBox.warning(self, "오류", "현재 경로가 설정되지 않았습니다.")
+            return None
+        
+        mtime_before = self.capacity_finder.directory_mtime_before_change()
+        try:
+            result = run_deletion_with_progress(
+                self, self.capacity_finder.deletion_engine, self.current_path, files, title,
+                quarantine=self.capacity_finder.deletion_quarantine()
+            )
+        except Exception as e:
+            logger.error(f"파일 삭제 실행 오류: {e}")
+            QMessageBox.critical(self, "삭제 오류", f"파일 삭제 중 오류가 발생했습니다:\n{str(e)}")
+            return None
+        
+        changed_users = self.capacity_finder.apply_deletion_result(result, mtime_before)
+        if changed_users:
+            self.apply_user_changes(changed_users)
+        return result
 
+    def _format_deletion_result(self, result):
+        """삭제 결과 요약 문구"""
+        failed_count = len(result['missing_files']) + len(result['failed_files'])
+        result_msg = f"삭제된 파일: {result['deleted_count']}개\n"
+        if failed_count > 0:
+            result_msg += f"삭제 실패: {failed_count}개\n"
+        if result['cancelled']:
+            result_msg += "⏹️ 삭제가 중간에 취소되었습니다.\n"
+        result_msg += self._format_deletion_size(result)
+        if result.get('quarantined'):
+            result_msg += "\n\n♻️ 휴지통 관리에서 되돌리거나 바로 비울 수 있습니다."
+        return result_msg
 
+    def _format_deletion_size(self, result):
+        """삭제 결과 용량 문구 (휴지통으로 옮긴 용량은 아직 확보된 공간이 아님)"""
+        size_text = self.format_file_size(result['deleted_size'])
+        if result.get('quarantined'):
+            return f"휴지통으로 이동한 용량 (아직 확보되지 않음): {size_text}"
+        return f"절약된 용량: {size_text}"
 
     def process_deletion_decisions(self, decisions, total_savings):
         """삭제 결정 처리"""
@@ -476,7 +547,7 @@ class MainWindow(QMainWindow):
 삭제할 모델: {len(delete_models)}개
 절약될 용량: {self.format_file_size(total_savings)}
 
-⚠️ 이 작업은 되돌릴 수 없습니다!
+{self.capacity_finder.deletion_warning_text()}
 
 삭제할 모델들:
 {chr(10).join(delete_models)}
@@ -493,59 +564,62 @@ class MainWindow(QMainWindow):
         if not self.current_path or not self.capacity_finder:
             return
         
-        deleted_count = 0
-        error_count = 0
+        files_to_delete = []
+        for username in delete_models:
+            if username in self.capacity_finder.dic_files:
+                files_to_delete.extend(self.capacity_finder.dic_files[username]['files'])
         
-        try:
-            for username in delete_models:
-                if username in self.capacity_finder.dic_files:
-                    user_files = self.capacity_finder.dic_files[username]['files']
-                    
-                    for file_info in user_files:
-                        file_path = os.path.join(self.current_path, file_info['name'])
-                        try:
-                            if os.path.exists(file_path):
-                                os.remove(file_path)
-                                deleted_count += 1
-                                print(f"삭제됨: {file_path}")
-                            else:
-                                print(f"파일 없음: {file_path}")
-                        except Exception as e:
-                            error_count += 1
-                            print(f"삭제 오류: {file_path}, 에러: {e}")
-            
-            # 결과 메시지
-            result_msg = f"""
-🗑️ 파일 삭제 완료!
-
-삭제된 파일: {deleted_count}개
-오류 발생: {error_count}개
-절약된 용량: {self.format_file_size(total_savings)}
+        result = self._delete_files_with_progress(files_to_delete, "모델 삭제")
+        if result is None:
+            return
+        
+        # 결과 메시지 (삭제된 파일은 이미 메모리/트리에서 제거됨 - 재스캔 불필요)
+        QMessageBox.information(self, "삭제 완료", f"🗑️ 파일 삭제 완료!\n\n{self._format_deletion_result(result)}")
 
-경로를 다시 스캔하시겠습니까?
-            """
+    def resume_interrupted_deletions(self, deletion_engine):
+        """이전 실행에서 중단된 삭제 배치가 있으면 이어서 삭제할지 확인 (시작 시 호출)"""
+        for batch in deletion_engine.pending_batches():
+            files = batch['files']
+            if not files:
+                deletion_engine.journal.end(batch['batch'])
+                continue
             
-            msg = QMessageBox()
-            msg.setWindowTitle("삭제 완료")
-            msg.setText(result_msg)
-            msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-            msg.setDefaultButton(QMessageBox.Yes)
+            started = datetime.fromtimestamp(batch['time']).strftime('%Y-%m-%d %H:%M') if batch.get('time') else "알 수 없음"
+            total_size = sum(file_info['size'] for file_info in files)
+            msg = "이전 실행에서 파일 삭제가 중간에 중단되었습니다.\n\n"
+            msg += f"경로: {batch['dir']}\n"
+            msg += f"시작 시각: {started}\n"
+            msg += f"남은 파일: {len(files)}개 ({self.format_file_size(total_size)})\n\n"
+            msg += "남은 파일을 이어서 삭제하시겠습니까?\n(아니오를 누르면 남은 파일은 삭제하지 않습니다)"
             
-            if msg.exec_() == QMessageBox.Yes:
-                # 재스캔 실행
-                self.quick_rescan()
-                
-        except Exception as e:
-            QMessageBox.critical(self, "삭제 오류", f"파일 삭제 중 오류가 발생했습니다:\n{str(e)}")
+            reply = QMessageBox.question(
+                self, "중단된 삭제 이어서 실행", msg,
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                deletion_engine.journal.abandon(batch['batch'])
+                continue
+            
+            try:
+                result = run_deletion_with_progress(
+                    self, deletion_engine, batch['dir'], files, "중단된 삭제 이어서 실행",
+                    batch_id=batch['batch'], quarantine=deletion_engine.batch_quarantine(batch)
+                )
+            except Exception as e:
+                logger.error(f"중단된 삭제 실행 오류: {e}")
+                QMessageBox.critical(self, "삭제 오류", f"파일 삭제 중 오류가 발생했습니다:\n{str(e)}")
+                continue
+            
+            QMessageBox.information(self, "삭제 완료", self._format_deletion_result(result))
 
-    def on_item_double_clicked(self, item, column):
+    def on_item_double_clicked(self, index):
         """트리 아이템 더블클릭 시 호출되는 함수"""
-        # 사용자 아이템(부모)인지 파일 아이템(자식)인지 확인
-        parent = item.parent()
+        # 사용자 행(부모)인지 파일 행(자식)인지 확인
+        source_index = self.tree_proxy.mapToSource(index)
+        file_name = self.tree_model.file_name(source_index)
         
-        if parent is not None:  # 파일 아이템인 경우 (부모가 있음)
-            file_name = item.text(0)  # 파일명 가져오기
-            
+        if source_index.parent().isValid():  # 파일 행인 경우 (부모가 있음)
             if self.current_path and file_name:
                 file_path = os.path.join(self.current_path, file_name)
                 
@@ -581,47 +655,44 @@ class MainWindow(QMainWindow):
             else:
                 print("경로가 설정되지 않았거나 파일명이 없습니다.")
         else:
-            # 사용자 아이템인 경우 - 레이팅 다이얼로그 열기
-            username = item.text(0)
-            if username and not username.startswith("==="):  # 헤더가 아닌 실제 사용자명인 경우
-                # 레이팅 표시가 포함된 경우 깨끗한 사용자명만 추출
-                clean_username = username.split(" ⭐")[0]
-                self.open_rating_dialog(clean_username)
+            # 사용자 행인 경우 - 레이팅 다이얼로그 열기 (헤더 행 제외)
+            username = self.tree_model.username(source_index)
+            if username:
+                self.open_rating_dialog(username)
 
     def show_context_menu(self, position):
         """우클릭 컨텍스트 메뉴 표시"""
-        item = self.tree_widget.itemAt(position)
-        if not item:
+        index = self.tree_view.indexAt(position)
+        if not index.isValid():
             return
+        index = index.sibling(index.row(), 0)
             
         menu = QMenu()
         
-        # 부모가 있으면 파일 아이템, 없으면 사용자 아이템
-        parent = item.parent()
+        # 부모가 있으면 파일 행, 없으면 사용자 행
+        source_index = self.tree_proxy.mapToSource(index)
         
-        if parent is None:  # 사용자 아이템
-            username = item.text(0)
-            if username and not username.startswith("==="):  # 헤더가 아닌 실제 사용자
-                clean_username = username.split(" ⭐")[0]
-                
+        if not source_index.parent().isValid():  # 사용자 행
+            username = self.tree_model.username(source_index)
+            if username:  # 헤더가 아닌 실제 사용자
                 # 레이팅 관련 메뉴
                 rating_action = QAction("🌟 레이팅 작성/수정", self)
-                rating_action.triggered.connect(lambda: self.open_rating_dialog(clean_username))
+                rating_action.triggered.connect(lambda: self.open_rating_dialog(username))
                 menu.addAction(rating_action)
                 
                 menu.addSeparator()
                 
                 # 폴더 확장/축소 메뉴
-                if item.isExpanded():
+                if self.tree_view.isExpanded(index):
                     expand_action = QAction("📁 폴더 축소", self)
-                    expand_action.triggered.connect(lambda: item.setExpanded(False))
+                    expand_action.triggered.connect(lambda: self.tree_view.setExpanded(index, False))
                 else:
                     expand_action = QAction("📂 폴더 확장", self)
-                    expand_action.triggered.connect(lambda: item.setExpanded(True))
+                    expand_action.triggered.connect(lambda: self.tree_view.setExpanded(index, True))
                 menu.addAction(expand_action)
                 
-        else:  # 파일 아이템
-            file_name = item.text(0)
+        else:  # 파일 행
+            file_name = self.tree_model.file_name(source_index)
             
             # 파일 열기 메뉴
             open_action = QAction("🗂️ 파일 열기", self)
@@ -630,7 +701,7 @@ class MainWindow(QMainWindow):
         
         # 메뉴 표시
         if not menu.isEmpty():
-            menu.exec_(self.tree_widget.mapToGlobal(position))
+            menu.exec_(self.tree_view.viewport().mapToGlobal(position))
 
     def open_file_from_menu(self, file_name):
         """컨텍스트 메뉴에서 파일 열기"""
@@ -680,40 +751,33 @@ class MainWindow(QMainWindow):
                 print(f"레이팅 로드 오류: {e}")
         return ratings
 
+    def load_app_settings(self):
+        """앱 설정 로드 (휴지통 모드 등 메뉴 선택 유지용)"""
+        if os.path.exists(APP_SETTINGS_FILE):
+            try:
+                with open(APP_SETTINGS_FILE, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                logger.error(f"설정 로드 오류: {e}")
+        return {}
+
+    def save_app_settings(self, settings):
+        """앱 설정 저장"""
+        try:
+            with open(APP_SETTINGS_FILE, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            logger.error(f"설정 저장 오류: {e}")
+
     def update_user_ratings_display(self):
-        """트리 위젯의 사용자 레이팅 표시 업데이트"""
-        ratings = self.load_user_ratings()
-        
-        # 트리 위젯의 모든 최상위 아이템을 순회
-        for i in range(self.tree_widget.topLevelItemCount()):
-            item = self.tree_widget.topLevelItem(i)
-            username = item.text(0)
-            
-            # 헤더가 아닌 실제 사용자 아이템인 경우
-            if username and not username.startswith("==="):
-                if username in ratings:
-                    rating_info = ratings[username]
-                    rating_value = rating_info.get('rating', 0)
-                    # 사용자명에 레이팅 표시 추가
-                    stars = "⭐" * rating_value
-                    item.setText(0, f"{username} {stars} ({rating_value}/5)")
-                else:
-                    # 레이팅이 없는 경우 기본 사용자명만 표시
-                    clean_username = username.split(" ⭐")[0]  # 기존 레이팅 제거
-                    item.setText(0, clean_username)
+        """트리의 사용자 레이팅 표시 업데이트"""
+        self.tree_model.set_ratings(self.load_user_ratings())
 
     def add_result_to_list(self, result_text):
         """메인에서 호출해서 리스트에 결과를 추가하는 함수 (기존 호환성 유지)"""
-        # 트리 위젯에 헤더 추가
+        # 트리에 헤더 모양의 안내 행 추가
         if result_text.startswith("==="):
-            header_item = QTreeWidgetItem(self.tree_widget)
-            header_item.setText(0, result_text)
-            header_item.setBackground(0, QColor(211, 211, 211))  # lightGray
-            # 폰트 굵게 설정
-            font = header_item.font(0)
-            font.setBold(True)
-            header_item.setFont(0, font)
-            self.tree_widget.addTopLevelItem(header_item)
+            self.tree_model.add_message(result_text)
         else:
             # 일반 결과는 사용자 정보로 처리
             pass
@@ -723,93 +787,16 @@ class MainWindow(QMainWindow):
         # 전체 통계 정보 저장
         self.total_size_formatted = total_size
         self.total_files_count = total_count
-        
-        header_item = QTreeWidgetItem(self.tree_widget)
-        header_item.setText(0, f"=== {title} ===")
-        header_item.setText(1, f"전체: {total_size}")
-        header_item.setText(2, f"{total_count}개 파일")
-        
-        # 헤더 스타일 설정
-        light_gray = QColor(211, 211, 211)
-        header_item.setBackground(0, light_gray)
-        header_item.setBackground(1, light_gray)
-        header_item.setBackground(2, light_gray)
-        
-        # 폰트 굵게 설정
-        for col in range(3):
-            font = header_item.font(col)
-            font.setBold(True)
-            header_item.setFont(col, font)
-        
-        self.tree_widget.addTopLevelItem(header_item)
-
-    def add_user_data(self, username, user_data, formatted_size):
-        """사용자 데이터를 트리에 추가하는 함수"""
-        # 사용자 데이터 저장 (정렬을 위해)
-        size_mb = user_data['total_size']  # MB 단위 숫자값
-        self.users_data[username] = {
-            'user_data': {
-                'name': username,
-                'size': size_mb,
-                'files': user_data['files']
-            },
-            'formatted_size': formatted_size
-        }
-        
-        # 사용자 아이템 생성
-        user_item = QTreeWidgetItem(self.tree_widget)
-        
-        # 레이팅 정보 로드하여 사용자명에 표시
-        ratings = self.load_user_ratings()
-        display_name = username
-        if username in ratings:
-            rating_info = ratings[username]
-            rating_value = rating_info.get('rating', 0)
-            stars = "⭐" * rating_value
-            display_name = f"{username} {stars} ({rating_value}/5)"
-        
-        user_item.setText(0, display_name)
-        user_item.setText(1, formatted_size)
-        user_item.setText(2, str(len(user_data['files'])))
-        
-        # 레이팅이 있는 경우 툴팁에 코멘트 추가
-        if username in ratings:
-            rating_info = ratings[username]
-            comment = rating_info.get('comment', '')
-            last_rating = rating_info.get('last_rating', '')
-            if comment or last_rating:
-                tooltip_text = f"레이팅: {rating_info.get('rating', 0)}/5"
-                if comment:
-                    tooltip_text += f"\n코멘트: {comment}"
-                if last_rating:
-                    tooltip_text += f"\n작성일: {last_rating}"
-                user_item.setToolTip(0, tooltip_text)
-        
-        # 사용자 아이템 스타일 설정
-        light_blue = QColor(173, 216, 230)  # lightBlue
-        user_item.setBackground(0, light_blue)
-        user_item.setBackground(1, light_blue)
-        user_item.setBackground(2, light_blue)
-        
-        # 파일 목록을 크기순(내림차순)으로 정렬 - 첫 로딩시 기본 정렬
-        sorted_files = sorted(user_data['files'], key=lambda x: x['size'], reverse=True)
-        
-        # 파일 목록을 하위 아이템으로 추가 (GB/MB 단위로 표시)
-        for file_info in sorted_files:
-            file_item = QTreeWidgetItem(user_item)
-            file_item.setText(0, file_info['name'])
-            file_item.setText(1, self.format_file_size(file_info['size']))  # GB/MB 단위로 표시
-            file_item.setText(2, "")
-        
-        # 기본적으로 접혀있도록 설정
-        user_item.setExpanded(False)
-        
-        self.tree_widget.addTopLevelItem(user_item)
+        self.tree_model.set_header(f"=== {title} ===", f"전체: {total_size}", f"{total_count}개 파일")
+
+    def add_user_data(self, username, user_data, formatted_size=None):
+        """사용자 행을 트리에 추가하는 함수 (파일 행은 펼칠 때 생성)"""
+        self.tree_model.upsert_user(username, user_data)
 
     def clear_results(self):
-        """트리 위젯의 모든 결과를 지우는 함수"""
-        self.tree_widget.clear()
-        self.users_data = {}  # 저장된 사용자 데이터도 초기화
+        """트리의 모든 결과를 지우는 함수"""
+        self.tree_model.clear()
+        self.displayed_files = None
         self.total_size_formatted = ""  # 전체 통계 정보도 초기화
         self.total_files_count = 0
 
@@ -823,103 +810,17 @@ class MainWindow(QMainWindow):
             self.current_sort_order = Qt.DescendingOrder  # 새 컬럼은 항상 내림차순부터
         
         # 정렬 표시기 설정
-        self.tree_widget.header().setSortIndicator(self.current_sort_column, self.current_sort_order)
+        self.tree_view.header().setSortIndicator(self.current_sort_column, self.current_sort_order)
         
         # 데이터 정렬 및 표시
         self.sort_users_data()
 
     def sort_users_data(self):
-        """사용자 데이터를 정렬하는 함수"""
-        if not self.users_data:
-            return
-            
-        # 정렬 키에 따라 데이터 정렬
-        sorted_items = sorted(self.users_data.items(), 
-                            key=lambda x: self.get_sort_key(x[0], x[1]), 
-                            reverse=(self.current_sort_order == Qt.DescendingOrder))
-        
-        # 트리 위젯 초기화
-        self.tree_widget.clear()
-        
-        # 헤더 다시 추가 (저장된 전체 통계 정보 사용)
-        if self.total_size_formatted and self.total_files_count:
-            self.add_header_with_totals("사용자별 파일 용량 (용량 큰 순)", self.total_size_formatted, self.total_files_count)
-        
-        # 정렬된 데이터로 다시 표시 (중복 저장 방지를 위해 직접 아이템 생성)
-        for username, data in sorted_items:
-            user_data = data['user_data']
-            formatted_size = data['formatted_size']
-            
-            # 사용자 아이템 생성
-            user_item = QTreeWidgetItem(self.tree_widget)
-            
-            # 레이팅 정보 로드하여 사용자명에 표시
-            ratings = self.load_user_ratings()
-            display_name = username
-            if username in ratings:
-                rating_info = ratings[username]
-                rating_value = rating_info.get('rating', 0)
-                stars = "⭐" * rating_value
-                display_name = f"{username} {stars} ({rating_value}/5)"
-                
-            user_item.setText(0, display_name)
-            user_item.setText(1, formatted_size)
-            user_item.setText(2, str(len(user_data['files'])))
-            
-            # 레이팅이 있는 경우 툴팁에 코멘트 추가
-            if username in ratings:
-                rating_info = ratings[username]
-                comment = rating_info.get('comment', '')
-                last_rating = rating_info.get('last_rating', '')
-                if comment or last_rating:
-                    tooltip_text = f"레이팅: {rating_info.get('rating', 0)}/5"
-                    if comment:
-                        tooltip_text += f"\n코멘트: {comment}"
-                    if last_rating:
-                        tooltip_text += f"\n작성일: {last_rating}"
-                    user_item.setToolTip(0, tooltip_text)
-            
-            # 사용자 아이템 스타일 설정
-            light_blue = QColor(173, 216, 230)  # lightBlue
-            user_item.setBackground(0, light_blue)
-            user_item.setBackground(1, light_blue)
-            user_item.setBackground(2, light_blue)
-            
-            # 파일 목록 정렬 (헤더 정렬 기준에 따라)
-            sorted_files = self.sort_files(user_data['files'])
-            
-            # 파일 목록을 하위 아이템으로 추가
-            for file_info in sorted_files:
-                file_item = QTreeWidgetItem(user_item)
-                file_item.setText(0, file_info['name'])
-                file_item.setText(1, self.format_file_size(file_info['size']))  # GB/MB 단위로 표시
-                file_item.setText(2, "")
-            
-            # 기본적으로 접혀있도록 설정
-            user_item.setExpanded(False)
-            
-            self.tree_widget.addTopLevelItem(user_item)
-
-    def sort_files(self, files):
-        """파일 목록을 정렬하는 함수"""
-        if self.current_sort_column == 0:  # 파일명으로 정렬
-            return sorted(files, key=lambda x: x['name'].lower(), 
-                         reverse=(self.current_sort_order == Qt.DescendingOrder))
-        elif self.current_sort_column == 1:  # 파일 크기로 정렬
-            return sorted(files, key=lambda x: x['size'], 
-                         reverse=(self.current_sort_order == Qt.DescendingOrder))
-        else:  # 파일 수 컬럼이거나 기타의 경우 기본 순서 유지
-            return files
-
-    def get_sort_key(self, username, data):
-        """정렬 키를 반환하는 함수"""
-        if self.current_sort_column == 0:  # 사용자명
-            return username.lower()
-        elif self.current_sort_column == 1:  # 크기
-            return data['user_data']['size']
-        elif self.current_sort_column == 2:  # 파일 수
-            return len(data['user_data']['files'])
-        return ""
+        """현재 정렬 기준으로 사용자/파일 행 정렬 (프록시에서 정렬 - 펼침/스크롤 유지)
+        
+        파일 행은 파일명/크기 기준이면 같이 정렬하고, 파일 수 기준이면 원래 순서를 유지한다.
+        """
+        self.tree_proxy.sort(self.current_sort_column, self.current_sort_order)
 
     def format_file_size(self, size_mb):
         """파일 사이즈를 적절한 단위(MB/GB)로 포맷팅하는 함수"""
@@ -929,41 +830,47 @@ class MainWindow(QMainWindow):
         else:
             return f"{size_mb:.2f} MB"
     
-    def update_tree_display(self):
-        """트리 디스플레이 업데이트 (파일 삭제 후 메모리와 동기화)"""
-        if not self.capacity_finder or not self.capacity_finder.dic_files:
+    def update_tree_display(self, dic_files=None):
+        """트리 디스플레이 업데이트 (메모리와 동기화)
+        
+        이미 표시 중인 dic_files 면 파일 목록/파일 수/크기가 바뀐 사용자 행만 갱신하고,
+        새 스캔 결과면 사용자 행을 새로 만든다 (파일 행은 펼칠 때 생성).
+        """
+        if dic_files is None:
+            if not self.capacity_finder:
+                return
+            dic_files = self.capacity_finder.dic_files
+        if not dic_files:
             return
         
-        logger.info("🔄 메인 GUI 트리 디스플레이 업데이트 시작")
+        if dic_files is self.displayed_files and self.tree_model.has_header():
+            changed_users = self.tree_model.changed_users(dic_files)
+            if changed_users:
+                self.apply_user_changes(changed_users)
+            logger.info(f"🔄 메인 GUI 부분 갱신: {len(changed_users)}명 사용자")
+            return
         
-        # 기존 데이터 저장 (헤더 정보 등)
-        old_total_size = self.total_size_formatted
-        old_total_count = self.total_files_count
+        logger.info("🔄 메인 GUI 트리 디스플레이 업데이트 시작")
         
-        # 트리 초기화
+        # 트리 초기화 (새 데이터는 기본 정렬인 용량 큰 순으로 표시)
         self.clear_results()
-        
-        # 업데이트된 데이터로 다시 표시
-        sorted_users = sorted(
-            self.capacity_finder.dic_files.items(), 
-            key=lambda x: x[1]['total_size'], 
-            reverse=True
-        )
+        self.current_sort_column = 1
+        self.current_sort_order = Qt.DescendingOrder
+        self.tree_view.header().setSortIndicator(self.current_sort_column, self.current_sort_order)
+        self.sort_users_data()
         
         # 새로운 전체 통계 계산
-        total_files_size = sum(user_data['total_size'] for _, user_data in sorted_users)
-        total_files_count = sum(len(user_data['files']) for _, user_data in sorted_users)
+        total_files_size = sum(user_data['total_size'] for user_data in dic_files.values())
+        total_files_count = sum(len(user_data['files']) for user_data in dic_files.values())
         formatted_total_size = self.format_file_size(total_files_size)
         
-        # 헤더 추가
+        # 헤더 + 사용자 행 (한 번에 교체)
         self.add_header_with_totals("사용자별 파일 용량 (용량 큰 순)", formatted_total_size, total_files_count)
+        self.tree_model.set_ratings(self.load_user_ratings())
+        self.tree_model.set_users(dic_files.items())
         
-        # 사용자 데이터 추가
-        for username, user_data in sorted_users:
-            formatted_size = self.format_file_size(user_data['total_size'])
-            self.add_user_data(username, user_data, formatted_size)
-        
-        logger.info(f"✅ 메인 GUI 업데이트 완료: {len(sorted_users)}명 사용자, {formatted_total_size}")
+        self.displayed_files = dic_files
+        logger.info(f"✅ 메인 GUI 업데이트 완료: {len(dic_files)}명 사용자, {formatted_total_size}")
     
     def refresh_file_list(self):
         """파일 목록 새로고침 (전체 경로 재스캔)"""
@@ -972,3 +879,207 @@ class MainWindow(QMainWindow):
             self.on_path_confirmed(self.current_path)
         else:
             logger.warning("⚠️ 경로 정보가 없어서 재스캔할 수 없음")
+
+    # === 실시간 폴더 감시 ===
+
+    def toggle_live_watch(self, checked):
+        """폴더 실시간 감시 켜기/끄기"""
+        if not self.capacity_finder:
+            return
+        if checked:
+            # 감시 스레드에서 시그널로 전달 → 메인 스레드에서 반영
+            if self.capacity_finder.start_watching(self.files_changed.emit):
+                logger.info("👁️ 폴더 실시간 감시 켜짐")
+            else:
+                self.live_watch_action.setChecked(False)
+        else:
+            self.capacity_finder.stop_watching()
+            logger.info("👁️ 폴더 실시간 감시 꺼짐")
+
+    def on_files_changed(self, changes):
+        """감시기 변경분 반영 (메인 스레드)"""
+        if not self.capacity_finder:
+            return
+        if self.is_scanning():
+            # 이미 읽고 지나간 부분의 변경은 스캔 결과에 없으므로 모아뒀다가 완료 후 반영
+            self._pending_file_changes.append(changes)
+            return
+        changed_users = self.capacity_finder.apply_file_changes(changes)
+        if changed_users is None:
+            # 이벤트 유실 등 - 전체 재스캔
+            self.quick_rescan()
+        elif changed_users:
+            self.apply_user_changes(changed_users)
+
+    def apply_user_changes(self, changed_users):
+        """변경된 사용자 행만 갱신/추가/삭제 (트리 전체를 다시 만들지 않음)
+        
+        정렬 위치 이동은 프록시가 하고, 펼침 상태/현재 행/스크롤 위치는 뷰가 유지한다.
+        """
+        dic_files = self.capacity_finder.dic_files if self.capacity_finder else {}
+        
+        for username in changed_users:
+            user_data = dic_files.get(username)
+            if user_data is None:
+                # 파일이 모두 사라진 사용자 - 행 제거
+                self.tree_model.remove_user(username)
+            else:
+                self.tree_model.upsert_user(username, user_data)
+        
+        self._update_header_totals()
+
+    def _update_header_totals(self):
+        """헤더의 전체 용량/파일 수 갱신"""
+        if not self.capacity_finder:
+            return
+        dic_files = self.capacity_finder.dic_files
+        total_size = sum(user_data['total_size'] for user_data in dic_files.values())
+        total_count = sum(len(user_data['files']) for user_data in dic_files.values())
+        self.total_size_formatted = self.format_file_size(total_size)
+        self.total_files_count = total_count
+        
+        if self.tree_model.has_header():
+            # 제목은 유지하고 전체 용량/파일 수만 갱신
+            self.tree_model.set_header(None, f"전체: {self.total_size_formatted}", f"{total_count}개 파일")
+        else:
+            self.add_header_with_totals("사용자별 파일 용량 (용량 큰 순)", self.total_size_formatted, total_count)
+
+    def closeEvent(self, event):
+        """창 닫을 때 감시/스캔 스레드와 점수 계산 프로세스 정리"""
+        self.cancel_background_scan(wait=True)
+        if self.capacity_finder:
+            self.capacity_finder.stop_watching()
+            self.capacity_finder.stop_quarantine_purger()
+            self.capacity_finder.intelligent_system.parallel_scorer.close()
+        super().closeEvent(event)
+
+    # === 백그라운드 스캔 ===
+
+    def start_background_scan(self, capacity_finder, path, on_finished, on_cancelled=None):
+        """워커 스레드에서 경로 스캔 시작 - 사용자가 발견되는 대로 트리에 표시"""
+        self.cancel_background_scan(wait=True)
+        
+        self.capacity_finder = capacity_finder
+        self.analysis_tools_button.setEnabled(False)  # 스캔 중에는 분석도구 잠금
+        
+        self.clear_results()
+        self._scan_preview = {}
+        self._pending_file_changes = []  # 새 스캔이 디렉토리를 처음부터 다시 읽음
+        self.add_header_with_totals("사용자별 파일 용량 (스캔 중...)", self.format_file_size(0), 0)
+        
+        self.scan_status_label.setText("🔍 스캔 시작...")
+        self.cancel_scan_button.setEnabled(True)
+        self.scan_status_widget.show()
+        
+        self._scan_callbacks = (on_finished, on_cancelled)
+        self.scan_worker = ScanWorkerThread(capacity_finder, path)
+        self.scan_worker.batch_ready.connect(self.on_scan_batch)
+        self.scan_worker.scan_finished.connect(self.on_scan_finished)
+        self.scan_worker.scan_cancelled.connect(self.on_scan_cancelled)
+        self.scan_worker.scan_failed.connect(self.on_scan_failed)
+        self.scan_worker.start()
+        logger.info(f"🔍 백그라운드 스캔 시작: {path}")
+
+    def is_scanning(self):
+        return self.scan_worker is not None and self.scan_worker.isRunning()
+
+    def cancel_background_scan(self, wait=False):
+        """진행 중인 백그라운드 스캔 취소"""
+        worker = self.scan_worker
+        if worker is None:
+            return
+        worker.cancel()
+        self.cancel_scan_button.setEnabled(False)
+        self.scan_status_label.setText("⏹️ 스캔 취소 중...")
+        if wait:
+            # 새 스캔으로 교체하는 경우 - 이전 워커의 늦은 시그널은 무시됨
+            self.scan_worker = None
+            worker.wait()
+            self.on_scan_cancelled_cleanup()
+
+    def _take_scan_worker(self):
+        """완료 시그널을 보낸 워커가 현재 워커일 때만 정리하고 콜백 반환"""
+        worker = self.sender()
+        if worker is None or worker is not self.scan_worker:
+            return None
+        worker.wait()
+        self.scan_worker = None
+        self.scan_status_widget.hide()
+        callbacks = self._scan_callbacks
+        self._scan_callbacks = (None, None)
+        return callbacks
+
+    def on_scan_batch(self, users_batch, stats):
+        """부분 집계 반영 - 사용자 행만 추가/갱신 (파일 행은 완료 후 생성)"""
+        if self.sender() is not self.scan_worker:
+            return
+        
+        for username, user_batch in users_batch.items():
+            preview = self._scan_preview.get(username)
+            if preview is None:
+                preview = self._scan_preview[username] = [0.0, 0]
+            preview[0] += user_batch['total_size']
+            preview[1] += len(user_batch['files'])
+            self.tree_model.set_user_preview(username, preview[0], preview[1])
+        
+        total_size = sum(preview[0] for preview in self._scan_preview.values())
+        total_count = sum(preview[1] for preview in self._scan_preview.values())
+        if self.tree_model.has_header():
+            self.tree_model.set_header(None, f"전체: {self.format_file_size(total_size)}", f"{total_count}개 파일")
+        
+        elapsed = max(stats['elapsed'], 1e-6)
+        self.scan_status_label.setText(
+            f"🔍 스캔 중: {stats['files_scanned']:,}개 파일 · "
+            f"{stats['files_scanned'] / elapsed:,.0f} files/s · "
+            f"{self.format_file_size(stats['mb_accounted'])} 집계 · "
+            f"사용자 {len(self._scan_preview)}명"
+        )
+
+    def on_scan_finished(self, result_dict):
+        """스캔 완료 - 최종 결과로 트리 표시"""
+        callbacks = self._take_scan_worker()
+        if callbacks is None:
+            return
+        self._scan_preview = {}
+        self.clear_results()
+        on_finished, _ = callbacks
+        if on_finished:
+            on_finished(result_dict)
+        self._apply_pending_file_changes()
+
+    def _apply_pending_file_changes(self):
+        """스캔 중에 모아둔 감시기 변경분을 스캔 결과에 반영 (이미 반영된 변경은 그대로 유지됨)"""
+        pending, self._pending_file_changes = self._pending_file_changes, []
+        for changes in pending:
+            self.on_files_changed(changes)
+            if self.is_scanning():
+                break  # 전체 재스캔이 시작됨 - 남은 변경분은 새 스캔 결과에 포함
+
+    def on_scan_cancelled(self):
+        """사용자가 스캔을 취소함"""
+        callbacks = self._take_scan_worker()
+        if callbacks is None:
+            return
+        _, on_cancelled = callbacks
+        self.on_scan_cancelled_cleanup()
+        self.add_result_to_list("=== 스캔이 취소되었습니다 ===")
+        if on_cancelled:
+            on_cancelled()
+
+    def on_scan_failed(self, error_message):
+        """스캔 오류"""
+        callbacks = self._take_scan_worker()
+        if callbacks is None:
+            return
+        _, on_cancelled = callbacks
+        self.on_scan_cancelled_cleanup()
+        if on_cancelled:
+            on_cancelled()
+        QMessageBox.critical(self, "스캔 오류", f"경로 스캔 중 오류가 발생했습니다:\n{error_message}")
+
+    def on_scan_cancelled_cleanup(self):
+        """중단된 스캔의 임시 표시 정리"""
+        self._scan_preview = {}
+        self._pending_file_changes = []
+        self.scan_status_widget.hide()
+        self.clear_results()
@@ -13,6 +13,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor, QFont
 import logging
 from rating_dialog import RatingDialog
+from background_workers import run_deletion_with_progress
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,9 @@ class IntelligentCleanupDialog(QDialog):
         super().__init__(parent)
         self.capacity_finder = capacity_finder
         self.analysis_result = None
+        # 점수 계산을 마친 삭제 후보와 전략별 절약 곡선 (목표 용량만 바뀌면 재사용)
+        self.deletion_selector = None
+        self.savings_curves = None
         self.setup_ui()
         
         logger.info("🧠 지능형 정리 다이얼로그 초기화")
@@ -84,12 +88,17 @@ class IntelligentCleanupDialog(QDialog):
         self.target_savings_spin.setRange(1, 2000)  # 2테라까지 확장
         self.target_savings_spin.setValue(10)
         self.target_savings_spin.setSuffix(" GB")
+        self.target_savings_spin.valueChanged.connect(self.update_savings_estimate)
         settings_layout.addWidget(self.target_savings_spin)
         
         self.analyze_button = QPushButton("🧠 지능형 분석 시작")
         self.analyze_button.clicked.connect(self.run_intelligent_analysis)
         settings_layout.addWidget(self.analyze_button)
         
+        # 절약 곡선 기반 즉시 예상치 (분석 후 목표 용량을 바꾸면 바로 갱신)
+        self.savings_estimate_label = QLabel("")
+        settings_layout.addWidget(self.savings_estimate_label)
+        
         settings_layout.addStretch()
         layout.addWidget(settings_group)
         
@@ -136,6 +145,11 @@ class IntelligentCleanupDialog(QDialog):
         self.strategy_tree.itemDoubleClicked.connect(self.edit_user_rating)
         right_layout.addWidget(self.strategy_tree)
         
+        right_layout.addWidget(QLabel("📈 절약 곡선 (기준을 넓힐수록 절약 용량/점수 손실)"))
+        self.savings_curve_tree = QTreeWidget()
+        self.savings_curve_tree.setHeaderLabels(["전략", "절약 용량", "파일 수", "기준", "점수 손실"])
+        right_layout.addWidget(self.savings_curve_tree)
+        
         splitter.addWidget(right_widget)
         
         # 실행 버튼
@@ -340,11 +354,12 @@ class IntelligentCleanupDialog(QDialog):
         try:
             logger.info(f"🧠 지능형 분석 시작: 목표 {target_gb}GB")
             
-            # 분석 실행
-            self.analysis_result = self.capacity_finder.get_intelligent_deletion_analysis(target_gb)
+            # 분석 실행 (점수 계산은 목표 용량과 무관하므로 처음 한 번만)
+            self.analysis_result = self._analyze_for_target(target_gb)
             
             # 결과 표시
             self.display_analysis_result()
+            self.display_savings_curves()
             self.execute_button.setEnabled(True)
             
             logger.info("✅ 지능형 분석 완료")
@@ -357,6 +372,67 @@ class IntelligentCleanupDialog(QDialog):
             self.progress_bar.setVisible(False)
             self.analyze_button.setEnabled(True)
     
+    def _analyze_for_target(self, target_gb):
+        """목표 용량 기준 분석 - 점수 계산한 삭제 후보/절약 곡선이 없을 때만 새로 계산"""
+        intelligent_system = self.capacity_finder.intelligent_system
+        if self.deletion_selector is None:
+            self.deletion_selector = intelligent_system.build_deletion_selector(self.capacity_finder)
+            self.savings_curves = intelligent_system.get_savings_curves(selector=self.deletion_selector)
+        return self.capacity_finder.get_intelligent_deletion_analysis(target_gb, selector=self.deletion_selector)
+    
+    def invalidate_deletion_plan(self):
+        """파일/보호 목록/레이팅이 바뀌어 점수 계산한 삭제 후보를 버림"""
+        self.deletion_selector = None
+        self.savings_curves = None
+        self.savings_estimate_label.setText("")
+        self.savings_curve_tree.clear()
+    
+    def reanalyze_auto_cleanup(self):
+        """데이터 변경 후 자동 삭제 추천 다시 계산해서 표시"""
+        self.invalidate_deletion_plan()
+        self.analysis_result = self._analyze_for_target(self.target_savings_spin.value())
+        self.display_analysis_result()
+        self.display_savings_curves()
+        self.execute_button.setEnabled(True)
+    
+    def display_savings_curves(self):
+        """전략별 절약 곡선을 절약 용량 기준 10단계로 표시"""
+        self.savings_curve_tree.clear()
+        if not self.savings_curves:
+            return
+        
+        strategy_names = {'normal': '기본', 'aggressive': '강화', 'knapsack': '손실 최소'}
+        for strategy, curve in self.savings_curves.items():
+            parent = QTreeWidgetItem(self.savings_curve_tree)
+            parent.setText(0, strategy_names.get(strategy, strategy))
+            parent.setText(1, self.format_file_size(curve.max_savings_mb))
+            parent.setText(2, f"{curve.points[-1].file_count:,}개" if curve.points else "0개")
+            for point in curve.sample(10):
+                item = QTreeWidgetItem(parent)
+                item.setText(1, self.format_file_size(point.savings_mb))
+                item.setText(2, f"{point.file_count:,}개")
+                item.setText(3, f"{point.threshold:.4f}" if strategy == 'knapsack' else f"≤ {point.threshold:.3f}")
+                item.setText(4, f"{point.score_loss:.1f}")
+        
+        self.update_savings_estimate()
+    
+    def update_savings_estimate(self, *_):
+        """목표 용량에 대한 예상치를 절약 곡선에서 바로 조회 (재분석 없음)"""
+        if not self.savings_curves:
+            return
+        
+        target_mb = self.target_savings_spin.value() * 1024
+        point = self.savings_curves['normal'].at_target(target_mb)
+        if point is None:
+            self.savings_estimate_label.setText("📈 삭제 후보 없음")
+            return
+        
+        status = "" if point.savings_mb >= target_mb else " (기본 기준으로 부족)"
+        self.savings_estimate_label.setText(
+            f"📈 예상: 점수 ≤ {point.threshold:.3f}, {point.file_count:,}개, "
+            f"{self.format_file_size(point.savings_mb)}, 점수 손실 {point.score_loss:.1f}{status}"
+        )
+    
     def display_analysis_result(self):
         """분석 결과 표시"""
         if not self.analysis_result:
@@ -608,25 +684,25 @@ class IntelligentCleanupDialog(QDialog):
             f"🎯 목표 용량: {target_gb:.1f} GB\n"
             f"💾 절약 예상: {savings_gb:.2f} GB\n"
             f"{achievement_text}\n\n"
-            f"⚠️ 이 작업은 되돌릴 수 없습니다!",
+            f"{self.capacity_finder.deletion_warning_text()}",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
             try:
-                # 정리 실행
-                result = self.capacity_finder.execute_intelligent_cleanup(
-                    self.analysis_result,
-                    confirm_callback=None  # 이미 확인했음
-                )
+                # 정리 실행 (워커 스레드에서 삭제, 이미 확인했음)
+                result = self._delete_files_with_progress(suggested_files, "지능형 정리")
                 
-                if result and result['success']:
+                if result:
+                    deleted_size_gb = result['deleted_size'] / 1024
+                    logger.info(f"🎯 지능형 정리 완료: {result['deleted_count']}개 파일, {deleted_size_gb:.2f}GB 절약")
                     QMessageBox.information(
                         self, "정리 완료",
                         f"✅ 지능형 정리가 완료되었습니다!\n\n"
                         f"🗑️ 삭제된 파일: {result['deleted_count']}개\n"
-                        f"💾 절약된 용량: {result['deleted_size_gb']:.2f} GB\n\n"
+                        f"{self._deletion_size_text(result)}\n"
+                        f"{self._deletion_issue_text(result)}\n"
                         f"🔄 화면이 자동으로 새로고침됩니다."
                     )
                     
@@ -649,17 +725,48 @@ class IntelligentCleanupDialog(QDialog):
                 logger.error(f"정리 실행 오류: {e}")
                 QMessageBox.critical(self, "실행 오류", f"정리 실행 중 오류가 발생했습니다:\n{e}")
     
+    def _delete_files_with_progress(self, files, title):
+        """삭제 엔진으로 파일 삭제 (진행 대화상자 표시) 후 메모리 데이터 동기화 - DeletionEngine.run 결과 반환"""
+        mtime_before = self.capacity_finder.directory_mtime_before_change()
+        result = run_deletion_with_progress(
+            self, self.capacity_finder.deletion_engine, self.capacity_finder.current_path, files, title,
+            quarantine=self.capacity_finder.deletion_quarantine()
+        )
+        self.capacity_finder.apply_deletion_result(result, mtime_before)
+        return result
+    
+    def _deletion_size_text(self, result):
+        """삭제 결과 용량 문구 (휴지통으로 옮긴 용량은 아직 확보된 공간이 아님)"""
+        size_gb = result['deleted_size'] / 1024
+        if result.get('quarantined'):
+            return f"♻️ 휴지통으로 이동한 용량 (아직 확보되지 않음): {size_gb:.2f} GB"
+        return f"💾 절약된 용량: {size_gb:.2f} GB"
+    
+    def _deletion_issue_text(self, result):
+        """삭제 결과 중 휴지통/없던 파일/오류/취소 안내 문구 (없으면 빈 문자열)"""
+        lines = []
+        if result.get('quarantined'):
+            lines.append("♻️ 휴지통 관리에서 되돌리거나 바로 비울 수 있습니다")
+        if result['missing_files']:
+            lines.append(f"❓ 찾을 수 없던 파일: {len(result['missing_files'])}개")
+        if result['failed_files']:
+            lines.append(f"⚠️ 삭제 실패: {len(result['failed_files'])}개")
+        if result['cancelled']:
+            lines.append("⏹️ 삭제가 중간에 취소되었습니다.")
+        return ''.join(line + '\n' for line in lines)
+    
     def _refresh_main_gui_after_cleanup(self):
         """정리 완료 후 메인 GUI 새로고침"""
+        # 삭제된 파일이 남아있지 않도록 점수 계산한 삭제 후보도 버림
+        self.invalidate_deletion_plan()
         try:
-            # 메인 창의 파일 목록 새로고침
-            if self.parent() and hasattr(self.parent(), 'refresh_file_list'):
-                self.parent().refresh_file_list()
-                logger.info("🖥️ 메인 GUI 파일 목록 새로고침 완료")
-            elif self.parent() and hasattr(self.parent(), 'update_tree_display'):
-                # MainWindow의 트리 디스플레이 업데이트
+            # 메인 창 트리에서 파일이 지워진 사용자 행만 갱신 (재스캔 없음)
+            if self.parent() and hasattr(self.parent(), 'update_tree_display'):
                 self.parent().update_tree_display()
                 logger.info("🖥️ 메인 GUI 트리 디스플레이 업데이트 완료")
+            elif self.parent() and hasattr(self.parent(), 'refresh_file_list'):
+                self.parent().refresh_file_list()
+                logger.info("🖥️ 메인 GUI 파일 목록 새로고침 완료")
             else:
                 logger.warning("⚠️ 메인 GUI 새로고침 메서드를 찾을 수 없음")
         except Exception as e:
@@ -669,6 +776,7 @@ class IntelligentCleanupDialog(QDialog):
         """분석 새로고침"""
         self.update_user_combo()
         self.analysis_result = None
+        self.invalidate_deletion_plan()
         self.execute_button.setEnabled(False)
         
         # 모든 표시 초기화
@@ -932,7 +1040,7 @@ class IntelligentCleanupDialog(QDialog):
         
         try:
             # 지능형 시스템에 키워드 추가
-            self.capacity_finder.intelligent_system.keyword_weights[keyword] = weight
+            self.capacity_finder.intelligent_system.set_keyword_weight(keyword, weight)
             
             # 테이블 새로고침
             self.load_keywords()
@@ -968,10 +1076,10 @@ class IntelligentCleanupDialog(QDialog):
         try:
             # 기존 키워드 삭제 (키워드명이 변경된 경우)
             if old_keyword != new_keyword:
-                del self.capacity_finder.intelligent_system.keyword_weights[old_keyword]
+                self.capacity_finder.intelligent_system.remove_keyword(old_keyword)
             
             # 새 키워드 추가/수정
-            self.capacity_finder.intelligent_system.keyword_weights[new_keyword] = new_weight
+            self.capacity_finder.intelligent_system.set_keyword_weight(new_keyword, new_weight)
             
             # 테이블 새로고침
             self.load_keywords()
@@ -1005,7 +1113,7 @@ class IntelligentCleanupDialog(QDialog):
         if reply == QMessageBox.Yes:
             try:
                 # 키워드 삭제
-                del self.capacity_finder.intelligent_system.keyword_weights[keyword]
+                self.capacity_finder.intelligent_system.remove_keyword(keyword)
                 
                 # 테이블 새로고침
                 self.load_keywords()
@@ -1305,11 +1413,11 @@ class IntelligentCleanupDialog(QDialog):
     def find_file_info(self, filename):
         """파일명으로 사용자와 크기 정보 찾기"""
         try:
-            for username, user_data in self.capacity_finder.dic_files.items():
-                for file_info in user_data['files']:
-                    if file_info['name'] == filename:
-                        return username, file_info['size']
-            return None, None
+            entry = self.capacity_finder.find_file(filename)
+            if entry is None:
+                return None, None
+            username, file_info = entry
+            return username, file_info['size']
         except Exception as e:
             logger.error(f"파일 정보 찾기 오류: {e}")
             return None, None
@@ -1333,11 +1441,16 @@ class IntelligentCleanupDialog(QDialog):
             files = user_data['files']
             
             # 보호되지 않은 파일만 표시
-            unprotected_files = [f for f in files if not self.capacity_finder.intelligent_system.is_file_protected(f['name'])]
+            # 복합점수는 사용자 파일 전체 기준으로 한 번에 계산
+            composite_scores, _, _ = self.capacity_finder.intelligent_system.score_user_files(username, files)
+            unprotected_files = [
+                (f, score) for f, score in zip(files, composite_scores)
+                if not self.capacity_finder.intelligent_system.is_file_protected(f['name'])
+            ]
             
             self.files_for_protection_table.setRowCount(len(unprotected_files))
             
-            for row, file_info in enumerate(unprotected_files):
+            for row, (file_info, composite_score) in enumerate(unprotected_files):
                 # 파일명
                 filename_item = QTableWidgetItem(file_info['name'])
                 filename_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
@@ -1349,15 +1462,14 @@ class IntelligentCleanupDialog(QDialog):
                 self.files_for_protection_table.setItem(row, 1, size_item)
                 
                 # 복합점수
-                score_data = self.capacity_finder.intelligent_system.calculate_composite_score(username, file_info, files)
-                score_item = QTableWidgetItem(f"{score_data['composite_score']:.3f}")
+                score_item = QTableWidgetItem(f"{composite_score:.3f}")
                 score_item.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
                 self.files_for_protection_table.setItem(row, 2, score_item)
                 
                 # 점수에 따른 색상
-                if score_data['composite_score'] <= 0.25:
+                if composite_score <= 0.25:
                     score_item.setBackground(QColor(255, 200, 200))  # 삭제 위험
-                elif score_data['composite_score'] >= 0.7:
+                elif composite_score >= 0.7:
                     score_item.setBackground(QColor(200, 255, 200))  # 안전
             
         except Exception as e:
@@ -1496,16 +1608,16 @@ class IntelligentCleanupDialog(QDialog):
     def refresh_analysis_after_protection_change(self):
         """보호 목록 변경 후 분석 결과 새로고침"""
         try:
+            # 보호된 파일은 삭제 후보에서 빠지므로 점수 계산한 후보는 어느 탭에서든 버림
+            self.invalidate_deletion_plan()
+            
             # 현재 활성 탭 확인
             current_tab = self.tab_widget.currentIndex()
             
             if current_tab == 0:  # 자동 삭제 추천 탭
                 if self.analysis_result:
                     # 자동으로 재분석
-                    target_gb = self.target_savings_spin.value()
-                    self.analysis_result = self.capacity_finder.get_intelligent_deletion_analysis(target_gb)
-                    self.display_analysis_result()
-                    self.execute_button.setEnabled(True)
+                    self.reanalyze_auto_cleanup()
                     logger.info("🔄 자동 삭제 추천 탭 보호 변경 후 업데이트됨")
                     
             elif current_tab == 2:  # 우선순위 리스트 탭
@@ -1576,10 +1688,7 @@ class IntelligentCleanupDialog(QDialog):
                     )
                     
                     # 즉시 분석 결과 새로고침
-                    target_gb = self.target_savings_spin.value()
-                    self.analysis_result = self.capacity_finder.get_intelligent_deletion_analysis(target_gb)
-                    self.display_analysis_result()
-                    self.execute_button.setEnabled(True)
+                    self.reanalyze_auto_cleanup()
                     
                     # 5번째 탭의 보호 목록도 새로고침
                     self.load_protected_files_display()
@@ -1658,6 +1767,7 @@ class IntelligentCleanupDialog(QDialog):
                 self.capacity_finder.intelligent_system.ratings_data = self.capacity_finder.intelligent_system.load_ratings()
                 
                 logger.info(f"💫 레이팅 수정 완료: {username}")
+                self.invalidate_deletion_plan()
                 
                 # 현재 활성 탭에 따라 즉시 반영
                 current_tab = self.tab_widget.currentIndex()
@@ -1665,10 +1775,7 @@ class IntelligentCleanupDialog(QDialog):
                 if current_tab == 0:  # 자동 삭제 추천 탭
                     if self.analysis_result:
                         # 기존 분석 결과가 있으면 자동으로 재분석
-                        target_gb = self.target_savings_spin.value()
-                        self.analysis_result = self.capacity_finder.get_intelligent_deletion_analysis(target_gb)
-                        self.display_analysis_result()
-                        self.execute_button.setEnabled(True)
+                        self.reanalyze_auto_cleanup()
                         logger.info("🔄 자동 삭제 추천 탭 분석 결과 업데이트됨")
                         
                 elif current_tab == 1:  # 사용자별 분석 탭
@@ -1785,41 +1892,25 @@ class IntelligentCleanupDialog(QDialog):
             f"📋 선택된 {len(selected_files)}개 파일을 삭제하시겠습니까?\n\n"
             f"💾 절약 예상: {self.format_file_size(total_size)}\n\n"
             f"👥 사용자별 삭제:\n{user_summary}\n\n"
-            f"⚠️ 이 작업은 되돌릴 수 없습니다!",
+            f"{self.capacity_finder.deletion_warning_text()}",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
             try:
-                # 삭제 실행
-                deleted_files = []
-                deleted_size = 0
-                
-                for file_data in selected_files:
-                    file_path = os.path.join(self.capacity_finder.current_path, file_data['name'])
-                    
-                    try:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                            deleted_files.append(file_data)
-                            deleted_size += file_data['size']
-                            logger.debug(f"선택 삭제 완료: {file_data['name']}")
-                        else:
-                            logger.warning(f"파일을 찾을 수 없음: {file_path}")
-                    except Exception as e:
-                        logger.error(f"파일 삭제 오류: {file_path}, 에러: {e}")
-                
-                # 🔥 중요: 삭제된 파일들을 메모리에서도 제거
-                self.capacity_finder._remove_deleted_files_from_memory(deleted_files)
+                # 삭제 실행 (워커 스레드에서 삭제 후 메모리에서도 제거)
+                result = self._delete_files_with_progress(selected_files, "선택 파일 삭제")
+                deleted_files = result['deleted_files']
                 
                 # 결과 메시지
-                deleted_size_gb = deleted_size / 1024
+                deleted_size_gb = result['deleted_size'] / 1024
                 QMessageBox.information(
                     self, "선택 삭제 완료",
                     f"✅ 선택된 파일 삭제가 완료되었습니다!\n\n"
                     f"🗑️ 삭제된 파일: {len(deleted_files)}개\n"
-                    f"💾 절약된 용량: {deleted_size_gb:.2f} GB\n\n"
+                    f"{self._deletion_size_text(result)}\n"
+                    f"{self._deletion_issue_text(result)}\n"
                     f"🔄 화면이 자동으로 새로고침됩니다."
                 )
                 
@@ -1929,41 +2020,25 @@ class IntelligentCleanupDialog(QDialog):
             f"• 고품질 (0.7+): {high_quality}개\n"
             f"• 중품질 (0.3-0.7): {medium_quality}개\n"
             f"• 저품질 (0.3-): {low_quality}개\n\n"
-            f"⚠️ 이 작업은 되돌릴 수 없습니다!",
+            f"{self.capacity_finder.deletion_warning_text()}",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
             try:
-                # 삭제 실행
-                deleted_files = []
-                deleted_size = 0
-                
-                for file_data in selected_files:
-                    file_path = os.path.join(self.capacity_finder.current_path, file_data['name'])
-                    
-                    try:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                            deleted_files.append(file_data)
-                            deleted_size += file_data['size']
-                            logger.debug(f"선택 삭제 완료: {file_data['name']}")
-                        else:
-                            logger.warning(f"파일을 찾을 수 없음: {file_path}")
-                    except Exception as e:
-                        logger.error(f"파일 삭제 오류: {file_path}, 에러: {e}")
-                
-                # 🔥 중요: 삭제된 파일들을 메모리에서도 제거
-                self.capacity_finder._remove_deleted_files_from_memory(deleted_files)
+                # 삭제 실행 (워커 스레드에서 삭제 후 메모리에서도 제거)
+                result = self._delete_files_with_progress(selected_files, "선택 파일 삭제")
+                deleted_files = result['deleted_files']
                 
                 # 결과 메시지
-                deleted_size_gb = deleted_size / 1024
+                deleted_size_gb = result['deleted_size'] / 1024
                 QMessageBox.information(
                     self, "선택 삭제 완료",
                     f"✅ 선택된 파일 삭제가 완료되었습니다!\n\n"
                     f"🗑️ 삭제된 파일: {len(deleted_files)}개\n"
-                    f"💾 절약된 용량: {deleted_size_gb:.2f} GB\n\n"
+                    f"{self._deletion_size_text(result)}\n"
+                    f"{self._deletion_issue_text(result)}\n"
                     f"🔄 화면이 자동으로 새로고침됩니다."
                 )
                 
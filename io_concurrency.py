@@ -0,0 +1,216 @@
+"""
+적응형 I/O 동시성 제어 모듈
+
+NAS(SMB) 처럼 느리거나 혼잡해질 수 있는 저장소에서 동시 작업 수를 고정값으로 두지 않고,
+작업별 지연 시간과 처리량을 EWMA 로 추적해서 AIMD 방식으로 조절한다.
+
+- 지연이 기준(최근 판단 주기들의 최소 지연)보다 크게 늘거나 오류가 나면 동시 작업 수를 절반으로 (곱셈 감소)
+- 그렇지 않고 처리량이 유지/증가하면 하나씩 늘림 (덧셈 증가)
+
+같은 저장소에 대한 같은 종류의 작업(파일 stat, 썸네일 추출 등)은 get_io_controller 로
+하나의 제어기를 공유하므로, 한 번 학습한 동시 작업 수가 다음 스캔에도 이어진다.
+"""
+
+import os
+import time
+import threading
+import logging
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class _Slot:
+    """slot() 안에서 작업 실패를 표시하기 위한 토큰"""
+    __slots__ = ('failed',)
+
+    def __init__(self):
+        self.failed = False
+
+
+class AdaptiveConcurrency:
+    """EWMA 지연/처리량 기반 AIMD 동시성 제어기 (스레드 안전)
+
+    사용법:
+        controller = AdaptiveConcurrency('stat', initial=8, max_limit=32)
+        with ThreadPoolExecutor(max_workers=controller.max_limit) as executor:
+            executor.submit(controller.run, func, arg)
+    스레드 풀은 최대치로 만들고, 실제 동시 실행 수는 제어기가 제한한다.
+    """
+
+    def __init__(self, name, initial=4, min_limit=1, max_limit=32, alpha=0.2,
+                 latency_tolerance=2.0, min_latency_delta=0.002, window=8, base_windows=10):
+        """
+        Args:
+            name: 로그에 표시할 이름
+            initial: 시작 동시 작업 수
+            min_limit / max_limit: 동시 작업 수 범위
+            alpha: EWMA 가중치 (클수록 최근 값 반영이 빠름)
+            latency_tolerance: 지연이 기준의 몇 배를 넘으면 혼잡으로 볼지
+            min_latency_delta: 혼잡 판단에 필요한 최소 지연 증가량(초) - 로컬 디스크의 미세한 흔들림 무시
+            window: 조절 판단 주기 (완료 작업 수, 동시 작업 수의 2배보다 작으면 2배 사용)
+            base_windows: 기준 지연을 구할 최근 판단 주기 수 (저장소 상태가 바뀌면 이 기간 후 새 기준 적용)
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.alpha = alpha
+        self.latency_tolerance = latency_tolerance
+        self.min_latency_delta = min_latency_delta
+        self.window = window
+
+        self._cond = threading.Condition()
+        self._limit = min(max(initial, self.min_limit), self.max_limit)
+        self._in_flight = 0
+
+        self._latency_ewma = None      # 작업당 지연 EWMA (초)
+        self._throughput_ewma = None   # 초당 완료 작업 수 EWMA
+        self._window_minimums = deque(maxlen=base_windows)  # 판단 주기별 최소 지연
+
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._window_errors = 0
+        self._window_min_latency = None
+
+    @property
+    def limit(self):
+        """현재 허용 동시 작업 수"""
+        return self._limit
+
+    def stats(self):
+        """현재 상태 (로그/표시용)"""
+        with self._cond:
+            return {
+                'limit': self._limit,
+                'in_flight': self._in_flight,
+                'latency': self._latency_ewma,
+                'base_latency': self._base_latency(),
+                'throughput': self._throughput_ewma,
+            }
+
+    @contextmanager
+    def slot(self):
+        """동시 작업 한 자리를 얻어서 실행 (자리가 날 때까지 대기)
+
+        with 블록 안에서 예외가 나거나 slot.failed = True 로 표시하면 실패로 집계
+        """
+        with self._cond:
+            while self._in_flight >= self._limit:
+                self._cond.wait()
+            self._in_flight += 1
+
+        token = _Slot()
+        start = time.monotonic()
+        try:
+            yield token
+        except BaseException:
+            token.failed = True
+            raise
+        finally:
+            self._complete(time.monotonic() - start, token.failed)
+
+    def run(self, func, *args, **kwargs):
+        """func 를 동시성 제한 안에서 실행하고 결과 반환 (스레드 풀 submit 용)"""
+        with self.slot():
+            return func(*args, **kwargs)
+
+    # === 측정 / 조절 ===
+
+    def _complete(self, latency, failed):
+        with self._cond:
+            self._in_flight -= 1
+
+            if not failed:
+                if self._latency_ewma is None:
+                    self._latency_ewma = latency
+                else:
+                    self._latency_ewma += self.alpha * (latency - self._latency_ewma)
+                if self._window_min_latency is None or latency < self._window_min_latency:
+                    self._window_min_latency = latency
+
+            self._window_count += 1
+            if failed:
+                self._window_errors += 1
+            if self._window_count >= max(self.window, self._limit * 2):
+                self._adjust()
+
+            self._cond.notify_all()
+
+    def _base_latency(self):
+        """혼잡 없을 때의 지연 기준 - 최근 판단 주기들의 최소 지연"""
+        candidates = list(self._window_minimums)
+        if self._window_min_latency is not None:
+            candidates.append(self._window_min_latency)
+        return min(candidates) if candidates else None
+
+    def _adjust(self):
+        """한 판단 주기가 끝났을 때 동시 작업 수 조절 (잠금 안에서 호출)"""
+        now = time.monotonic()
+        elapsed = max(now - self._window_start, 1e-6)
+        throughput = self._window_count / elapsed
+
+        latency = self._latency_ewma
+        base = self._base_latency()
+        congested = self._window_errors > 0 or (
+            latency is not None and base is not None and
+            latency > base * self.latency_tolerance and
+            latency - base > self.min_latency_delta
+        )
+
+        old_limit = self._limit
+        if congested:
+            self._limit = max(self.min_limit, self._limit // 2)
+        elif self._throughput_ewma is None or throughput >= self._throughput_ewma * 0.9:
+            self._limit = min(self.max_limit, self._limit + 1)
+
+        if self._throughput_ewma is None:
+            self._throughput_ewma = throughput
+        else:
+            self._throughput_ewma += self.alpha * (throughput - self._throughput_ewma)
+
+        # 오래된 주기의 최소 지연은 밀려나므로, 저장소 상태가 바뀌면 새 기준에 다시 적응
+        if self._window_min_latency is not None:
+            self._window_minimums.append(self._window_min_latency)
+
+        if self._limit != old_limit:
+            logger.debug(f"⚖️ [{self.name}] 동시 작업 수 {old_limit} → {self._limit} "
+                         f"(지연 {latency * 1000 if latency else 0:.1f}ms, 처리량 {throughput:.1f}/초"
+                         f"{', 오류 ' + str(self._window_errors) if self._window_errors else ''})")
+
+        self._window_start = now
+        self._window_count = 0
+        self._window_errors = 0
+        self._window_min_latency = None
+
+
+_controllers = {}
+_controllers_lock = threading.Lock()
+
+
+def storage_key(path):
+    """같은 저장소인지 구분하는 키 (UNC 공유 폴더 또는 장치 번호)"""
+    normalized = path.replace('\\', '/')
+    if normalized.startswith('//'):
+        parts = normalized[2:].split('/')
+        return 'unc:' + '/'.join(parts[:2]).lower()
+    try:
+        return f"dev:{os.stat(path).st_dev}"
+    except OSError:
+        return 'path:' + os.path.splitdrive(os.path.abspath(path))[0].lower()
+
+
+def is_network_path(path):
+    """UNC 경로(\\\\server\\share, //server/share) 여부"""
+    return path.startswith('\\\\') or path.startswith('//')
+
+
+def get_io_controller(path, kind, initial=4, max_limit=32, **options):
+    """저장소/작업 종류별 공유 제어기 (처음 요청 시 생성)"""
+    key = (storage_key(path), kind)
+    with _controllers_lock:
+        controller = _controllers.get(key)
+        if controller is None:
+            controller = AdaptiveConcurrency(f"{kind}@{key[0]}", initial=initial, max_limit=max_limit, **options)
+            _controllers[key] = controller
+        return controller
@@ -0,0 +1,90 @@
+"""
+키워드 매칭 모듈
+
+레이팅 코멘트에 포함된 키워드를 키워드마다 `keyword in comment` 로 검사하지 않고,
+키워드 목록으로 Aho-Corasick 오토마톤을 한 번 만들어서 코멘트를 한 번만 훑어 찾는다.
+키워드 수와 관계없이 코멘트 길이에 비례하는 시간으로 매칭된다.
+"""
+
+from collections import deque
+
+
+class KeywordMatcher:
+    """키워드 가중치 표로 만든 다중 패턴 매처 (Aho-Corasick)
+
+    사용법:
+        matcher = KeywordMatcher({'ㅅㅌㅊ': 0.8, '계륵': -0.7})
+        matcher.total_weight('ㅅㅌㅊ 인데 가끔 계륵')  # 0.8 + -0.7
+    키워드는 대소문자를 그대로 비교하며, 코멘트에 여러 번 나와도 한 번만 더한다.
+    """
+
+    def __init__(self, keyword_weights):
+        """
+        Args:
+            keyword_weights: {키워드: 가중치} (순서대로 키워드 번호가 매겨짐)
+        """
+        self.keywords = list(keyword_weights)
+        self.weights = [keyword_weights[keyword] for keyword in self.keywords]
+
+        # 상태별 전이 / 실패 링크 / 그 상태에서 끝나는 키워드 번호들
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            self._add(keyword, index)
+        self._build_failure_links()
+
+    def _add(self, keyword, index):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(index)
+
+    def _build_failure_links(self):
+        """너비 우선으로 실패 링크를 연결하고, 실패 경로의 출력을 합쳐둠"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """text 에 포함된 키워드 번호 집합"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        found = set(output[0])  # 빈 키워드는 항상 포함
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def matches(self, text):
+        """text 에 포함된 키워드 목록 (키워드 표 순서)"""
+        return [self.keywords[index] for index in sorted(self.find(text))]
+
+    def total_weight(self, text):
+        """text 에 포함된 키워드 가중치 합 (키워드 표 순서로 더함)"""
+        total = 0.0
+        for index in sorted(self.find(text)):
+            total += self.weights[index]
+        return total
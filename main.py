@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from gui import MainWindow
 import sys
 import os
-import re
 import json
+import time
+from stat import S_ISREG
+import hashlib
+import heapq
+import itertools
 import logging
 from datetime import datetime
-from enum import Enum
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
-from PyQt5.QtWidgets import QApplication
+import multiprocessing
+from scan_index import ScanIndex
+from filename_parser import DATE_PATTERN, parse_filename
+from file_records import FileRecord, UserFileStats
+from parallel_parser import AdaptiveNameParser
+from file_watcher import DirectoryWatcher
+from io_concurrency import get_io_controller, is_network_path
+from keyword_matcher import KeywordMatcher
+from parallel_scoring import ParallelScorer
+from deletion_engine import DeletionEngine
+from quarantine import Quarantine, QuarantinePurger
+from deletion_planner import (
+    FairShareAllocator, TargetSavingsSelector, ratio_caps, summarize_by_user,
+    NORMAL_CAP_RATIO, NORMAL_MAX_SCORE, AGGRESSIVE_CAP_RATIO, AGGRESSIVE_MAX_SCORE,
+    KNAPSACK_CAP_RATIO, KNAPSACK_MAX_SCORE,
+)
+import scoring_engine
 
 # 로그 설정 함수
 def setup_logging():
@@ -43,6 +61,10 @@ def setup_logging():
 # 로그 설정 초기화
 logger = setup_logging()
 
+# 스캔 시점에 이보다 최근(초)에 수정된 파일은 쓰는 중(녹화 중)일 수 있음
+# - 파일 내용이 늘어나도 디렉토리 수정시각은 그대로라서 캐시 재사용 전에 이 파일들만 다시 stat
+RECENT_WRITE_SECONDS = 300
+
 # 다른 파일에서도 사용할 수 있도록 로그 설정 함수 제공
 def get_logger(module_name):
     """다른 모듈에서 로거를 가져올 때 사용"""
@@ -51,14 +73,67 @@ def get_logger(module_name):
 class IntelligentCurationSystem:
     """지능형 큐레이션 시스템 - 레이팅 데이터와 파일 점수를 결합한 판단 시스템"""
     
-    def __init__(self, ratings_file="user_ratings.json"):
+    def __init__(self, ratings_file="user_ratings.json", score_store=None):
         self.ratings_file = ratings_file
+        # 기본 파일 점수 영구 캐시 (ScanIndex, 없으면 세션 안에서만 캐시)
+        self.score_store = score_store
+        self._file_score_cache = None  # {username: (파일 목록 해시, 점수 리스트)} - 처음 사용 시 로드
+        self._dirty_file_scores = set()  # 아직 저장하지 않은 사용자
+        self._score_dir = None  # 점수 캐시를 저장/로드할 디렉토리 (set_score_directory, 없으면 세션 안에서만 캐시)
+        # 라이브러리 전체 분석 시 점수를 새로 계산할 사용자를 나눠 맡을 프로세스 풀 (처음 필요할 때 시작)
+        self.parallel_scorer = ParallelScorer()
+        self._rating_cache = {}  # {username: 레이팅 점수} - 레이팅/키워드가 바뀌면 비움
+        self._keyword_matcher = None  # 키워드 표로 만든 매처 (처음 사용 시 생성)
         self.ratings_data = self.load_ratings()
         self.keyword_weights = self.load_keyword_weights()
         self.protected_files = self.load_protected_files()  # 보호 목록 추가
         logger.info("🧠 지능형 큐레이션 시스템 초기화 완료 (다양성 유지 점수 시스템 적용)")
         logger.info(f"🛡️ 보호된 파일: {len(self.protected_files)}개")
     
+    @property
+    def ratings_data(self):
+        """{username: {'rating': int, 'comment': str, ...}}"""
+        return self._ratings_data
+    
+    @ratings_data.setter
+    def ratings_data(self, ratings_data):
+        self._ratings_data = ratings_data
+        self.invalidate_rating_scores()
+    
+    @property
+    def keyword_weights(self):
+        """{키워드: 가중치} - 수정은 set_keyword_weight / remove_keyword 사용"""
+        return self._keyword_weights
+    
+    @keyword_weights.setter
+    def keyword_weights(self, keyword_weights):
+        self._keyword_weights = keyword_weights
+        self._keyword_matcher = None
+        self.invalidate_rating_scores()
+    
+    def set_keyword_weight(self, keyword, weight):
+        """키워드 추가 또는 가중치 수정"""
+        self._keyword_weights[keyword] = weight
+        self._keyword_matcher = None
+        self.invalidate_rating_scores()
+    
+    def remove_keyword(self, keyword):
+        """키워드 삭제"""
+        del self._keyword_weights[keyword]
+        self._keyword_matcher = None
+        self.invalidate_rating_scores()
+    
+    def invalidate_rating_scores(self):
+        """사용자별 레이팅 점수 캐시 비우기 (레이팅/키워드 변경 시)"""
+        self._rating_cache.clear()
+    
+    @property
+    def keyword_matcher(self):
+        """현재 키워드 표의 KeywordMatcher"""
+        if self._keyword_matcher is None:
+            self._keyword_matcher = KeywordMatcher(self._keyword_weights)
+        return self._keyword_matcher
+    
     def load_ratings(self):
         """레이팅 데이터 로드"""
         try:
@@ -191,7 +266,14 @@ class IntelligentCurationSystem:
         }
     
     def calculate_rating_score(self, username):
-        """사용자 레이팅 기반 점수 계산 (0.0 ~ 1.0) - 다양성 유지 시스템"""
+        """사용자 레이팅 기반 점수 계산 (0.0 ~ 1.0) - 다양성 유지 시스템 (사용자별 캐시)"""
+        score = self._rating_cache.get(username)
+        if score is None:
+            score = self._compute_rating_score(username)
+            self._rating_cache[username] = score
+        return score
+    
+    def _compute_rating_score(self, username):
         if username not in self.ratings_data:
             return 0.4  # 미평가 사용자 기본 점수 (0.2 → 0.4로 상향)
         
@@ -199,11 +281,8 @@ class IntelligentCurationSystem:
         base_rating = rating_info.get('rating', 0) / 5.0  # 0.0 ~ 1.0 정규화
         comment = rating_info.get('comment', '').lower()
         
-        # 키워드 가중치 적용 (범위 조정)
-        keyword_bonus = 0.0
-        for keyword, weight in self.keyword_weights.items():
-            if keyword in comment:
-                keyword_bonus += weight
+        # 키워드 가중치 적용 (범위 조정) - 코멘트를 한 번만 훑어서 모든 키워드 매칭
+        keyword_bonus = self.keyword_matcher.total_weight(comment)
         
         # 키워드 보너스 제한 조정 (-0.7 ~ +0.7)
         keyword_bonus = max(-0.7, min(0.7, keyword_bonus))
@@ -226,7 +305,7 @@ class IntelligentCurationSystem:
         rating_score = self.calculate_rating_score(username)
         
         # 가중 결합 (파일 점수 60%, 레이팅 점수 40%)
-        composite_score = (file_score * 0.6) + (rating_score * 0.4)
+        composite_score = scoring_engine.composite_scores([file_score], rating_score)[0]
         
         return {
             'composite_score': composite_score,
@@ -235,125 +314,225 @@ class IntelligentCurationSystem:
             'username': username
         }
     
+    def score_user_files(self, username, user_files):
+        """사용자 파일 전체의 점수를 한 번에 계산 (배치 API)
+        
+        Returns:
+            tuple: (복합 점수 리스트, 기본 파일 점수 리스트, 레이팅 점수) - 리스트는 user_files 순서
+        """
+        file_scores = self._get_file_scores(username, user_files)
+        rating_score = self.calculate_rating_score(username)
+        return scoring_engine.composite_scores(file_scores, rating_score), file_scores, rating_score
+    
+    def prefetch_file_scores(self, capacity_finder):
+        """캐시에 없는(파일이 바뀐) 사용자들의 기본 파일 점수를 한 번에 계산
+        
+        라이브러리 전체 분석 전에 호출하면, 새로 계산할 파일이 많을 때 프로세스 풀로 나눠 계산하고
+        이후 사용자별 score_user_files 는 캐시를 사용한다.
+        """
+        cache = self._load_file_score_cache()
+        pending = []
+        digests = {}
+        for username, user_data in capacity_finder.dic_files.items():
+            user_files = user_data['files']
+            names = [f['name'] for f in user_files]
+            sizes = [f['size'] for f in user_files]
+            digest = scoring_engine.files_digest(names, sizes)
+            cached = cache.get(username)
+            if cached is None or cached[0] != digest or len(cached[1]) != len(names):
+                pending.append((username, names, sizes))
+                digests[username] = digest
+        
+        if not pending:
+            return
+        
+        for username, file_scores in self.parallel_scorer.score(pending).items():
+            cache[username] = (digests[username], file_scores)
+            self._dirty_file_scores.add(username)
+    
+    def _get_file_scores(self, username, user_files):
+        """사용자 기본 파일 점수 (파일 목록이 그대로면 저장된 점수 재사용)"""
+        names = [f['name'] for f in user_files]
+        sizes = [f['size'] for f in user_files]
+        digest = scoring_engine.files_digest(names, sizes)
+        
+        cache = self._load_file_score_cache()
+        cached = cache.get(username)
+        if cached is not None and cached[0] == digest and len(cached[1]) == len(names):
+            return list(cached[1])
+        
+        file_scores = scoring_engine.file_scores_basic(sizes, names)
+        cache[username] = (digest, file_scores)
+        self._dirty_file_scores.add(username)
+        return list(file_scores)
+    
+    def set_score_directory(self, dir_path, usernames=None):
+        """점수 캐시 대상 디렉토리 지정 (스캔 결과가 나올 때마다 호출)
+        
+        디렉토리가 바뀌면 이전 디렉토리의 새 점수를 저장하고 캐시를 새 디렉토리 것으로 바꾼다.
+        usernames 를 주면 스캔 결과에 없는 사용자의 저장된 점수를 정리한다.
+        """
+        if dir_path != self._score_dir:
+            self.save_score_cache()
+            self._file_score_cache = None
+            self._dirty_file_scores.clear()
+            self._score_dir = dir_path
+        
+        if usernames is None or dir_path is None:
+            return
+        usernames = set(usernames)
+        if self._file_score_cache:
+            for username in [username for username in self._file_score_cache if username not in usernames]:
+                del self._file_score_cache[username]
+                self._dirty_file_scores.discard(username)
+        if self.score_store is not None:
+            try:
+                self.score_store.prune_user_scores(dir_path, usernames)
+            except Exception as e:
+                logger.error(f"점수 캐시 정리 오류: {e}")
+    
+    def _load_file_score_cache(self):
+        if self._file_score_cache is None:
+            self._file_score_cache = {}
+            if self.score_store is not None and self._score_dir is not None:
+                try:
+                    self._file_score_cache = self.score_store.load_user_scores(self._score_dir)
+                    logger.debug(f"🗂️ 점수 캐시 로드: {len(self._file_score_cache)}명")
+                except Exception as e:
+                    logger.error(f"점수 캐시 로드 오류: {e}")
+        return self._file_score_cache
+    
+    def save_score_cache(self):
+        """새로 계산한 기본 파일 점수를 스캔 인덱스에 저장"""
+        if not self._dirty_file_scores or self.score_store is None or self._score_dir is None:
+            return
+        entries = [
+            (username,) + self._file_score_cache[username]
+            for username in self._dirty_file_scores
+            if username in self._file_score_cache
+        ]
+        try:
+            self.score_store.save_user_scores(self._score_dir, entries)
+            self._dirty_file_scores.clear()
+        except Exception as e:
+            logger.error(f"점수 캐시 저장 오류: {e}")
+    
+    def score_library(self, capacity_finder):
+        """라이브러리 전체를 사용자 단위 배치로 점수 계산
+        
+        Returns:
+            dict: {username: (복합 점수 리스트, 기본 파일 점수 리스트, 레이팅 점수)}
+        """
+        self.prefetch_file_scores(capacity_finder)
+        result = {
+            username: self.score_user_files(username, user_data['files'])
+            for username, user_data in capacity_finder.dic_files.items()
+        }
+        self.save_score_cache()
+        return result
+    
+    def iter_scored_files(self, capacity_finder, skip_protected=False):
+        """라이브러리 전체 파일 점수를 하나씩 생성 (전체 리스트를 만들지 않음)
+        
+        Yields:
+            tuple: (복합 점수, 순번, 사용자명, 파일 정보, 기본 파일 점수, 레이팅 점수)
+            순번은 같은 점수끼리 원래 순서를 유지하기 위한 값
+        """
+        self.prefetch_file_scores(capacity_finder)
+        sequence = 0
+        for username, user_data in capacity_finder.dic_files.items():
+            user_files = user_data['files']
+            composite, file_scores, rating_score = self.score_user_files(username, user_files)
+            for file_info, composite_score, file_score in zip(user_files, composite, file_scores):
+                if skip_protected and self.is_file_protected(file_info['name']):
+                    continue
+                yield composite_score, sequence, username, file_info, file_score, rating_score
+                sequence += 1
+        self.save_score_cache()
+    
+    def get_lowest_scored_files(self, capacity_finder, count, skip_protected=False):
+        """복합 점수가 가장 낮은 파일 count 개 (점수 낮은 순) - 크기 count 의 힙으로 스트리밍 선택"""
+        if count <= 0:
+            return []
+        lowest = heapq.nsmallest(count, self.iter_scored_files(capacity_finder, skip_protected))
+        return [
+            {
+                'name': file_info['name'],
+                'size': file_info['size'],
+                'composite_score': composite_score,
+                'file_score': file_score,
+                'rating_score': rating_score,
+                'username': username
+            }
+            for composite_score, _, username, file_info, file_score, rating_score in lowest
+        ]
+    
+    def build_scored_file_list(self, username, user_files, skip_protected=False):
+        """배치 점수로 [{'name', 'size', 'composite_score', 'file_score', 'rating_score', 'username'}] 생성"""
+        composite, file_scores, rating_score = self.score_user_files(username, user_files)
+        scored_files = []
+        for file_info, composite_score, file_score in zip(user_files, composite, file_scores):
+            if skip_protected and self.is_file_protected(file_info['name']):
+                logger.debug(f"🛡️ 보호된 파일 제외: {file_info['name']}")
+                continue
+            scored_files.append({
+                'name': file_info['name'],
+                'size': file_info['size'],
+                'composite_score': composite_score,
+                'file_score': file_score,
+                'rating_score': rating_score,
+                'username': username
+            })
+        return scored_files
+    
     def calculate_file_score_basic(self, file_info, user_files):
         """기본 파일 점수 계산 (다양성 유지 시스템)"""
         file_name = file_info['name']
         file_size = file_info['size']
         
-        size_score = 0.0
-        rarity_score = 0.0
-        date_score = 0.0
-        
         try:
-            # 파일 크기 점수 (적당한 곡선)
+            # 크기 점수(1.5제곱 곡선) + 희귀성/날짜 기본값의 가중 평균
             all_sizes = [f['size'] for f in user_files]
-            if all_sizes:
-                max_size = max(all_sizes)
-                min_size = min(all_sizes)
-                if max_size > min_size:
-                    normalized_score = (file_size - min_size) / (max_size - min_size)
-                    # 1.5제곱으로 적당한 곡선 유지
-                    size_score = normalized_score ** 1.5  # 너무 극단적이지 않게
-                else:
-                    size_score = 0.6  # 크기 차이 없으면 중상 점수
-            
-            # 희귀성 점수 (기본값 상향)
-            rarity_score = 0.5  # 기본값 (0.3 → 0.5로 상향)
-            
-            # 날짜 점수 (기본값 상향)
-            date_score = 0.4  # 기본값 (0.2 → 0.4로 상향)
-            
+            raw_score = scoring_engine.file_score_from_size(file_size, min(all_sizes), max(all_sizes))
         except Exception as e:
             logger.error(f"파일 점수 계산 오류: {file_name}, 에러: {e}")
             return 0.3  # 오류 시 기본값을 적당하게 (0.1 → 0.3)
         
-        # 가중 평균 계산
-        raw_score = (size_score * 0.6 + rarity_score * 0.25 + date_score * 0.15)
-        
-        # 다양성 보정 적용
-        final_score = self._apply_diversity_adjustment(raw_score)
-        
-        return final_score
+        # 다양성 보정 적용 (미세 조정은 파일명 기준)
+        return self._apply_diversity_adjustment(raw_score, file_name)
     
-    def _apply_diversity_adjustment(self, score):
+    def _apply_diversity_adjustment(self, score, key=None):
         """다양성 유지 보정 함수 - 부드러운 곡선으로 0.01~0.99 범위에서 고르게 분포"""
-        import math
-        
-        # 시그모이드 곡선 적용으로 부드러운 분포 생성
-        # 입력 범위 [0,1]을 [-6,6] 범위로 변환
-        x = (score - 0.5) * 12  # -6 ~ +6 범위
-        
-        # 시그모이드 함수: 1 / (1 + e^(-x))
-        sigmoid = 1.0 / (1.0 + math.exp(-x))
-        
-        # 0.01 ~ 0.99 범위로 스케일링
-        adjusted = 0.01 + (sigmoid * 0.98)
-        
-        # 추가 미세 조정: 중간값 주변에서 더 넓은 분포
-        if 0.3 <= score <= 0.7:
-            # 중간 영역에서 약간의 랜덤성 추가 (파일명 해시 기반)
-            hash_factor = (hash(str(score)) % 100) / 1000.0  # -0.05 ~ +0.05
-            adjusted += hash_factor - 0.05
-        
-        return max(0.01, min(0.99, adjusted))
+        return scoring_engine.diversity_adjust(score, key)
     
     def get_deletion_priority_list(self, capacity_finder):
         """삭제 우선순위 리스트 생성"""
+        self.prefetch_file_scores(capacity_finder)
         priority_list = []
         
         for username, user_data in capacity_finder.dic_files.items():
-            files_with_scores = []
-            
-            for file_info in user_data['files']:
-                score_data = self.calculate_composite_score(username, file_info, user_data['files'])
-                files_with_scores.append({
-                    'name': file_info['name'],
-                    'size': file_info['size'],
-                    'composite_score': score_data['composite_score'],
-                    'file_score': score_data['file_score'],
-                    'rating_score': score_data['rating_score'],
-                    'username': username
-                })
+            # 사용자 단위 배치 점수 계산
+            files_with_scores = self.build_scored_file_list(username, user_data['files'])
             
             # 점수 낮은 순 정렬 (삭제 우선순위)
             files_with_scores.sort(key=lambda x: x['composite_score'])
             
             priority_list.extend(files_with_scores)
         
+        self.save_score_cache()
         return priority_list
     
-    def get_auto_deletion_suggestions(self, capacity_finder, target_savings_gb=10):
-        """자동 삭제 추천 (목표 절약 용량 기준) - 목표 달성 우선 방식"""
-        target_savings_mb = target_savings_gb * 1024
+    def build_deletion_selector(self, capacity_finder):
+        """보호된 파일을 뺀 사용자별 삭제 후보를 점수 계산해서 TargetSavingsSelector 로 묶음
         
-        # 사용자별로 파일 분석 및 그룹화 (점수 기준을 동적으로 조정)
+        목표 용량만 바꿔서 다시 추천하거나 절약 곡선을 볼 때 재사용하면 다시 점수 계산하지 않음
+        """
+        self.prefetch_file_scores(capacity_finder)
         user_deletion_candidates = {}
-        score_threshold = 0.25  # 시작 기준점
-        
-        # 1단계: 기본 기준으로 후보 수집
-        logger.info(f"🎯 목표 용량: {target_savings_gb}GB ({target_savings_mb}MB)")
         
         for username, user_data in capacity_finder.dic_files.items():
-            files_with_scores = []
-            
-            # 사용자별 파일 점수 계산
-            for file_info in user_data['files']:
-                filename = file_info['name']
-                
-                # 보호된 파일은 제외
-                if self.is_file_protected(filename):
-                    logger.debug(f"🛡️ 보호된 파일 제외: {filename}")
-                    continue
-                
-                score_data = self.calculate_composite_score(username, file_info, user_data['files'])
-                files_with_scores.append({
-                    'name': file_info['name'],
-                    'size': file_info['size'],
-                    'composite_score': score_data['composite_score'],
-                    'file_score': score_data['file_score'],
-                    'rating_score': score_data['rating_score'],
-                    'username': username
-                })
+            # 사용자 단위 배치 점수 계산 (보호된 파일은 제외)
+            files_with_scores = self.build_scored_file_list(username, user_data['files'], skip_protected=True)
             
             # 점수 낮은 순으로 정렬
             files_with_scores.sort(key=lambda x: x['composite_score'])
@@ -361,45 +540,75 @@ class IntelligentCurationSystem:
             if files_with_scores:
                 user_deletion_candidates[username] = files_with_scores
         
-        # 2단계: 목표 달성을 위한 동적 기준 조정
-        suggestions = []
-        criteria_used = []
+        self.save_score_cache()
+        return TargetSavingsSelector(user_deletion_candidates)
+    
+    def get_savings_curves(self, capacity_finder=None, selector=None):
+        """전략별 절약 곡선 (점수 기준별 누적 삭제 파일 수/절약 용량/점수 손실)
         
-        # 여러 기준으로 시도하여 목표 달성
-        thresholds = [0.25, 0.35, 0.45, 0.55, 0.65]  # 점수 기준을 점진적으로 완화
+        Returns:
+            dict: {'normal': SavingsCurve, 'aggressive': SavingsCurve, 'knapsack': SavingsCurve}
+        """
+        if selector is None:
+            selector = self.build_deletion_selector(capacity_finder)
+        return {
+            'normal': selector.savings_curve(selector.relative_cap(NORMAL_CAP_RATIO), NORMAL_MAX_SCORE),
+            'aggressive': selector.savings_curve(selector.total_cap(AGGRESSIVE_CAP_RATIO), AGGRESSIVE_MAX_SCORE),
+            'knapsack': selector.knapsack_curve(selector.total_cap(KNAPSACK_CAP_RATIO), KNAPSACK_MAX_SCORE),
+        }
+    
+    def get_auto_deletion_suggestions(self, capacity_finder, target_savings_gb=10, mode='threshold', selector=None):
+        """자동 삭제 추천 (목표 절약 용량 기준) - 목표 달성 우선 방식
         
-        for threshold in thresholds:
-            # 현재 기준으로 후보 선택
-            filtered_candidates = {}
-            total_available_mb = 0
-            
-            for username, files in user_deletion_candidates.items():
-                filtered_files = [f for f in files if f['composite_score'] <= threshold]
-                if filtered_files:
-                    filtered_candidates[username] = filtered_files
-                    total_available_mb += sum(f['size'] for f in filtered_files)
-            
-            logger.info(f"📊 점수 {threshold} 이하: {total_available_mb/1024:.2f}GB 이용 가능")
-            
-            # 이용 가능한 용량이 목표의 80% 이상이면 진행
-            if total_available_mb >= target_savings_mb * 0.8:
-                suggestions = self._get_target_focused_deletion_suggestions(
-                    filtered_candidates, target_savings_mb, threshold
-                )
-                criteria_used.append(f"composite_score <= {threshold}")
-                break
+        Args:
+            mode: 'threshold' (목표를 채우는 가장 낮은 점수 기준까지 점수순 선택)
+                  'knapsack' (GB 당 점수 손실이 가장 적은 조합 선택)
+            selector: build_deletion_selector 결과 (있으면 점수 계산 생략)
+        """
+        target_savings_mb = target_savings_gb * 1024
+        logger.info(f"🎯 목표 용량: {target_savings_gb}GB ({target_savings_mb}MB)")
+        
+        # 1단계: 후보 수집 + 전체 후보를 한 번만 정렬
+        if selector is None:
+            selector = self.build_deletion_selector(capacity_finder)
+        
+        # 2단계: 목표를 채우는 점수 기준을 이진 탐색
+        suggestions = []
+        criteria_used = []
         
-        # 3단계: 그래도 부족하면 최후 수단
-        if not suggestions or sum(f['size'] for f in suggestions) < target_savings_mb * 0.5:
-            logger.warning("⚠️ 기본 기준으로는 목표 달성 어려움 - 강화된 기준 적용")
-            suggestions = self._get_aggressive_deletion_suggestions(
-                user_deletion_candidates, target_savings_mb
+        if mode == 'knapsack':
+            # 사용자별 최대 90%, 점수 0.85 이하에서 용량당 점수 손실 최소화
+            suggestions = selector.select_knapsack(
+                target_savings_mb, selector.total_cap(KNAPSACK_CAP_RATIO), KNAPSACK_MAX_SCORE
             )
-            criteria_used.append("aggressive mode")
+            criteria_used.append(f"knapsack (composite_score <= {KNAPSACK_MAX_SCORE})")
+        else:
+            # 사용자별로 기준 이하 파일의 최대 90%, 점수 0.65 이하까지
+            normal_cap = selector.relative_cap(NORMAL_CAP_RATIO)
+            threshold = selector.find_threshold(target_savings_mb, normal_cap, NORMAL_MAX_SCORE)
+            if threshold is None and selector.available(NORMAL_MAX_SCORE, normal_cap) >= target_savings_mb * 0.8:
+                threshold = NORMAL_MAX_SCORE  # 목표를 다 채우지 못해도 80% 이상이면 진행
+            
+            if threshold is not None:
+                logger.info(f"📊 점수 {threshold:.3f} 이하: {selector.available(threshold, normal_cap)/1024:.2f}GB 이용 가능")
+                suggestions = selector.select(threshold, normal_cap, target_savings_mb)
+                criteria_used.append(f"composite_score <= {threshold:.3f}")
+            
+            # 3단계: 그래도 부족하면 최후 수단 (사용자별 전체 후보의 최대 95%, 점수 0.85 이하까지)
+            if not suggestions or sum(f['size'] for f in suggestions) < target_savings_mb * 0.5:
+                logger.warning("⚠️ 기본 기준으로는 목표 달성 어려움 - 강화된 기준 적용")
+                aggressive_cap = selector.total_cap(AGGRESSIVE_CAP_RATIO)
+                threshold = selector.find_threshold(target_savings_mb, aggressive_cap, AGGRESSIVE_MAX_SCORE)
+                if threshold is None:
+                    threshold = AGGRESSIVE_MAX_SCORE
+                suggestions = selector.select(threshold, aggressive_cap, target_savings_mb)
+                criteria_used.append("aggressive mode")
         
         total_savings_gb = sum(f['size'] for f in suggestions) / 1024
         achievement_rate = (total_savings_gb / target_savings_gb) * 100 if target_savings_gb > 0 else 0
         
+        user_stats = summarize_by_user(suggestions)
+        logger.info(f"📊 사용자별 분배: {dict([(k, v['count']) for k, v in user_stats.items()])}")
         logger.info(f"✅ 목표 달성률: {achievement_rate:.1f}% ({total_savings_gb:.2f}GB / {target_savings_gb}GB)")
         
         return {
@@ -412,204 +621,27 @@ class IntelligentCurationSystem:
         }
     
     def _get_balanced_deletion_suggestions(self, user_deletion_candidates, target_savings_mb):
-        """균등 분배 방식으로 삭제 추천 파일 선택"""
+        """균등 분배 방식으로 삭제 추천 파일 선택 (사용자별 최대 80%, 라운드 로빈 공정 분배)"""
         if not user_deletion_candidates:
             return []
         
         suggestions = []
         current_savings = 0
-        total_users = len(user_deletion_candidates)
-        
-        # 1단계: 각 사용자별로 최소 1개씩 선택 (골고루 분배)
-        user_indices = {username: 0 for username in user_deletion_candidates.keys()}
         
-        # 라운드 로빈 방식으로 각 사용자별로 돌아가며 파일 선택
-        round_count = 0
-        max_rounds = 50  # 무한 루프 방지
-        
-        while current_savings < target_savings_mb and round_count < max_rounds:
-            round_count += 1
-            selected_in_round = 0
-            
-            for username, files in user_deletion_candidates.items():
-                if current_savings >= target_savings_mb:
-                    break
-                
-                current_index = user_indices[username]
-                
-                # 해당 사용자의 다음 파일 선택
-                if current_index < len(files):
-                    file_data = files[current_index]
-                    
-                    # 한 사용자당 최대 제한 (전체 파일의 80% 이하)
-                    user_total_files = len(user_deletion_candidates[username])
-                    max_files_per_user = max(1, int(user_total_files * 0.8))
-                    
-                    # 현재 사용자가 이미 선택된 파일 수 계산
-                    current_user_selected = sum(1 for f in suggestions if f['username'] == username)
-                    
-                    if current_user_selected < max_files_per_user:
-                        suggestions.append(file_data)
-                        current_savings += file_data['size']
-                        selected_in_round += 1
-                        logger.debug(f"균등 분배 선택: {username} - {file_data['name']} (점수: {file_data['composite_score']:.3f})")
-                    
-                    user_indices[username] += 1
-            
-            # 이번 라운드에서 선택된 파일이 없으면 종료
-            if selected_in_round == 0:
-                break
-        
-        # 사용자별 통계 로그
-        user_stats = {}
-        for file_data in suggestions:
-            username = file_data['username']
-            if username not in user_stats:
-                user_stats[username] = {'count': 0, 'size': 0}
-            user_stats[username]['count'] += 1
-            user_stats[username]['size'] += file_data['size']
-        
-        logger.info(f"🎯 균등 분배 완료: {len(suggestions)}개 파일, {current_savings/1024:.2f}GB")
-        logger.info(f"📊 사용자별 분배: {dict([(k, v['count']) for k, v in user_stats.items()])}")
-        
-        return suggestions
-    
-    def _get_target_focused_deletion_suggestions(self, user_deletion_candidates, target_savings_mb, threshold):
-        """목표 달성에 집중한 파일 선택 방식"""
-        if not user_deletion_candidates:
-            return []
-        
-        suggestions = []
-        current_savings = 0
-        
-        # 모든 후보 파일을 점수순으로 통합 정렬
-        all_candidates = []
-        for username, files in user_deletion_candidates.items():
-            all_candidates.extend(files)
-        
-        # 점수 낮은 순으로 정렬 (삭제 우선순위)
-        all_candidates.sort(key=lambda x: x['composite_score'])
-        
-        logger.info(f"🎯 목표 달성 모드: {len(all_candidates)}개 후보에서 선택")
-        
-        # 사용자별 삭제 비율 제한 (조금 더 관대하게)
-        user_deletion_limits = {}
-        user_deleted_counts = {}
-        
-        for username, files in user_deletion_candidates.items():
-            total_files = len(files)
-            # 최대 90%까지 삭제 허용 (기존 80%에서 완화)
-            user_deletion_limits[username] = max(1, int(total_files * 0.9))
-            user_deleted_counts[username] = 0
-        
-        # 목표 달성까지 파일 선택
-        for file_data in all_candidates:
+        allocator = FairShareAllocator(user_deletion_candidates, ratio_caps(user_deletion_candidates, 0.8))
+        for file_data in allocator:
             if current_savings >= target_savings_mb:
                 break
-            
-            username = file_data['username']
-            
-            # 사용자별 제한 확인
-            if user_deleted_counts[username] >= user_deletion_limits[username]:
-                continue
-            
             suggestions.append(file_data)
             current_savings += file_data['size']
-            user_deleted_counts[username] += 1
-            
-            # 진행 상황 로그 (매 50개마다)
-            if len(suggestions) % 50 == 0:
-                logger.debug(f"⚡ 진행: {current_savings/1024:.2f}GB ({len(suggestions)}개 파일)")
+            logger.debug(f"균등 분배 선택: {file_data['username']} - {file_data['name']} (점수: {file_data['composite_score']:.3f})")
         
-        # 사용자별 통계
-        user_stats = {}
-        for file_data in suggestions:
-            username = file_data['username']
-            if username not in user_stats:
-                user_stats[username] = {'count': 0, 'size': 0}
-            user_stats[username]['count'] += 1
-            user_stats[username]['size'] += file_data['size']
-        
-        logger.info(f"🎯 목표 달성 완료: {len(suggestions)}개 파일, {current_savings/1024:.2f}GB")
-        logger.info(f"📊 사용자별 분배: {dict([(k, v['count']) for k, v in user_stats.items()])}")
-        
-        return suggestions
-    
-    def _get_aggressive_deletion_suggestions(self, user_deletion_candidates, target_savings_mb):
-        """강화된 기준으로 목표 달성 시도"""
-        if not user_deletion_candidates:
-            return []
-        
-        suggestions = []
-        current_savings = 0
-        
-        # 모든 파일을 점수순으로 통합 정렬 (점수 제한 없이)
-        all_candidates = []
-        for username, files in user_deletion_candidates.items():
-            all_candidates.extend(files)
-        
-        # 점수 낮은 순으로 정렬
-        all_candidates.sort(key=lambda x: x['composite_score'])
-        
-        logger.warning(f"⚠️ 강화 모드: {len(all_candidates)}개 전체 파일에서 선택")
-        
-        # 사용자별 최대 95%까지 삭제 허용 (매우 관대하게)
-        user_deletion_limits = {}
-        user_deleted_counts = {}
-        
-        for username, files in user_deletion_candidates.items():
-            total_files = len(files)
-            # 최대 95%까지 삭제 허용
-            user_deletion_limits[username] = max(1, int(total_files * 0.95))
-            user_deleted_counts[username] = 0
-        
-        # 점수 0.75 이하까지 확장하여 목표 달성 시도
-        max_score_limit = 0.75
-        
-        for file_data in all_candidates:
-            if current_savings >= target_savings_mb:
-                break
-            
-            # 점수 제한 확인
-            if file_data['composite_score'] > max_score_limit:
-                continue
-            
-            username = file_data['username']
-            
-            # 사용자별 제한 확인
-            if user_deleted_counts[username] >= user_deletion_limits[username]:
-                continue
-            
-            suggestions.append(file_data)
-            current_savings += file_data['size']
-            user_deleted_counts[username] += 1
+        # 사용자별 통계 로그
+        user_stats = summarize_by_user(suggestions)
         
-        # 여전히 부족하면 점수 제한 완화
-        if current_savings < target_savings_mb * 0.8:
-            logger.warning("⚠️ 점수 제한 0.85까지 완화")
-            max_score_limit = 0.85
-            
-            for file_data in all_candidates:
-                if current_savings >= target_savings_mb:
-                    break
-                
-                if file_data['composite_score'] > max_score_limit:
-                    continue
-                
-                # 이미 선택된 파일은 건너뛰기
-                if file_data in suggestions:
-                    continue
-                
-                username = file_data['username']
-                
-                if user_deleted_counts[username] >= user_deletion_limits[username]:
-                    continue
-                
-                suggestions.append(file_data)
-                current_savings += file_data['size']
-                user_deleted_counts[username] += 1
+        logger.info(f"🎯 균등 분배 완료: {len(suggestions)}개 파일, {current_savings/1024:.2f}GB")
+        logger.info(f"📊 사용자별 분배: {dict([(k, v['count']) for k, v in user_stats.items()])}")
         
-        logger.warning(f"⚠️ 강화 모드 완료: {len(suggestions)}개 파일, {current_savings/1024:.2f}GB")
         return suggestions
     
     def get_user_cleanup_analysis(self, username):
@@ -651,34 +683,6 @@ class IntelligentCurationSystem:
             'comment': comment
         }
 
-class SiteType(Enum):
-    """지원하는 성인 플랫폼 목록"""
-    CHATURBATE = "chaturbate"
-    STRIPCHAT = "stripchat"
-    CAMSODA = "camsoda"
-    MYFREECAMS = "myfreecams"
-    CAM4 = "cam4"
-    BONGACAMS = "bongacams"
-    LIVEJASMIN = "livejasmin"
-    FLIRT4FREE = "flirt4free"
-    XHAMSTERLIVE = "xhamsterlive"
-    STREAMATE = "streamate"
-    CAMGIRLS = "camgirls"
-    IMLIVE = "imlive"
-    CAMS = "cams"
-    JERKMATE = "jerkmate"
-    AMATEUR = "amateur"
-    
-    @classmethod
-    def get_all_sites(cls):
-        """모든 사이트명을 리스트로 반환"""
-        return [site.value for site in cls]
-    
-    @classmethod
-    def is_valid_site(cls, site_name):
-        """주어진 문자열이 유효한 사이트명인지 확인"""
-        return site_name.lower() in cls.get_all_sites()
-
 class PathHistory:
     """경로 기록을 관리하는 클래스"""
     def __init__(self, config_file="path_history.json"):
@@ -766,11 +770,44 @@ class PathHistory:
 class CapacityFinder:
     def __init__(self):
         self.current_path = None
-        self.dic_files = {}  # {username: {'total_size': float, 'files': [{'name': str, 'size': float}]}}
+        self._file_index = None  # {파일명: (username, FileRecord)} - dic_files 에서 처음 필요할 때 만듦
+        self.dic_files = {}  # {username: {'total_size': float, 'files': [FileRecord(name, size)]}}
         self.window = None  # GUI 윈도우 참조를 위해 추가
         self.path_history = PathHistory()  # 경로 기록 관리자 추가
         # 날짜 패턴 정의 (2025-06-26T15_09_46+09_00 형식)
-        self.date_pattern = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}_\d{2}_\d{2}[+-]\d{2}_\d{2}')
+        self.date_pattern = DATE_PATTERN
+        
+        # 스캔 방식: 'scandir' (단일 패스) 또는 'threadpool' (listdir + 멀티스레딩 stat)
+        self.scan_mode = 'scandir'
+        self.last_scan_timings = {}  # 마지막 스캔의 단계별 소요 시간
+        
+        # 파일명 파싱 프로세스 수와 프로세스 풀 전환 기준
+        # ('auto': 보정 실행으로 결정, 정수: 고정 기준, None: 항상 직렬)
+        self.parse_workers = os.cpu_count() or 1
+        self.process_parse_threshold = 'auto'
+        
+        # 영구 스캔 인덱스 (변경된 파일만 다시 파싱)
+        self.scan_index = self._open_scan_index()
+        
+        # 마지막 스캔 시점의 디렉토리 시그니처 (변경 없으면 재스캔 생략)
+        # {'path': str, 'mtime_ns': int, 'count': int, 'digest': int, 'recent': [파일명], 'stat_only': bool}
+        self.dir_signature = None
+        
+        # 사용자별 점수 계산용 통계 캐시 {username: (파일 목록, 파일 수, UserFileStats)}
+        # 파일 목록 객체가 바뀌거나(재스캔) 파일 수가 달라지면 자동으로 다시 계산
+        self._user_stats = {}
+        
+        # 실시간 폴더 감시기 (선택 기능)
+        self.watcher = None
+        
+        # 병렬 삭제 엔진 (중단된 삭제는 저널로 이어서 실행)
+        self.deletion_engine = DeletionEngine()
+        
+        # 휴지통 모드 (선택 기능, 기본 꺼짐): 정리 도구의 삭제를 같은 볼륨의 휴지통 이동으로 대신하고,
+        # 백그라운드에서 비움 - 켜져 있으면 비워질 때까지 공간이 확보되지 않음
+        self.use_quarantine = False
+        self._quarantine = None
+        self.quarantine_purger = None
         
         # === 도구 간 간단한 네비게이션 컨텍스트 ===
         self.navigation_context = {
@@ -780,11 +817,29 @@ class CapacityFinder:
         }
         
         # === 지능형 큐레이션 시스템 추가 ===
-        self.intelligent_system = IntelligentCurationSystem()
+        self.intelligent_system = IntelligentCurationSystem(score_store=self.scan_index)
         
         logger.info("CapacityFinder 초기화 완료")
         logger.info("🧠 지능형 큐레이션 시스템 연동 완료 (다양성 유지 점수 분포 시스템)")
         
+    @property
+    def dic_files(self):
+        return self._dic_files
+    
+    @dic_files.setter
+    def dic_files(self, dic_files):
+        # 스캔 결과로 통째로 바뀌면 파일명 색인도 다시 만듦
+        self._dic_files = dic_files
+        self._file_index = None
+    
+    def _open_scan_index(self):
+        """스캔 인덱스 열기 (실패 시 인덱스 없이 전체 스캔)"""
+        try:
+            return ScanIndex()
+        except Exception as e:
+            logger.error(f"스캔 인덱스 열기 오류: {e}")
+            return None
+        
     def format_file_size(self, size_mb):
         """파일 사이즈를 적절한 단위(MB/GB)로 포맷팅하는 함수"""
         if size_mb >= 1024:  # 1GB 이상
@@ -806,40 +861,76 @@ class CapacityFinder:
         if self.path_history.add_path(path):
             logger.info(f"경로가 기록에 저장됨: {path}")
         
+        # 감시 중이던 경로가 바뀌면 감시 대상도 새 경로로 교체
+        if self.watcher and os.path.abspath(self.watcher.path) != os.path.abspath(path):
+            self.start_watching(self.watcher.on_changes)
+        
+        # 경로의 휴지통 자동 비우기
+        self.start_quarantine_purger()
+        
+        if self.dic_files and self.is_directory_unchanged(path):
+            # 디렉토리 변경 없음 - 캐시된 결과 재사용 (쓰는 중이던 파일만 크기 다시 확인)
+            logger.info("⚡ 디렉토리 변경 없음 - 캐시된 파일 목록 재사용")
+            self.last_scan_timings = {'mode': 'cached', 'entries': self.dir_signature['count']}
+            self._refresh_recent_file_sizes()
+            self._display_scan_result(self.dic_files, start_time)
+            return
+        
+        if self.scan_mode == 'scandir' and hasattr(self.window, 'start_background_scan'):
+            # 스캔-파싱-집계는 워커 스레드에서 - 사용자가 발견되는 대로 트리에 표시
+            self.window.start_background_scan(
+                self, path,
+                on_finished=lambda result_dict: self._on_background_scan_finished(result_dict, start_time),
+                on_cancelled=self._on_background_scan_cancelled
+            )
+            return
+        
         # 기존 데이터 초기화
         self.dic_files = {}
         
-        # 파일 용량 계산
+        # 파일 용량 계산 (변경된 파일만 다시 파싱)
         logger.debug("파일 목록 및 용량 계산 시작")
         result_dict = self.listing_files()
+        self._display_scan_result(result_dict, start_time)
+
+    def scan_path(self, path):
+        """GUI 없이 경로를 동기 스캔해서 dic_files 반환 (CLI/스크립트용, 경로 기록은 남기지 않음)"""
+        self.current_path = path
+        self.dic_files = {}
+        self.listing_files()
+        self._sync_score_directory(self.dic_files)
+        return self.dic_files
+    
+    def _sync_score_directory(self, result_dict):
+        """점수 캐시를 현재 경로 기준으로 맞춤 (비어 있는 결과로는 저장된 점수를 정리하지 않음)"""
+        self.intelligent_system.set_score_directory(self.current_path, result_dict.keys() if result_dict else None)
+
+    def _on_background_scan_finished(self, result_dict, start_time):
+        """워커 스레드 스캔 완료 - 결과를 반영하고 최종 트리 표시 (메인 스레드)"""
+        self.dic_files = result_dict
+        self._display_scan_result(result_dict, start_time)
+
+    def _on_background_scan_cancelled(self):
+        """워커 스레드 스캔 취소 - 이전 경로의 데이터가 남지 않도록 비움"""
+        self.dic_files = {}
+        self.window.update_cleanup_button_state()
+
+    def _display_scan_result(self, result_dict, start_time):
+        """스캔 결과를 GUI 트리에 표시"""
+        import time
         files_processed_time = time.time()
         logger.info(f"⏱️ 파일 처리 완료: {files_processed_time - start_time:.2f}초")
+        self._sync_score_directory(result_dict)
         
         if result_dict:
-            # GUI 리스트 초기화
-            self.window.clear_results()
-            
-            # 용량 기준으로 내림차순 정렬 (큰 것부터)
-            sorted_users = sorted(result_dict.items(), key=lambda x: x[1]['total_size'], reverse=True)
-            
             # 전체 파일 통계 계산
-            total_files_size = sum(user_data['total_size'] for _, user_data in sorted_users)
-            total_files_count = sum(len(user_data['files']) for _, user_data in sorted_users)
-            formatted_total_size = self.format_file_size(total_files_size)
+            total_files_size = sum(user_data['total_size'] for user_data in result_dict.values())
+            total_files_count = sum(len(user_data['files']) for user_data in result_dict.values())
             
-            logger.info(f"파일 분석 완료 - 총 {len(sorted_users)}명 사용자, 총 용량: {formatted_total_size}, 총 파일: {total_files_count}개")
+            logger.info(f"파일 분석 완료 - 총 {len(result_dict)}명 사용자, 총 용량: {self.format_file_size(total_files_size)}, 총 파일: {total_files_count}개")
             
-            # 결과를 GUI에 표시 (헤더를 각 열에 맞춰 표시)
-            self.window.add_header_with_totals("사용자별 파일 용량 (용량 큰 순)", formatted_total_size, total_files_count)
-            for username, user_data in sorted_users:
-                total_size = user_data['total_size']
-                file_count = len(user_data['files'])
-                formatted_size = self.format_file_size(total_size)
-                
-                # 새로운 트리 구조로 사용자 데이터 추가
-                self.window.add_user_data(username, user_data, formatted_size)
-                
-                logger.debug(f"사용자: {username}, 총 용량: {formatted_size}, 파일 수: {file_count}")
+            # 결과를 GUI에 표시 (이미 표시 중인 캐시 결과면 바뀐 사용자 행만 갱신, 새 결과면 용량 큰 순으로 새로 표시)
+            self.window.update_tree_display(result_dict)
             
             # CapacityFinder 인스턴스를 GUI에 설정하고 모델 정리 버튼 활성화
             self.window.set_capacity_finder(self)
@@ -849,6 +940,7 @@ class CapacityFinder:
             total_time = time.time() - start_time
             logger.info(f"🎯 전체 경로 로딩 완료: {total_time:.2f}초")
             logger.info(f"   📊 파일 처리: {files_processed_time - start_time:.2f}초")
+            self._log_scan_timings()
             logger.info(f"   🖥️ GUI 표시: {total_time - (files_processed_time - start_time):.2f}초")
         else:
             logger.warning("처리할 파일이 없습니다.")
@@ -859,19 +951,316 @@ class CapacityFinder:
             total_time = time.time() - start_time
             logger.info(f"🎯 경로 로딩 완료 (빈 결과): {total_time:.2f}초")
         
+    @staticmethod
+    def _name_digest(file_name):
+        """파일명 집합 다이제스트용 64비트 해시 (XOR 로 합쳐 순서와 무관)"""
+        data = file_name.encode('utf-8', 'surrogateescape')
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+    def _record_directory_signature(self, path, dir_mtime_ns, file_names, recent_names=()):
+        """스캔 직후 디렉토리 시그니처 기록 (수정시각은 스캔 시작 전에 측정한 값)
+        
+        recent_names: 스캔 시점에 최근 수정된(쓰는 중일 수 있는) 파일 - 캐시 재사용 때 다시 stat
+        """
+        digest = 0
+        count = 0
+        for file_name in file_names:
+            digest ^= self._name_digest(file_name)
+            count += 1
+        
+        self.dir_signature = {
+            'path': os.path.abspath(path),
+            'mtime_ns': dir_mtime_ns,
+            'count': count,
+            'digest': digest,
+            'recent': list(recent_names),
+            'stat_only': False,  # True 면 재탐색 때 수정시각만 확인 (_refresh_directory_signature 참고)
+        }
+        logger.debug(f"디렉토리 시그니처 기록: {count}개 파일, 최근 수정 {len(self.dir_signature['recent'])}개, "
+                     f"digest={digest:016x}")
+
+    def is_directory_unchanged(self, path):
+        """마지막 스캔 이후 디렉토리가 바뀌지 않았는지 확인
+        
+        수정시각(stat 1회)이 같으면 파일명만 한 번 읽어 파일 수와 파일명 다이제스트까지 비교
+        (수정시각 단위가 거친 파일시스템/같은 시각 안의 변경 대비, 파일별 stat 없음).
+        직접 삭제/복원한 뒤 갱신한 시그니처이고 파일시스템 수정시각이 초 단위보다 세밀하면 stat 1회로 끝냄.
+        """
+        signature = self.dir_signature
+        if not signature or signature['path'] != os.path.abspath(path):
+            return False
+        try:
+            if os.stat(path).st_mtime_ns != signature['mtime_ns']:
+                return False
+            if signature['stat_only']:
+                return True
+            digest = 0
+            count = 0
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        digest ^= self._name_digest(entry.name)
+                        count += 1
+        except OSError as e:
+            logger.error(f"디렉토리 상태 확인 오류: {path}, 에러: {e}")
+            return False
+        return count == signature['count'] and digest == signature['digest']
+
+    def _refresh_recent_file_sizes(self):
+        """캐시 재사용 전 스캔 때 쓰는 중이던 파일만 다시 stat 해서 크기 반영
+        
+        Returns:
+            set: 크기가 바뀐 사용자명
+        """
+        signature = self.dir_signature
+        if not signature or not signature['recent']:
+            return set()
+        
+        cutoff = time.time() - RECENT_WRITE_SECONDS
+        still_recent = []
+        changed_users = set()
+        for file_name in signature['recent']:
+            try:
+                stat_result = os.stat(os.path.join(self.current_path, file_name))
+            except OSError:
+                continue
+            if stat_result.st_mtime >= cutoff:
+                still_recent.append(file_name)
+            entry = self.find_file(file_name)
+            file_size = stat_result.st_size / (1024 * 1024)
+            if entry is not None and entry[1]['size'] != file_size:
+                self._upsert_file_entry(entry[0], file_name, file_size)
+                changed_users.add(entry[0])
+        
+        signature['recent'] = still_recent
+        if changed_users:
+            logger.info(f"📝 쓰는 중인 파일 크기 갱신: 사용자 {len(changed_users)}명")
+        return changed_users
+
+    def directory_mtime_before_change(self):
+        """프로그램이 현재 경로를 바꾸기(삭제/복원) 직전에 호출 - 그 시점의 디렉토리 수정시각
+        
+        작업 후 시그니처를 갱신할 때 이 값이 기록된 수정시각과 같아야
+        그 사이 다른 프로그램이 바꾼 내용이 없다고 볼 수 있음
+        """
+        if not self.current_path:
+            return None
+        return self._get_directory_mtime_ns()
+
+    def _refresh_directory_signature(self, removed_names, added_names=(), mtime_before=None):
+        """프로그램이 직접 반영한 변경분(삭제/복원)만큼 시그니처 갱신
+        
+        바뀐 디렉토리 수정시각을 다시 기록해두면 다음 재탐색이 stat 1회로 끝남.
+        작업 직전 수정시각(mtime_before)이 기록과 다르면 그 사이 다른 프로그램이 디렉토리를
+        바꾼 것이므로 (또는 확인할 수 없으면) 시그니처를 버려 다음 재탐색이 디렉토리를 다시 읽게 함
+        """
+        signature = self.dir_signature
+        if not signature or not self.current_path:
+            return
+        if signature['path'] != os.path.abspath(self.current_path):
+            return
+        if mtime_before is None or mtime_before != signature['mtime_ns']:
+            logger.debug("작업 전에 디렉토리가 이미 바뀌어 있음 - 디렉토리 시그니처 폐기")
+            self.dir_signature = None
+            return
+        try:
+            signature['mtime_ns'] = os.stat(self.current_path).st_mtime_ns
+        except OSError as e:
+            logger.error(f"디렉토리 상태 확인 오류: {self.current_path}, 에러: {e}")
+            self.dir_signature = None
+            return
+        # 수정시각이 초 단위로 떨어지지 않으면 세밀한 파일시스템 - 다음 재탐색은 stat 1회만 (파일명 읽기 생략)
+        signature['stat_only'] = signature['mtime_ns'] % 1_000_000_000 != 0
+        for file_name in removed_names:
+            signature['digest'] ^= self._name_digest(file_name)
+            signature['count'] -= 1
+        for file_name in added_names:
+            signature['digest'] ^= self._name_digest(file_name)
+            signature['count'] += 1
+
+    # === 실시간 폴더 감시 ===
+
+    def start_watching(self, on_changes, mode='auto'):
+        """현재 경로 실시간 감시 시작
+        
+        Args:
+            on_changes: FileChanges 를 받는 콜백 (감시 스레드에서 호출됨)
+            mode: 'auto' (Linux 는 inotify), 'inotify', 'poll'
+        """
+        self.stop_watching()
+        if not self.current_path:
+            logger.warning("경로가 설정되지 않아 감시를 시작할 수 없습니다.")
+            return False
+        self.watcher = DirectoryWatcher(self.current_path, on_changes, mode=mode)
+        self.watcher.start()
+        return True
+
+    def stop_watching(self):
+        """실시간 감시 종료"""
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+
+    def is_watching(self):
+        return self.watcher is not None and self.watcher.is_running()
+
+    def apply_file_changes(self, changes):
+        """감시기 변경분을 dic_files 에 반영 (메인 스레드에서 호출)
+        
+        Args:
+            changes: file_watcher.FileChanges
+            
+        Returns:
+            set: 변경된 사용자명들 (전체 재스캔이 필요하면 None)
+        """
+        if changes.full_rescan:
+            self.dir_signature = None  # 다음 재탐색은 반드시 디렉토리를 다시 읽음
+            return None
+        
+        changed_users = set()
+        removed_names = []
+        added_names = []
+        
+        for file_name in changes.deleted:
+            username = self.file_name_handle(file_name)
+            if username and self._remove_file_entry(username, file_name):
+                changed_users.add(username)
+                removed_names.append(file_name)
+        
+        for file_name, (file_size, file_mtime) in changes.created.items():
+            username = self.file_name_handle(file_name)
+            if not username:
+                continue
+            if self._upsert_file_entry(username, file_name, file_size):
+                added_names.append(file_name)
+            changed_users.add(username)
+        
+        # 이벤트가 생기기 전 수정시각은 알 수 없으므로 시그니처를 버림 (감시 중에는 감시기가 dic_files 를 맞춰둠)
+        self._refresh_directory_signature(removed_names, added_names, mtime_before=None)
+        
+        logger.info(f"👁️ 변경분 반영: 추가/변경 {len(changes.created)}개, 삭제 {len(removed_names)}개, 사용자 {len(changed_users)}명")
+        return changed_users
+
+    def _upsert_file_entry(self, username, file_name, file_size):
+        """사용자 파일 추가 또는 크기 갱신 - 새 파일이면 True"""
+        file_index = self._get_file_index()
+        entry = file_index.get(file_name)
+        if entry is not None:
+            owner, file_info = entry
+            self.dic_files[owner]['total_size'] += file_size - file_info['size']
+            file_info['size'] = file_size
+            self.invalidate_user_stats(owner)
+            return False
+        user_data = self.dic_files.setdefault(username, {'total_size': 0.0, 'files': []})
+        file_info = FileRecord.from_name(file_name, file_size)
+        user_data['files'].append(file_info)
+        user_data['total_size'] += file_size
+        file_index[file_name] = (username, file_info)
+        self.invalidate_user_stats(username)
+        return True
+
+    def _remove_file_entry(self, username, file_name):
+        """사용자 파일 제거 (모든 파일이 사라지면 사용자도 제거) - 제거했으면 True"""
+        return bool(self._remove_file_entries([file_name]))
+
+    # === 파일명 색인 ===
+
+    def _get_file_index(self):
+        """파일명 → (username, FileRecord) 색인 (없으면 dic_files 에서 한 번 만듦)"""
+        if self._file_index is None:
+            self._file_index = {
+                file_info['name']: (username, file_info)
+                for username, user_data in self.dic_files.items()
+                for file_info in user_data['files']
+            }
+        return self._file_index
+
+    def invalidate_file_index(self):
+        """dic_files 를 직접 채운 뒤 호출 - 다음 조회 때 색인을 다시 만듦"""
+        self._file_index = None
+
+    def find_file(self, file_name):
+        """파일명으로 (username, FileRecord) 찾기 (없으면 None)"""
+        return self._get_file_index().get(file_name)
+
+    def _remove_file_entries(self, file_names):
+        """파일명 목록을 dic_files 에서 제거 - 해당 파일이 있는 사용자만 다시 집계
+        
+        Returns:
+            dict: {username: [제거한 파일명, ...]} (메모리에 없던 파일은 제외)
+        """
+        file_index = self._get_file_index()
+        removed = {}
+        for file_name in file_names:
+            entry = file_index.pop(file_name, None)
+            if entry is not None:
+                removed.setdefault(entry[0], {})[file_name] = entry[1]
+        
+        for username, records in removed.items():
+            user_data = self.dic_files[username]
+            files = user_data['files']
+            if len(records) == 1:
+                files.remove(next(iter(records.values())))
+            else:
+                files[:] = [file_info for file_info in files if file_info['name'] not in records]
+            user_data['total_size'] -= sum(file_info['size'] for file_info in records.values())
+            self.invalidate_user_stats(username)
+            if not files:
+                del self.dic_files[username]
+                logger.info(f"빈 사용자 데이터 제거: {username}")
+        
+        return {username: list(records) for username, records in removed.items()}
+
     def get_file_size_info(self, file_path, file_name):
         """단일 파일의 크기 정보를 가져오는 함수 (멀티스레딩용)"""
         try:
-            if os.path.isfile(file_path):
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-                return [file_name, file_size_mb]
+            stat_result = os.stat(file_path)
+            if S_ISREG(stat_result.st_mode):
+                return [file_name, stat_result.st_size / (1024 * 1024), stat_result.st_mtime]
+            return None
+        except FileNotFoundError:
             return None
         except Exception as e:
             logger.error(f"파일 크기 가져오기 오류: {file_path}, 에러: {e}")
             return None
 
+    def iter_directory_entries(self, path=None):
+        """os.scandir 단일 패스로 (파일명, 크기MB, 수정시각) 레코드를 스트리밍하는 제너레이터
+        
+        디렉토리 항목에서 파일 여부와 크기를 함께 가져오므로 파일마다
+        isfile/getsize 를 따로 호출하지 않습니다. (Windows/SMB 에서는 항목 정보에
+        크기가 포함되어 추가 stat 왕복이 없음)
+        """
+        with os.scandir(path or self.current_path) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat_result = entry.stat()
+                    yield (entry.name, stat_result.st_size / (1024 * 1024), stat_result.st_mtime)
+                except OSError as e:
+                    logger.error(f"파일 정보 가져오기 오류: {entry.path}, 에러: {e}")
+
     def listing_files_capacity(self) -> list:
-        """파일 용량을 계산하는 함수 (멀티스레딩 지원)"""
+        """파일 용량을 계산하는 함수 (scan_mode 에 따라 scandir 단일 패스 또는 멀티스레딩)"""
+        if self.current_path and self.scan_mode == 'scandir':
+            try:
+                import time
+                start_time = time.time()
+                list_files = list(self.iter_directory_entries())
+                scan_time = time.time() - start_time
+                self.last_scan_timings = {
+                    'mode': 'scandir',
+                    'entries': len(list_files),
+                    'scan': scan_time,
+                    'stat': 0.0,
+                }
+                logger.info(f"✅ 파일 목록 읽기 완료 (scandir): {len(list_files)}개 파일 ({scan_time:.2f}초)")
+                return list_files
+            except Exception as e:
+                logger.error(f"파일 목록 읽기 오류: {e}")
+                return []
+        
         list_files = []
         if self.current_path:
             try:
@@ -893,13 +1282,18 @@ class CapacityFinder:
                 logger.info("🚀 멀티스레딩 파일 크기 분석 시작...")
                 size_start = time.time()
                 
-                # 네트워크 환경을 고려하여 스레드 수 조정 (너무 많으면 오히려 느려질 수 있음)
-                max_workers = min(20, len(file_paths))  # 최대 20개 스레드
+                # 동시 stat 수는 저장소 반응(지연/처리량)에 따라 제어기가 조절
+                # (네트워크 드라이브는 적게 시작해서 혼잡하지 않은 만큼만 늘림)
+                io_controller = get_io_controller(
+                    self.current_path, 'stat',
+                    initial=4 if is_network_path(self.current_path) else 8, max_limit=32
+                )
+                max_workers = min(io_controller.max_limit, len(file_paths))
                 
                 with ThreadPoolExecutor(max_workers=max_workers) as executor:
                     # 각 파일의 크기를 병렬로 가져오기
                     future_to_file = {
-                        executor.submit(self.get_file_size_info, file_path, file_name): file_name
+                        executor.submit(io_controller.run, self.get_file_size_info, file_path, file_name): file_name
                         for file_path, file_name in file_paths
                     }
                     
@@ -931,8 +1325,14 @@ class CapacityFinder:
                 logger.info(f"   📊 총 소요 시간: {total_time:.2f}초")
                 logger.info(f"   📁 파일 스캔: {scan_time:.2f}초")
                 logger.info(f"   🚀 크기 분석: {size_time:.2f}초")
-                logger.info(f"   ⚡ 속도 향상: {max_workers}개 스레드 사용")
+                logger.info(f"   ⚡ 동시 작업 수: {io_controller.limit} (최대 {max_workers}개 스레드)")
                 
+                self.last_scan_timings = {
+                    'mode': 'threadpool',
+                    'entries': len(file_paths),
+                    'scan': scan_time,
+                    'stat': size_time,
+                }
                 return list_files
                 
             except Exception as e:
@@ -963,89 +1363,272 @@ class CapacityFinder:
 
     def listing_files(self):
         """파일 목록을 가져와서 사용자별로 용량을 계산하는 함수 (멀티스레딩 지원)"""
+        if self.scan_mode == 'scandir':
+            return self._listing_files_streaming()
+        
         import time
         start_time = time.time()
         
+        self.last_scan_timings = {}
+        self.dir_signature = None
+        dir_mtime_ns = self._get_directory_mtime_ns()
         file_list = self.listing_files_capacity()
         
         if not file_list:
             return {}
         
+        if dir_mtime_ns is not None:
+            recent_since = time.time() - RECENT_WRITE_SECONDS
+            self._record_directory_signature(self.current_path, dir_mtime_ns, (file_info[0] for file_info in file_list),
+                                             [file_info[0] for file_info in file_list if file_info[2] >= recent_since])
+        
         parsing_start = time.time()
         logger.info(f"🔍 파일명 파싱 시작: {len(file_list)}개 파일")
         
         parsed_count = 0
         failed_files = []
         
-        # 파일 수가 많을 때만 멀티스레딩 사용 (적을 때는 오버헤드가 더 클 수 있음)
-        if len(file_list) > 100:
-            # 멀티스레딩으로 파일명 처리
-            max_workers = min(10, len(file_list))  # 파일명 처리는 CPU 작업이라 스레드 수 제한
-            
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_file = {
-                    executor.submit(self.process_file_name, file_info): file_info
-                    for file_info in file_list
-                }
-                
-                completed_count = 0
-                log_interval = max(1, len(file_list) // 10)  # 10% 간격으로 로그
-                
-                for future in as_completed(future_to_file):
-                    file_info = future_to_file[future]
-                    try:
-                        result = future.result()
-                        
-                        if result['success']:
-                            username = result['username']
-                            file_name = result['file_name']
-                            file_size = result['file_size']
-                            
-                            # 사용자별 용량 누적
-                            if username not in self.dic_files:
-                                self.dic_files[username] = {'total_size': 0.0, 'files': []}
-                            self.dic_files[username]['total_size'] += file_size
-                            self.dic_files[username]['files'].append({'name': file_name, 'size': file_size})
-                            parsed_count += 1
-                        else:
-                            failed_files.append(result['file_name'])
-                        
-                        completed_count += 1
-                        
-                        # 진행 상황 로그
-                        if completed_count % log_interval == 0 or completed_count == len(file_list):
-                            progress = (completed_count / len(file_list)) * 100
-                            elapsed = time.time() - parsing_start
-                            logger.info(f"🔍 파싱 진행률: {progress:.1f}% ({completed_count}/{len(file_list)}) - {elapsed:.1f}초")
-                    
-                    except Exception as e:
-                        logger.error(f"파일명 처리 실패: {file_info[0]}, 에러: {e}")
-                        failed_files.append(file_info[0])
-        
-        else:
-            # 단일스레드로 파일명 처리 (파일 수가 적을 때)
-            logger.info("📝 단일스레드 파일명 처리 (파일 수가 적음)")
-            for file_info in file_list:
-                file_name = file_info[0]
-                file_size = file_info[1]
-                
-                username = self.file_name_handle(file_name)
-                if username:
-                    # 사용자별 용량 누적
-                    if username not in self.dic_files:
-                        self.dic_files[username] = {'total_size': 0.0, 'files': []}
-                    self.dic_files[username]['total_size'] += file_size
-                    self.dic_files[username]['files'].append({'name': file_name, 'size': file_size})
-                    parsed_count += 1
-                else:
-                    failed_files.append(file_name)
+        # 파일명 파싱은 CPU 작업이라 스레드 대신, 파일 수가 충분히 많을 때만 프로세스 풀에서 청크 단위로 처리
+        names = [file_info[0] for file_info in file_list]
+        with self._create_name_parser() as name_parser:
+            parsed_fields = name_parser.parse(names)
+            parse_mode = name_parser.mode
+        logger.info(f"🔍 파일명 파싱 방식: {parse_mode}")
+        
+        for file_info, fields in zip(file_list, parsed_fields):
+            file_name = file_info[0]
+            file_size = file_info[1]
+            
+            if fields:
+                username, site, timestamp = fields
+                # 사용자별 용량 누적
+                if username not in self.dic_files:
+                    self.dic_files[username] = {'total_size': 0.0, 'files': []}
+                self.dic_files[username]['total_size'] += file_size
+                self.dic_files[username]['files'].append(FileRecord.from_index(file_name, file_size, site, timestamp))
+                parsed_count += 1
+            else:
+                failed_files.append(file_name)
+        self.invalidate_file_index()
         
         parsing_time = time.time() - parsing_start
         total_time = time.time() - start_time
         
+        self.last_scan_timings['parse'] = parsing_time
+        self.last_scan_timings['total'] = total_time
+        self._log_parse_summary(len(file_list), len(self.dic_files), parsed_count, failed_files, parsing_time, total_time)
+        
+        return self.dic_files
+
+    def _listing_files_streaming(self):
+        """scandir 파이프라인 결과를 바로 dic_files 에 합치는 동기 경로 (scan_mode == 'scandir')"""
+        if not self.current_path:
+            logger.warning("경로가 설정되지 않았습니다.")
+            return {}
+        
+        try:
+            for batch in self.iter_scan_batches():
+                self.merge_scan_batch(self.dic_files, batch['users'])
+        except Exception as e:
+            logger.error(f"파일 목록 읽기 오류: {e}")
+            return {}
+        finally:
+            self.invalidate_file_index()
+        
+        return self.dic_files
+
+    def iter_scan_batches(self, path=None, batch_size=2000, cancel_event=None):
+        """스캔 → 파싱 → 집계 제너레이터 파이프라인
+        
+        batch_size 개 파일마다 새로 발견된 부분 집계를 yield 합니다.
+            {'users': {username: {'total_size': float, 'files': [...]}},
+             'files_scanned': int, 'mb_accounted': float, 'elapsed': float}
+        끝까지 소비되면 스캔 인덱스, 디렉토리 시그니처, 단계별 소요 시간을 기록합니다.
+        cancel_event 가 설정되면 아무것도 기록하지 않고 중단합니다.
+        """
+        import time
+        start_time = time.time()
+        path = path or self.current_path
+        
+        logger.info(f"📁 파일 목록 스캔 시작 (scandir 스트리밍): {path}")
+        
+        state = {
+            'file_count': 0,
+            'parsed_count': 0,
+            'reused_count': 0,
+            'failed_files': [],
+            'parsing_time': 0.0,
+            'seen_names': set(),
+            'recent_since': time.time() - RECENT_WRITE_SECONDS,
+            'recent_names': [],
+            'index_upserts': [],
+            'cancelled': False,
+        }
+        
+        self.dir_signature = None
+        dir_mtime_ns = self._get_directory_mtime_ns(path)
+        
+        # 스캔 인덱스: 크기/수정시각이 같은 파일은 저장된 파싱 결과 재사용
+        indexed = self.scan_index.load_directory(path) if self.scan_index else {}
+        
+        records = self.iter_directory_entries(path)
+        parsed = self._parse_stage(records, indexed, state, cancel_event, window_size=batch_size)
+        
+        users = set()
+        mb_accounted = 0.0
+        batch = {}
+        batch_files = 0
+        for username, record in parsed:
+            user_batch = batch.get(username)
+            if user_batch is None:
+                user_batch = batch[username] = {'total_size': 0.0, 'files': []}
+            user_batch['total_size'] += record.size
+            user_batch['files'].append(record)
+            users.add(username)
+            mb_accounted += record.size
+            batch_files += 1
+            
+            if batch_files >= batch_size:
+                yield self._make_scan_batch(batch, state, mb_accounted, start_time)
+                batch = {}
+                batch_files = 0
+        
+        if state['cancelled']:
+            logger.info(f"⏹️ 스캔 취소됨: {state['file_count']}개 파일 처리 후 중단")
+            return
+        
+        if batch:
+            yield self._make_scan_batch(batch, state, mb_accounted, start_time)
+        
+        if dir_mtime_ns is not None:
+            self._record_directory_signature(path, dir_mtime_ns, state['seen_names'], state['recent_names'])
+        
+        if self.scan_index:
+            try:
+                removed_names = [name for name in indexed if name not in state['seen_names']]
+                self.scan_index.update_directory(path, state['index_upserts'], removed_names)
+            except Exception as e:
+                logger.error(f"스캔 인덱스 갱신 오류: {e}")
+        
+        total_time = time.time() - start_time
+        
+        # 스캔과 파싱이 섞여 진행되므로 스캔 시간은 전체에서 파싱 시간을 뺀 값
+        self.last_scan_timings = {
+            'mode': 'scandir',
+            'entries': state['file_count'],
+            'scan': max(0.0, total_time - state['parsing_time']),
+            'stat': 0.0,
+            'parse': state['parsing_time'],
+            'total': total_time,
+            'reused': state['reused_count'],
+        }
+        
+        if not state['file_count']:
+            return
+        
+        if indexed:
+            logger.info(f"🗂️ 스캔 인덱스 재사용: {state['reused_count']}개, 새로 파싱: {len(state['index_upserts'])}개")
+        
+        self._log_parse_summary(state['file_count'], len(users), state['parsed_count'],
+                                state['failed_files'], state['parsing_time'], total_time)
+
+    def _create_name_parser(self):
+        """파일명 파서 생성 (파일 수가 기준을 넘으면 프로세스 풀로 전환)"""
+        return AdaptiveNameParser(self.parse_file_name_fields, self.parse_workers, self.process_parse_threshold)
+
+    def _parse_stage(self, records, indexed, state, cancel_event=None, window_size=2000):
+        """파이프라인 파싱 단계: (파일명, 크기, 수정시각) → (사용자명, FileRecord)
+        
+        항목을 window_size 개씩 모아서 인덱스에 없는 파일명만 한 번에 파싱합니다.
+        (파일 수가 많아 프로세스 풀로 전환되면 더 큰 단위로 모읍니다)
+        파일명에서 얻는 메타데이터(사이트, 녹화 시각, 날짜)는 여기서 한 번만 레코드에 채웁니다.
+        """
+        with self._create_name_parser() as name_parser:
+            window = []
+            for record in records:
+                if cancel_event is not None and cancel_event.is_set():
+                    state['cancelled'] = True
+                    return
+                
+                window.append(record)
+                if len(window) >= name_parser.window_size(window_size):
+                    yield from self._parse_window(window, indexed, state, name_parser)
+                    window = []
+            
+            if window:
+                yield from self._parse_window(window, indexed, state, name_parser)
+
+    def _parse_window(self, window, indexed, state, name_parser):
+        """파싱 단계의 한 묶음 처리 - 인덱스 재사용 또는 새로 파싱"""
+        import time
+        parse_start = time.perf_counter()
+        
+        pending = []
+        for file_name, file_size, file_mtime in window:
+            cached = indexed.get(file_name)
+            if cached is None or cached[0] != file_size or cached[1] != file_mtime:
+                pending.append(file_name)
+        parsed_fields = dict(zip(pending, name_parser.parse(pending)))
+        
+        results = []
+        for file_name, file_size, file_mtime in window:
+            state['file_count'] += 1
+            state['seen_names'].add(file_name)
+            if file_mtime >= state['recent_since']:
+                state['recent_names'].append(file_name)
+            
+            if file_name in parsed_fields:
+                fields = parsed_fields[file_name]
+                username, site, timestamp = fields if fields else (None, None, None)
+                state['index_upserts'].append((file_name, file_size, file_mtime, username, site, timestamp))
+            else:
+                username, site, timestamp = indexed[file_name][2:5]
+                state['reused_count'] += 1
+            
+            if username:
+                state['parsed_count'] += 1
+                results.append((username, FileRecord.from_index(file_name, file_size, site, timestamp)))
+            else:
+                state['failed_files'].append(file_name)
+        
+        state['parsing_time'] += time.perf_counter() - parse_start
+        return results
+
+    @staticmethod
+    def _make_scan_batch(batch, state, mb_accounted, start_time):
+        """파이프라인 부분 집계 + 진행 통계"""
+        import time
+        return {
+            'users': batch,
+            'files_scanned': state['file_count'],
+            'mb_accounted': mb_accounted,
+            'elapsed': time.time() - start_time,
+        }
+
+    @staticmethod
+    def merge_scan_batch(target, users_batch):
+        """부분 집계를 사용자별 결과 dict 에 합치기"""
+        for username, user_batch in users_batch.items():
+            user_data = target.get(username)
+            if user_data is None:
+                user_data = target[username] = {'total_size': 0.0, 'files': []}
+            user_data['total_size'] += user_batch['total_size']
+            user_data['files'].extend(user_batch['files'])
+
+    def _get_directory_mtime_ns(self, path=None):
+        """디렉토리 수정시각 (ns) - 실패 시 None"""
+        path = path or self.current_path
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError as e:
+            logger.error(f"디렉토리 상태 확인 오류: {path}, 에러: {e}")
+            return None
+
+    def _log_parse_summary(self, file_count, user_count, parsed_count, failed_files, parsing_time, total_time):
+        """파일 분석 결과 요약 로그"""
         logger.info(f"✅ 파일 분석 완료:")
-        logger.info(f"   📁 총 파일: {len(file_list)}개")
-        logger.info(f"   👥 인식된 사용자: {len(self.dic_files)}명")
+        logger.info(f"   📁 총 파일: {file_count}개")
+        logger.info(f"   👥 인식된 사용자: {user_count}명")
         logger.info(f"   ✅ 성공적으로 파싱: {parsed_count}개")
         logger.info(f"   ❌ 파싱 실패: {len(failed_files)}개")
         logger.info(f"   ⏱️ 파싱 시간: {parsing_time:.3f}초")
@@ -1056,8 +1639,17 @@ class CapacityFinder:
             logger.warning(f"파싱 실패한 파일들: {failed_files}")
         elif failed_files:
             logger.warning(f"파싱 실패한 파일 {len(failed_files)}개 (일부): {failed_files[:5]}...")
-        
-        return self.dic_files
+
+    def _log_scan_timings(self):
+        """마지막 스캔의 단계별 소요 시간 로그 (scandir / threadpool 방식 비교용)"""
+        timings = self.last_scan_timings
+        if not timings:
+            return
+        logger.info(f"   🔎 스캔 방식: {timings.get('mode')} ({timings.get('entries', 0)}개 항목)")
+        logger.info(f"      📁 디렉토리 스캔: {timings.get('scan', 0.0):.2f}초")
+        if timings.get('mode') == 'threadpool':
+            logger.info(f"      🚀 크기 분석(stat): {timings.get('stat', 0.0):.2f}초")
+        logger.info(f"      🔍 파일명 파싱: {timings.get('parse', 0.0):.2f}초")
 
     def file_name_handle(self, file_name):
         """파일 이름을 처리해서 채널명만 반환하는 함수
@@ -1067,73 +1659,36 @@ class CapacityFinder:
         - 기타 조합
         예: instagram-john_doe-2025-06-26T15_09_46+09_00.txt -> john_doe 반환
         """
-        if not file_name:
-            return None
-            
-        try:
-            # 확장자 제거
-            name_without_ext = file_name.split('.')[0] if '.' in file_name else file_name
-            
-            # 날짜 패턴 찾기
-            date_match = self.date_pattern.search(name_without_ext)
-            if not date_match:
+        fields = self.parse_file_name_fields(file_name)
+        return fields[0] if fields else None
+
+    def parse_file_name_fields(self, file_name):
+        """파일 이름을 한 번에 파싱해서 (채널명, 사이트, 날짜 문자열)을 반환하는 함수
+        
+        Returns:
+            tuple: (channel_name, site, date_part) 또는 None
+        """
+        parsed = parse_filename(file_name)
+        if parsed is None:
+            if file_name:
                 logger.warning(f"날짜 패턴을 찾을 수 없음: {file_name}")
-                return None
-            
-            date_part = date_match.group()
-            date_start = date_match.start()
-            
-            # 날짜 이전 부분 추출
-            before_date = name_without_ext[:date_start].rstrip('-')
-            
-            # '-'로 분리
-            parts = before_date.split('-')
-            
-            if len(parts) < 2:
-                logger.warning(f"파일명 구조가 올바르지 않음: {file_name}")
-                return None
-            
-            # 사이트 찾기
-            site_part = None
-            channel_parts = []
-            
-            for i, part in enumerate(parts):
-                if SiteType.is_valid_site(part):
-                    site_part = part
-                    # 사이트가 아닌 나머지 부분들을 채널명으로 결합
-                    channel_parts = parts[:i] + parts[i+1:]
-                    break
-            
-            if not site_part:
-                logger.warning(f"알려진 사이트를 찾을 수 없음: {file_name}")
-                return None
-            
-            if not channel_parts:
-                logger.warning(f"채널명을 찾을 수 없음: {file_name}")
-                return None
-            
-            # 채널명 결합 (여러 부분이 있을 경우 '-'로 다시 결합)
-            channel_name = '-'.join(channel_parts)
-            
-            logger.debug(f"파일명 처리 완료: {file_name} -> 사이트: {site_part}, 채널: {channel_name}, 날짜: {date_part}")
-            return channel_name
-                    
-        except Exception as e:
-            logger.error(f"파일명 처리 중 오류: {file_name}, 에러: {e}")
             return None
 
+        if not parsed.site:
+            logger.warning(f"알려진 사이트를 찾을 수 없음: {file_name}")
+            return None
+
+        if not parsed.channel:
+            logger.warning(f"채널명을 찾을 수 없음: {file_name}")
+            return None
+
+        logger.debug(f"파일명 처리 완료: {file_name} -> 사이트: {parsed.site}, 채널: {parsed.channel}, 날짜: {parsed.date_part}")
+        return parsed.channel, parsed.site, parsed.date_part
+
     def extract_date_from_filename(self, file_name):
-        """파일명에서 날짜 추출"""
-        try:
-            date_match = self.date_pattern.search(file_name)
-            if date_match:
-                date_str = date_match.group()
-                # 2025-06-26T15_09_46+09_00 -> datetime 변환
-                file_date = datetime.fromisoformat(date_str.replace('_', ':'))
-                return file_date
-        except Exception as e:
-            logger.error(f"날짜 추출 오류: {file_name}, 에러: {e}")
-        return None
+        """파일명에서 날짜 추출 (파서 캐시 사용)"""
+        parsed = parse_filename(file_name)
+        return parsed.date_time if parsed else None
 
     def select_representative_samples(self, files):
         """더 대표성 있는 샘플 선택"""
@@ -1142,18 +1697,13 @@ class CapacityFinder:
         
         samples = []
         
-        # 파일들을 날짜순으로 정렬
-        files_with_dates = []
-        for file_info in files:
-            file_date = self.extract_date_from_filename(file_info['name'])
-            if file_date:
-                files_with_dates.append({'file': file_info, 'date': file_date})
+        # 파일들을 날짜순으로 정렬 (스캔 시 채워둔 epoch 사용)
+        sorted_files = [file_info for file_info in files if file_info.epoch is not None]
         
-        if not files_with_dates:
+        if not sorted_files:
             return files[:5]  # 날짜 추출 실패시 첫 5개
         
-        files_with_dates.sort(key=lambda x: x['date'])
-        sorted_files = [item['file'] for item in files_with_dates]
+        sorted_files.sort(key=lambda f: f.epoch)
         
         # 1. 가장 최근 파일
         samples.append(sorted_files[-1])
@@ -1234,8 +1784,8 @@ class CapacityFinder:
             file_name = file_info['name']
             file_size = file_info['size']
             
-            # 파일명에서 사이트와 날짜 추출
-            site, date_str = self.extract_site_and_date(file_name)
+            # 스캔 시 파싱해둔 사이트와 날짜
+            site, date_str = file_info.site, file_info.day
             if not site or not date_str:
                 continue
             
@@ -1312,42 +1862,10 @@ class CapacityFinder:
         Returns:
             tuple: (site, date_str) 또는 (None, None)
         """
-        if not file_name:
-            return None, None
-            
-        try:
-            # 확장자 제거
-            name_without_ext = file_name.split('.')[0] if '.' in file_name else file_name
-            
-            # 날짜 패턴 찾기
-            date_match = self.date_pattern.search(name_without_ext)
-            if not date_match:
-                return None, None
-            
-            date_part = date_match.group()
-            date_start = date_match.start()
-            
-            # 날짜 이전 부분 추출
-            before_date = name_without_ext[:date_start].rstrip('-')
-            
-            # '-'로 분리
-            parts = before_date.split('-')
-            
-            if len(parts) < 2:
-                return None, None
-            
-            # 사이트 찾기
-            for part in parts:
-                if SiteType.is_valid_site(part):
-                    # 날짜에서 시간 부분만 추출해서 날짜로 변환 (2025-06-26 형식)
-                    date_only = date_part.split('T')[0] if 'T' in date_part else date_part
-                    return part, date_only
-            
-            return None, None
-                    
-        except Exception as e:
-            logger.error(f"사이트/날짜 추출 중 오류: {file_name}, 에러: {e}")
+        parsed = parse_filename(file_name)
+        if parsed is None or not parsed.site:
             return None, None
+        return parsed.site, parsed.day
 
     def get_available_users(self):
         """분석된 사용자 목록 반환"""
@@ -1355,12 +1873,46 @@ class CapacityFinder:
             return []
         return list(self.dic_files.keys())
 
-    def calculate_file_score(self, file_info, user_files):
+    def get_user_stats(self, username):
+        """사용자 파일 통계 (캐시 사용, 사용자 파일이 바뀌었으면 다시 계산)
+        
+        Returns:
+            UserFileStats 또는 None (없는 사용자)
+        """
+        user_data = self.dic_files.get(username)
+        if not user_data:
+            return None
+        
+        files = user_data['files']
+        cached = self._user_stats.get(username)
+        if cached is not None and cached[0] is files and cached[1] == len(files):
+            return cached[2]
+        
+        stats = UserFileStats(files)
+        self._user_stats[username] = (files, len(files), stats)
+        return stats
+    
+    def invalidate_user_stats(self, username=None):
+        """사용자 통계 캐시 무효화 (username 이 None 이면 전체)"""
+        if username is None:
+            self._user_stats.clear()
+        else:
+            self._user_stats.pop(username, None)
+    
+    def _stats_for_files(self, user_files):
+        """파일 목록에 해당하는 통계 - dic_files 의 목록이면 캐시 사용"""
+        for username, user_data in self.dic_files.items():
+            if user_data['files'] is user_files:
+                return self.get_user_stats(username)
+        return UserFileStats(user_files)
+
+    def calculate_file_score(self, file_info, user_files, stats=None):
         """파일의 메타데이터 기반 점수 계산
         
         Args:
             file_info: 개별 파일 정보
             user_files: 해당 사용자의 전체 파일 목록
+            stats: user_files 의 UserFileStats (없으면 캐시에서 찾거나 계산)
             
         Returns:
             float: 0.0 ~ 1.0 사이의 점수
@@ -1374,11 +1926,13 @@ class CapacityFinder:
         date_score = 0.0
         
         try:
+            if stats is None:
+                stats = self._stats_for_files(user_files)
+            min_size = stats.min_size
+            max_size = stats.max_size
+            
             # 1. 파일 크기 점수 (60% 가중치) - 증가
-            all_sizes = [f['size'] for f in user_files]
-            if all_sizes:
-                max_size = max(all_sizes)
-                min_size = min(all_sizes)
+            if stats.file_count:
                 if max_size > min_size:
                     # 크기 점수를 더 관대하게 계산 (상위 30% 이상이면 0.8+ 점수)
                     normalized_score = (file_size - min_size) / (max_size - min_size)
@@ -1388,14 +1942,10 @@ class CapacityFinder:
                     size_score = 1.0
             
             # 2. 희귀성 점수 (25% 가중치) - 증가
-            file_date = self.extract_date_from_filename(file_name)
+            file_date = file_info.date_time
             if file_date:
                 # 같은 날짜의 파일 수가 적을수록 희귀함
-                same_date_count = 0
-                for f in user_files:
-                    f_date = self.extract_date_from_filename(f['name'])
-                    if f_date and f_date.date() == file_date.date():
-                        same_date_count += 1
+                same_date_count = stats.same_day_count(file_info)
                 
                 if same_date_count <= 1:
                     rarity_score = 1.0
@@ -1413,16 +1963,9 @@ class CapacityFinder:
             
             # 3. 날짜 점수 (15% 가중치) - 증가, 최근일수록 높은 점수
             if file_date:
-                all_dates = []
-                for f in user_files:
-                    f_date = self.extract_date_from_filename(f['name'])
-                    if f_date:
-                        all_dates.append(f_date)
-                
-                if all_dates:
-                    all_dates.sort()
-                    oldest = all_dates[0]
-                    newest = all_dates[-1]
+                if stats.oldest is not None:
+                    oldest = stats.oldest
+                    newest = stats.newest
                     
                     if newest > oldest:
                         total_days = (newest - oldest).days
@@ -1444,8 +1987,8 @@ class CapacityFinder:
         final_score = (size_score * 0.6 + rarity_score * 0.25 + date_score * 0.15)
         
         # 추가 보너스: 매우 큰 파일에게 보너스 점수
-        if all_sizes:
-            size_percentile = (file_size - min(all_sizes)) / (max(all_sizes) - min(all_sizes)) if max(all_sizes) > min(all_sizes) else 1.0
+        if stats.file_count:
+            size_percentile = (file_size - min_size) / (max_size - min_size) if max_size > min_size else 1.0
             if size_percentile >= 0.9:  # 상위 10% 크기
                 final_score = min(final_score + 0.1, 1.0)
             elif size_percentile >= 0.8:  # 상위 20% 크기
@@ -1466,11 +2009,12 @@ class CapacityFinder:
             return []
         
         user_files = self.dic_files[username]['files']
+        stats = self.get_user_stats(username)
         
-        # 각 파일에 점수 추가
+        # 각 파일에 점수 추가 (사용자 통계는 한 번만 계산)
         files_with_scores = []
         for file_info in user_files:
-            score = self.calculate_file_score(file_info, user_files)
+            score = self.calculate_file_score(file_info, user_files, stats)
             files_with_scores.append({
                 'name': file_info['name'],
                 'size': file_info['size'],
@@ -1508,17 +2052,16 @@ class CapacityFinder:
         user_data = self.dic_files[username]
         files = user_data['files']
         
-        # 지능형 복합 점수를 사용한 파일 분석
+        # 지능형 복합 점수를 사용한 파일 분석 (파일점수 + 레이팅점수, 사용자 단위 배치 계산)
+        composite, file_scores, rating_score = self.intelligent_system.score_user_files(username, files)
         files_with_scores = []
-        for file_info in files:
-            # 지능형 시스템의 복합 점수 계산 (파일점수 + 레이팅점수)
-            score_data = self.intelligent_system.calculate_composite_score(username, file_info, files)
+        for file_info, composite_score, file_score in zip(files, composite, file_scores):
             files_with_scores.append({
                 'name': file_info['name'],
                 'size': file_info['size'],
-                'score': score_data['composite_score'],  # 복합 점수 사용
-                'file_score': score_data['file_score'],
-                'rating_score': score_data['rating_score'],
+                'score': composite_score,  # 복합 점수 사용
+                'file_score': file_score,
+                'rating_score': rating_score,
                 'rank': 0  # 나중에 설정
             })
         
@@ -1547,12 +2090,17 @@ class CapacityFinder:
     
     # === 지능형 큐레이션 시스템 통합 메서드들 ===
     
-    def get_intelligent_deletion_analysis(self, target_savings_gb=10):
-        """지능형 삭제 분석 - 레이팅 기반 자동 추천"""
+    def get_intelligent_deletion_analysis(self, target_savings_gb=10, mode='threshold', selector=None):
+        """지능형 삭제 분석 - 레이팅 기반 자동 추천
+        
+        Args:
+            mode: 'threshold' 또는 'knapsack'
+            selector: intelligent_system.build_deletion_selector 결과 (목표만 바꿔 재분석할 때 재사용)
+        """
         logger.info(f"🧠 지능형 삭제 분석 시작 (목표: {target_savings_gb}GB 절약)")
         
         # 자동 삭제 추천
-        suggestions = self.intelligent_system.get_auto_deletion_suggestions(self, target_savings_gb)
+        suggestions = self.intelligent_system.get_auto_deletion_suggestions(self, target_savings_gb, mode, selector)
         
         # 사용자별 정리 전략 분석
         user_strategies = {}
@@ -1588,16 +2136,16 @@ class CapacityFinder:
         user_data = self.dic_files[username]
         files = user_data['files']
         
-        # 각 파일의 복합 점수 계산
+        # 각 파일의 복합 점수 계산 (사용자 단위 배치)
+        composite, file_scores, rating_score = self.intelligent_system.score_user_files(username, files)
         scored_files = []
-        for file_info in files:
-            score_data = self.intelligent_system.calculate_composite_score(username, file_info, files)
+        for file_info, composite_score, file_score in zip(files, composite, file_scores):
             scored_files.append({
                 'name': file_info['name'],
                 'size': file_info['size'],
-                'composite_score': score_data['composite_score'],
-                'file_score': score_data['file_score'],
-                'rating_score': score_data['rating_score']
+                'composite_score': composite_score,
+                'file_score': file_score,
+                'rating_score': rating_score
             })
         
         # 점수별 정렬
@@ -1633,23 +2181,16 @@ class CapacityFinder:
         """
         logger.info(f"🎯 우선순위 삭제 리스트 생성 (상위 {count_limit}개, 균등모드: {balanced_mode})")
         
-        priority_list = self.intelligent_system.get_deletion_priority_list(self)
-        
         if balanced_mode:
             # 균등 분배 모드: 각 사용자별로 골고루 선택
+            priority_list = self.intelligent_system.get_deletion_priority_list(self)
             top_priorities = self._get_balanced_priority_list(priority_list, count_limit)
         else:
-            # 기본 모드: 점수 낮은 순으로 상위 N개
-            top_priorities = priority_list[:count_limit]
+            # 기본 모드: 라이브러리 전체에서 점수 낮은 순으로 상위 N개 (전체 정렬 없이 힙으로 선택)
+            top_priorities = self.intelligent_system.get_lowest_scored_files(self, count_limit)
         
         # 사용자별 통계
-        user_stats = {}
-        for file_data in top_priorities:
-            username = file_data['username']
-            if username not in user_stats:
-                user_stats[username] = {'count': 0, 'size': 0}
-            user_stats[username]['count'] += 1
-            user_stats[username]['size'] += file_data['size']
+        user_stats = summarize_by_user(top_priorities)
         
         total_savings = sum(f['size'] for f in top_priorities)
         
@@ -1663,59 +2204,27 @@ class CapacityFinder:
     
     def _get_balanced_priority_list(self, priority_list, count_limit):
         """균등 분배 방식으로 우선순위 리스트 생성"""
-        # 사용자별로 파일 그룹화
+        # 사용자별로 파일 그룹화 (사용자 안에서는 이미 점수 낮은 순)
         user_files = {}
         for file_data in priority_list:
-            username = file_data['username']
-            if username not in user_files:
-                user_files[username] = []
-            user_files[username].append(file_data)
+            user_files.setdefault(file_data['username'], []).append(file_data)
         
         total_users = len(user_files)
-        if total_users == 0:
+        if total_users == 0 or count_limit <= 0:
             return []
         
-        # 사용자별 기본 할당량 계산
+        # 사용자별 기본 할당량 + 최대 10개 추가까지 허용
         base_per_user = max(1, count_limit // total_users)  # 최소 1개씩
-        remaining = count_limit - (base_per_user * total_users)
-        
-        balanced_list = []
-        user_counts = {}
-        
-        # 1단계: 각 사용자별로 기본 할당량만큼 선택
-        for username, files in user_files.items():
-            selected_count = min(base_per_user, len(files))
-            balanced_list.extend(files[:selected_count])
-            user_counts[username] = selected_count
-        
-        # 2단계: 남은 슬롯을 파일이 많은 사용자 순으로 배분
-        if remaining > 0:
-            # 사용자별 남은 파일 수 계산
-            remaining_files = []
-            for username, files in user_files.items():
-                used_count = user_counts[username]
-                if used_count < len(files):
-                    # (남은 파일 수, 사용자명, 파일 리스트)
-                    remaining_files.append((len(files) - used_count, username, files[used_count:]))
-            
-            # 남은 파일이 많은 사용자 순으로 정렬
-            remaining_files.sort(key=lambda x: x[0], reverse=True)
-            
-            # 남은 슬롯 배분
-            for remaining_count, username, files in remaining_files:
-                if remaining <= 0:
-                    break
-                
-                additional = min(remaining, remaining_count, 10)  # 한 사용자당 최대 10개 추가
-                balanced_list.extend(files[:additional])
-                remaining -= additional
+        caps = {username: base_per_user + 10 for username in user_files}
         
-        # 최종적으로 점수순으로 정렬
+        # 라운드 로빈으로 count_limit 개만 꺼낸 뒤 그 안에서만 점수순 정렬
+        allocator = FairShareAllocator(user_files, caps)
+        balanced_list = list(itertools.islice(allocator, count_limit))
         balanced_list.sort(key=lambda x: x['composite_score'])
         
-        logger.info(f"균등 분배 완료: {len(balanced_list)}개 파일, {len(user_counts)}명 사용자")
+        logger.info(f"균등 분배 완료: {len(balanced_list)}개 파일, {len(allocator.selected_counts)}명 사용자")
         
-        return balanced_list[:count_limit]
+        return balanced_list
     
     def execute_intelligent_cleanup(self, analysis_result, confirm_callback=None):
         """지능형 정리 실행"""
@@ -1732,72 +2241,136 @@ class CapacityFinder:
                 return False
         
         # 파일 삭제 실행
-        deleted_files = []
-        deleted_size = 0
-        
-        for file_data in suggested_files:
-            file_path = os.path.join(self.current_path, file_data['name'])
-            
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    deleted_files.append(file_data)
-                    deleted_size += file_data['size']
-                    logger.debug(f"삭제 완료: {file_data['name']}")
-                else:
-                    logger.warning(f"파일을 찾을 수 없음: {file_path}")
-            except Exception as e:
-                logger.error(f"파일 삭제 오류: {file_path}, 에러: {e}")
+        result = self.delete_files(suggested_files)
+        deleted_size_gb = result['deleted_size'] / 1024
         
-        # 🔥 중요: 삭제된 파일들을 메모리에서도 제거
-        self._remove_deleted_files_from_memory(deleted_files)
-        
-        # 삭제 결과 통계
-        deleted_size_gb = deleted_size / 1024
-        logger.info(f"🎯 지능형 정리 완료: {len(deleted_files)}개 파일, {deleted_size_gb:.2f}GB 절약")
+        logger.info(f"🎯 지능형 정리 완료: {result['deleted_count']}개 파일, {deleted_size_gb:.2f}GB 절약")
         logger.info(f"🧠 메모리 데이터도 동기화 완료")
         
         return {
-            'deleted_files': deleted_files,
-            'deleted_count': len(deleted_files),
+            'deleted_files': result['deleted_files'],
+            'deleted_count': result['deleted_count'],
             'deleted_size_gb': deleted_size_gb,
             'success': True
         }
     
-    def _remove_deleted_files_from_memory(self, deleted_files):
-        """삭제된 파일들을 메모리 데이터에서 제거"""
-        deleted_filenames = {file_data['name'] for file_data in deleted_files}
+    def delete_files(self, files, progress=None, cancel_event=None):
+        """현재 경로의 파일들을 삭제 엔진으로 삭제하고 메모리 데이터 동기화 (호출한 스레드에서 대기)
         
-        for username, user_data in self.dic_files.items():
-            # 삭제되지 않은 파일들만 남기기
-            remaining_files = []
-            removed_size = 0
-            
-            for file_info in user_data['files']:
-                if file_info['name'] in deleted_filenames:
-                    removed_size += file_info['size']
-                    logger.debug(f"메모리에서 제거: {username} - {file_info['name']}")
-                else:
-                    remaining_files.append(file_info)
-            
-            # 사용자 데이터 업데이트
-            user_data['files'] = remaining_files
-            user_data['total_size'] -= removed_size
-            
-            # 파일이 모두 삭제된 사용자는 dic_files에서 제거
-            if not remaining_files:
-                logger.info(f"사용자 '{username}' 모든 파일 삭제됨 - 사용자 데이터 제거")
+        GUI 에서는 삭제 직전 directory_mtime_before_change() 값을 받아두고
+        background_workers.run_deletion_with_progress 로 워커 스레드에서 삭제한 뒤
+        apply_deletion_result 를 호출한다.
+        
+        Returns:
+            dict: DeletionEngine.run 결과
+        """
+        mtime_before = self.directory_mtime_before_change()
+        result = self.deletion_engine.run(self.current_path, files, progress=progress, cancel_event=cancel_event,
+                                          quarantine=self.deletion_quarantine())
+        self.apply_deletion_result(result, mtime_before)
+        return result
+    
+    # === 휴지통 ===
+    
+    def get_quarantine(self):
+        """현재 경로의 휴지통 (경로가 없으면 None)"""
+        if not self.current_path:
+            return None
+        if self._quarantine is None or self._quarantine.dir_path != self.current_path:
+            self._quarantine = Quarantine(self.current_path)
+        return self._quarantine
+    
+    def deletion_quarantine(self):
+        """정리 도구 삭제에 사용할 휴지통 (휴지통 모드가 꺼져 있으면 None - 바로 삭제)"""
+        return self.get_quarantine() if self.use_quarantine else None
+    
+    def deletion_warning_text(self):
+        """삭제 확인 대화상자에 표시할 안내 문구 (휴지통 모드 여부에 따라)"""
+        if self.use_quarantine and self.current_path:
+            return ("♻️ 파일은 휴지통으로 이동되며, 휴지통 관리에서 되돌릴 수 있습니다.\n"
+                    "   (휴지통이 비워지기 전까지는 디스크 공간이 확보되지 않습니다)")
+        return "⚠️ 이 작업은 되돌릴 수 없습니다!"
+    
+    def start_quarantine_purger(self):
+        """현재 경로의 휴지통 자동 비우기 시작 (이전 경로의 비우기는 종료)"""
+        quarantine = self.get_quarantine()
+        if self.quarantine_purger and self.quarantine_purger.quarantine is quarantine:
+            return
+        self.stop_quarantine_purger()
+        if quarantine is not None:
+            self.quarantine_purger = QuarantinePurger(quarantine, self.deletion_engine)
+            self.quarantine_purger.start()
+    
+    def stop_quarantine_purger(self):
+        """휴지통 자동 비우기 종료"""
+        if self.quarantine_purger:
+            self.quarantine_purger.stop()
+            self.quarantine_purger = None
+    
+    def restore_quarantined_files(self, names):
+        """휴지통 파일을 되돌리고 메모리 데이터에 다시 추가 (메인 스레드에서 호출)
+        
+        Returns:
+            tuple: (Quarantine.restore 결과, 변경된 사용자명 set)
+        """
+        quarantine = self.get_quarantine()
+        if quarantine is None:
+            return {'restored': [], 'conflicts': list(names), 'missing': []}, set()
+        
+        mtime_before = self.directory_mtime_before_change()
+        result = quarantine.restore(names)
+        changed_users = set()
+        added_names = []
+        for file_info in result['restored']:
+            username = self.file_name_handle(file_info['name'])
+            if not username:
+                continue
+            if self._upsert_file_entry(username, file_info['name'], file_info['size']):
+                added_names.append(file_info['name'])
+            changed_users.add(username)
+        self._refresh_directory_signature([], added_names, mtime_before)
+        return result, changed_users
+    
+    def apply_deletion_result(self, result, mtime_before=None):
+        """삭제 엔진 결과를 메모리 데이터에 반영 (메인 스레드에서 호출)
+        
+        이미 없던 파일도 디스크에 없으므로 함께 제거
+        
+        Args:
+            result: DeletionEngine.run 결과
+            mtime_before: 삭제 직전 directory_mtime_before_change() 값 (없으면 디렉토리 시그니처 폐기)
+        
+        Returns:
+            set: 파일이 제거된 사용자명 (트리 부분 갱신용)
+        """
+        removed_files = result['deleted_files'] + result['missing_files']
+        if not removed_files:
+            return set()
+        return set(self._remove_deleted_files_from_memory(removed_files, mtime_before))
+    
+    def _remove_deleted_files_from_memory(self, deleted_files, mtime_before=None):
+        """삭제된 파일들을 메모리 데이터에서 제거 (파일명 색인으로 해당 사용자만 갱신)"""
+        removed_by_user = self._remove_file_entries(file_data['name'] for file_data in deleted_files)
+        
+        # 실제로 메모리에 있던 파일 (감시기가 먼저 반영한 파일 제외)
+        removed_names = [file_name for names in removed_by_user.values() for file_name in names]
+        for username, names in removed_by_user.items():
+            logger.debug(f"메모리에서 제거: {username} - {len(names)}개 파일")
         
-        # 빈 사용자 데이터 제거
-        empty_users = [username for username, user_data in self.dic_files.items() if not user_data['files']]
-        for username in empty_users:
-            del self.dic_files[username]
-            logger.info(f"빈 사용자 데이터 제거: {username}")
+        # 직접 삭제한 만큼 디렉토리 시그니처 갱신 (다음 재탐색은 stat 1회)
+        self._refresh_directory_signature(removed_names, mtime_before=mtime_before)
         
-        logger.info(f"🔄 메모리 동기화 완료: {len(deleted_files)}개 파일 제거")
+        logger.info(f"🔄 메모리 동기화 완료: {len(removed_names)}개 파일 제거")
+        return removed_by_user
 
 def main():
     """메인 함수에서 GUI 애플리케이션을 실행합니다."""
+    multiprocessing.freeze_support()  # 패키징된 실행 파일에서 파싱 워커 프로세스 지원
+    
+    # GUI 모듈은 여기서만 로드 (헤드리스 CLI 는 PyQt5 없이 CapacityFinder 사용)
+    from PyQt5.QtWidgets import QApplication
+    from gui import MainWindow
+    
     app = QApplication(sys.argv)
     
     # CapacityFinder 인스턴스 생성
@@ -1810,6 +2383,9 @@ def main():
     )
     finder.window.show()
     
+    # 이전 실행에서 중단된 삭제가 있으면 이어서 실행할지 확인
+    finder.window.resume_interrupted_deletions(finder.deletion_engine)
+    
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
@@ -0,0 +1,191 @@
+"""
+병렬 파일명 파싱 모듈
+
+파일명 파싱은 순수 파이썬 정규식/문자열 작업이라 스레드로는 GIL 때문에 빨라지지 않는다.
+파일 수가 충분히 많을 때만 파일명을 청크 단위로 묶어 프로세스 풀에 보내고,
+워커는 (채널명, 사이트, 날짜 문자열) 튜플만 돌려준다.
+
+프로세스를 쓸지 말지는 작은 보정 실행(직렬 파싱 속도, 풀 시작 시간, 왕복 비용 측정)으로
+정한 기준 파일 수로 결정하며, 보정 결과는 세션 동안 재사용한다.
+"""
+
+import os
+import sys
+import time
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from filename_parser import parse_names_chunk
+
+logger = logging.getLogger(__name__)
+
+# 이 수보다 적게 파싱하면 보정도 하지 않고 직렬 처리
+PROCESS_PARSE_MIN_FILES = 5000
+
+# 보정에 사용할 파일명 수
+CALIBRATION_SAMPLE_SIZE = 2000
+
+# 프로세스 풀 사용 중 한 번에 모아서 보내는 파일 수 (스트리밍 파이프라인용)
+PROCESS_WINDOW_SIZE = 20000
+
+# {워커 수: 기준 파일 수 또는 None(프로세스 사용 안 함)}
+_crossover_cache = {}
+
+
+class AdaptiveNameParser:
+    """직렬 파싱으로 시작해서, 누적 파싱 수가 보정된 기준을 넘으면 프로세스 풀로 전환하는 파서
+
+    with 문으로 사용하며, 블록을 벗어나면 프로세스 풀을 종료한다.
+    parse() 결과는 입력 순서대로 (채널명, 사이트, 날짜 문자열) 또는 None.
+    """
+
+    def __init__(self, serial_parse, workers=None, threshold='auto'):
+        """
+        Args:
+            serial_parse: 직렬 처리 시 파일명 하나를 파싱하는 함수 (필드 튜플 또는 None 반환)
+            workers: 프로세스 수 (None 이면 CPU 수)
+            threshold: 'auto' (보정), 정수 (고정 기준), None (프로세스 사용 안 함)
+        """
+        self.serial_parse = serial_parse
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self._pool = None
+        self._pool_failed = False
+        self._parsed_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def mode(self):
+        return 'process' if self._pool is not None else 'serial'
+
+    def window_size(self, serial_size):
+        """스트리밍 파이프라인에서 한 번에 모을 파일 수"""
+        return PROCESS_WINDOW_SIZE if self._pool is not None else serial_size
+
+    def parse(self, names):
+        """파일명 목록 파싱 (입력 순서 유지)"""
+        if not names:
+            return []
+
+        if self._pool is None and self._should_start_pool(len(names), names):
+            self._start_pool()
+
+        results = None
+        if self._pool is not None:
+            try:
+                results = self._parse_in_pool(names)
+            except Exception as e:
+                logger.error(f"프로세스 파싱 실패 - 직렬 파싱으로 전환: {e}")
+                self._pool_failed = True
+                self.close()
+
+        if results is None:
+            results = [self.serial_parse(name) for name in names]
+
+        self._parsed_count += len(names)
+        return results
+
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    # === 프로세스 풀 ===
+
+    def _should_start_pool(self, count, names):
+        if self.workers <= 1 or self.threshold is None or self._pool_failed:
+            return False
+        total = self._parsed_count + count
+        if total < PROCESS_PARSE_MIN_FILES:
+            return False
+
+        threshold = self.threshold
+        if threshold == 'auto':
+            if self.workers not in _crossover_cache:
+                # 보정 과정에서 띄운 풀은 이번 파싱에 그대로 사용
+                _crossover_cache[self.workers] = self._calibrate(names)
+                return self._pool is not None
+            threshold = _crossover_cache[self.workers]
+            if threshold is None:
+                return False
+        return total >= threshold
+
+    def _new_executor(self):
+        # Qt 스레드에서 fork 하지 않도록 spawn 사용 (Windows 와 동일한 동작)
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+    def _start_pool(self):
+        if self._pool is None:
+            self._pool = self._new_executor()
+            logger.info(f"⚙️ 프로세스 파싱 시작: {self.workers}개 프로세스")
+
+    def _chunk_size(self, count):
+        """워커당 여러 청크가 돌아가도록 나누되, 너무 잘게 쪼개지 않음"""
+        return max(1000, min(20000, count // (self.workers * 4) or 1))
+
+    def _parse_in_pool(self, names):
+        chunk_size = self._chunk_size(len(names))
+        chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+        results = []
+        for part in self._pool.map(parse_names_chunk, chunks):
+            # 프로세스 경계를 넘어온 문자열은 새 객체이므로 사용자명/사이트는 다시 intern
+            results.extend(
+                (sys.intern(fields[0]), sys.intern(fields[1]), fields[2]) if fields else None
+                for fields in part
+            )
+        return results
+
+    def _calibrate(self, names):
+        """직렬/프로세스 파싱 비용을 측정해서 프로세스 풀이 이득인 최소 파일 수 계산
+
+        프로세스가 이득이면 측정에 사용한 풀을 self._pool 로 남겨둔다.
+        Returns:
+            int 기준 파일 수 또는 None (프로세스 파싱이 이득이 아님)
+        """
+        sample = list(names[:CALIBRATION_SAMPLE_SIZE])
+
+        # 1. 직렬 파싱 비용 (캐시 없이)
+        start = time.perf_counter()
+        parse_names_chunk(sample)
+        per_name = (time.perf_counter() - start) / len(sample)
+
+        executor = self._new_executor()
+        try:
+            # 2. 풀 시작 비용 (워커 수만큼 빈 작업)
+            start = time.perf_counter()
+            list(executor.map(parse_names_chunk, [[] for _ in range(self.workers)]))
+            startup = time.perf_counter() - start
+
+            # 3. 청크 하나 왕복 비용에서 파싱 시간을 뺀 파일당 전송 비용
+            start = time.perf_counter()
+            executor.submit(parse_names_chunk, sample).result()
+            ipc_per_name = max(0.0, (time.perf_counter() - start) / len(sample) - per_name)
+        except Exception as e:
+            logger.error(f"프로세스 파싱 보정 실패 - 직렬 파싱 사용: {e}")
+            executor.shutdown(wait=False, cancel_futures=True)
+            return None
+
+        # N 개 파싱 시 직렬: N * per_name, 프로세스: startup + N * (per_name / workers + ipc)
+        gain_per_name = per_name * (1.0 - 1.0 / self.workers) - ipc_per_name
+        threshold = None
+        if gain_per_name > 0:
+            threshold = max(PROCESS_PARSE_MIN_FILES, int(startup / gain_per_name) + 1)
+
+        logger.info(f"⚙️ 프로세스 파싱 보정: 파일당 {per_name * 1e6:.1f}µs, 전송 {ipc_per_name * 1e6:.1f}µs, "
+                    f"시작 {startup:.2f}초, {self.workers}개 프로세스 → 기준 "
+                    f"{threshold if threshold else '사용 안 함'}")
+
+        if threshold is None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            # 시작 비용은 이미 치렀으므로 이번 파싱은 바로 프로세스 사용
+            self._pool = executor
+        return threshold
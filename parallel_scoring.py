@@ -0,0 +1,122 @@
+"""
+병렬 점수 계산 모듈
+
+라이브러리 전체 분석에서 사용자별 기본 파일 점수를 UI 스레드에서 한 명씩 계산하지 않고,
+사용자들을 파일 수가 고르게 나뉘도록 묶어 프로세스 풀에 보낸다.
+워커에는 사용자별 (파일명 목록, 크기 배열) 만 보내고, 점수는 float64 배열 바이트로 돌려받는다.
+결과는 요청한 사용자 순서대로 합치므로 워커 수/완료 순서와 관계없이 항상 같다.
+"""
+
+import os
+import time
+import logging
+import multiprocessing
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from scoring_engine import file_scores_basic
+
+logger = logging.getLogger(__name__)
+
+# 점수를 새로 계산할 파일이 이보다 적으면 프로세스를 쓰지 않고 직렬 계산
+PROCESS_SCORE_MIN_FILES = 100000
+
+# 워커당 청크 수 (사용자별 파일 수 편차로 생기는 대기 시간 완화)
+CHUNKS_PER_WORKER = 4
+
+
+def score_users_chunk(batch):
+    """워커 함수: [(username, 파일명 목록, 크기 배열 바이트), ...] → [(username, 점수 배열 바이트), ...]"""
+    results = []
+    for username, names, size_bytes in batch:
+        sizes = array('d')
+        sizes.frombytes(size_bytes)
+        results.append((username, array('d', file_scores_basic(sizes.tolist(), names)).tobytes()))
+    return results
+
+
+class ParallelScorer:
+    """사용자 단위로 기본 파일 점수를 계산하는 프로세스 풀 (풀은 처음 필요할 때 만들어 재사용)
+
+    with 문 또는 close() 로 풀을 종료한다.
+    """
+
+    def __init__(self, workers=None, min_files=PROCESS_SCORE_MIN_FILES):
+        """
+        Args:
+            workers: 프로세스 수 (None 이면 CPU 수)
+            min_files: 프로세스를 쓰기 시작하는 파일 수 (None 이면 항상 직렬)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.min_files = min_files
+        self._pool = None
+        self._pool_failed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def score(self, users):
+        """사용자별 기본 파일 점수 계산
+
+        Args:
+            users: [(username, 파일명 목록, 크기 목록), ...]
+        Returns:
+            dict: {username: [점수, ...]} (users 순서)
+        """
+        total_files = sum(len(names) for _, names, _ in users)
+        if self._use_processes(total_files, len(users)):
+            try:
+                start = time.perf_counter()
+                result = self._score_in_pool(users)
+                logger.info(f"⚙️ 병렬 점수 계산: {len(users)}명, {total_files}개 파일, "
+                            f"{self.workers}개 프로세스, {time.perf_counter() - start:.2f}초")
+                return result
+            except Exception as e:
+                logger.error(f"병렬 점수 계산 실패 - 직렬 계산으로 전환: {e}")
+                self._pool_failed = True
+                self.close()
+
+        return {username: file_scores_basic(sizes, names) for username, names, sizes in users}
+
+    def _use_processes(self, total_files, user_count):
+        if self.workers <= 1 or self.min_files is None or self._pool_failed:
+            return False
+        return user_count > 1 and total_files >= self.min_files
+
+    def _partition(self, users):
+        """파일 수 기준으로 청크를 고르게 채움 (큰 사용자부터 가장 가벼운 청크에)"""
+        chunk_count = min(len(users), self.workers * CHUNKS_PER_WORKER)
+        chunks = [[] for _ in range(chunk_count)]
+        loads = [0] * chunk_count
+        for username, names, sizes in sorted(users, key=lambda user: len(user[1]), reverse=True):
+            index = loads.index(min(loads))
+            chunks[index].append((username, names, array('d', sizes).tobytes()))
+            loads[index] += len(names)
+        return chunks
+
+    def _score_in_pool(self, users):
+        if self._pool is None:
+            # Qt 스레드에서 fork 하지 않도록 spawn 사용 (Windows 와 동일한 동작)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context('spawn'))
+            logger.info(f"⚙️ 점수 계산 프로세스 풀 시작: {self.workers}개 프로세스")
+
+        scored = {}
+        for part in self._pool.map(score_users_chunk, self._partition(users)):
+            for username, score_bytes in part:
+                scores = array('d')
+                scores.frombytes(score_bytes)
+                scored[username] = scores.tolist()
+
+        # 완료 순서와 관계없이 요청 순서로 합침
+        return {username: scored[username] for username, _, _ in users}
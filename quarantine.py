@@ -0,0 +1,302 @@
+"""
+휴지통(격리) 모듈
+
+정리 도구에서 삭제한 파일을 바로 지우지 않고 같은 볼륨의 `.capacityfinder_trash` 폴더로
+이름만 바꿔 옮긴다. 이름 변경은 메타데이터 작업 하나이므로 NAS 가 블록을 해제하는 동안 기다리지 않고,
+휴지통 목록으로 되돌리기(복원)도 할 수 있다.
+
+휴지통 파일 목록은 휴지통 폴더의 manifest.json 에 {파일명: {'size', 'time', 'batch'}} 로 기록하고,
+실제로 지우는 일은 QuarantinePurger 가 백그라운드에서 한다.
+- 보관 기간이 지난 파일
+- 남은 공간이 기준 비율보다 적으면 오래된 파일부터 기준을 회복할 때까지
+"""
+
+import os
+import json
+import time
+import shutil
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+TRASH_DIR_NAME = '.capacityfinder_trash'
+MANIFEST_FILE = 'manifest.json'
+
+# 자동 비우기 기준
+DEFAULT_MAX_AGE_DAYS = 7
+DEFAULT_MIN_FREE_RATIO = 0.10   # 남은 공간이 전체의 10% 아래로 내려가면 오래된 것부터 비움
+DEFAULT_PURGE_INTERVAL = 600    # 초
+
+RECOVERED_BATCH = 'recovered'  # 목록에 없이 휴지통에 남아있던 파일 (기록 전 종료 등)
+
+
+class Quarantine:
+    """디렉토리 하나의 휴지통 (스레드 안전)
+
+    사용법:
+        quarantine = Quarantine(current_path)
+        quarantine.stash(file_name)              # 워커 스레드에서 파일 이동
+        quarantine.record(batch_id, moved_files)  # 이동한 파일 목록 기록
+        quarantine.restore(names)                 # 되돌리기
+    """
+
+    def __init__(self, dir_path):
+        self.dir_path = dir_path
+        self.trash_dir = os.path.join(dir_path, TRASH_DIR_NAME)
+        self.manifest_file = os.path.join(self.trash_dir, MANIFEST_FILE)
+        self._lock = threading.Lock()
+        self._entries = None  # 처음 필요할 때 읽음
+
+    # === 이동 / 기록 ===
+
+    def stash(self, file_name):
+        """파일을 휴지통으로 이동 (없는 파일이면 FileNotFoundError)"""
+        if not os.path.isdir(self.trash_dir):
+            os.makedirs(self.trash_dir, exist_ok=True)
+        os.replace(os.path.join(self.dir_path, file_name), os.path.join(self.trash_dir, file_name))
+
+    def record(self, batch_id, files, when=None):
+        """휴지통으로 옮긴 파일 기록 (삭제 배치 단위)"""
+        if not files:
+            return
+        when = time.time() if when is None else when
+        with self._lock:
+            entries = self._load()
+            for file_info in files:
+                entries[file_info['name']] = {'size': file_info['size'], 'time': when, 'batch': batch_id}
+            self._save()
+        logger.info(f"♻️ 휴지통으로 이동: {len(files)}개 파일 ({self.trash_dir})")
+
+    def forget(self, names):
+        """목록에서 제거 (완전히 삭제된 파일)"""
+        with self._lock:
+            entries = self._load()
+            for name in names:
+                entries.pop(name, None)
+            self._save()
+
+    # === 조회 ===
+
+    def items(self):
+        """휴지통 파일 목록 (오래된 순) - [{'name', 'size', 'time', 'batch'}, ...]"""
+        with self._lock:
+            entries = self._load()
+            items = [dict(entry, name=name) for name, entry in entries.items()]
+        items.sort(key=lambda item: item['time'])
+        return items
+
+    def sessions(self):
+        """삭제 배치(정리 작업)별 묶음 (최근 순) - 되돌리기 목록
+
+        Returns:
+            list: [{'batch', 'time', 'size', 'files': [{'name', 'size', 'time', 'batch'}, ...]}, ...]
+        """
+        sessions = {}
+        for item in self.items():
+            session = sessions.setdefault(item['batch'], {'batch': item['batch'], 'time': item['time'], 'size': 0.0, 'files': []})
+            session['files'].append(item)
+            session['size'] += item['size']
+            session['time'] = max(session['time'], item['time'])
+        return sorted(sessions.values(), key=lambda session: session['time'], reverse=True)
+
+    def total_size(self):
+        """휴지통 전체 크기 (MB)"""
+        return sum(item['size'] for item in self.items())
+
+    # === 되돌리기 ===
+
+    def restore(self, names):
+        """휴지통 파일을 원래 디렉토리로 되돌림
+
+        Returns:
+            dict: restored [{'name', 'size'}], conflicts [파일명] (같은 이름 파일이 이미 있음), missing [파일명]
+        """
+        result = {'restored': [], 'conflicts': [], 'missing': []}
+        with self._lock:
+            entries = self._load()
+            for name in names:
+                target = os.path.join(self.dir_path, name)
+                if os.path.exists(target):
+                    result['conflicts'].append(name)
+                    continue
+                try:
+                    os.replace(os.path.join(self.trash_dir, name), target)
+                except FileNotFoundError:
+                    result['missing'].append(name)
+                    entries.pop(name, None)
+                    continue
+                except OSError as e:
+                    logger.error(f"휴지통 복원 오류: {name}, 에러: {e}")
+                    result['conflicts'].append(name)
+                    continue
+                entry = entries.pop(name, None) or {}
+                result['restored'].append({'name': name, 'size': entry.get('size', 0.0)})
+            self._save()
+
+        logger.info(f"♻️ 휴지통 복원: {len(result['restored'])}개 파일"
+                    f"{', 충돌 ' + str(len(result['conflicts'])) + '개' if result['conflicts'] else ''}")
+        return result
+
+    # === 비우기 ===
+
+    def purge_candidates(self, max_age_days=DEFAULT_MAX_AGE_DAYS, min_free_ratio=DEFAULT_MIN_FREE_RATIO, now=None):
+        """자동으로 비울 파일 목록 (보관 기간 초과 + 남은 공간 부족 시 오래된 순)"""
+        items = self.items()
+        if not items:
+            return []
+
+        now = time.time() if now is None else now
+        cutoff = now - max_age_days * 86400 if max_age_days is not None else None
+        candidates = [item for item in items if cutoff is not None and item['time'] <= cutoff]
+
+        if min_free_ratio:
+            try:
+                usage = shutil.disk_usage(self.dir_path)
+            except OSError as e:
+                logger.error(f"남은 공간 확인 오류: {self.dir_path}, 에러: {e}")
+                return candidates
+            shortfall_mb = (usage.total * min_free_ratio - usage.free) / (1024 * 1024)
+            shortfall_mb -= sum(item['size'] for item in candidates)
+            for item in items[len(candidates):]:
+                if shortfall_mb <= 0:
+                    break
+                candidates.append(item)
+                shortfall_mb -= item['size']
+
+        return candidates
+
+    def purge(self, engine, files=None, progress=None, cancel_event=None):
+        """휴지통 파일 완전 삭제 (files 가 없으면 전체) - 삭제 엔진으로 병렬/저널 기록
+
+        Returns:
+            dict: DeletionEngine.run 결과
+        """
+        files = self.items() if files is None else list(files)
+        result = engine.run(self.trash_dir, files, progress=progress, cancel_event=cancel_event)
+        self.forget_purged(result)
+        return result
+
+    def forget_purged(self, result):
+        """휴지통 폴더를 대상으로 한 DeletionEngine.run 결과를 목록에 반영"""
+        self.forget([file_info['name'] for file_info in result['deleted_files'] + result['missing_files']])
+
+    # === manifest ===
+
+    def _load(self):
+        """manifest 읽기 + 실제 휴지통 내용과 맞춤 (잠금 안에서 호출)"""
+        if self._entries is not None:
+            return self._entries
+
+        entries = {}
+        if os.path.exists(self.manifest_file):
+            try:
+                with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"휴지통 목록 읽기 오류: {self.manifest_file}, 에러: {e}")
+
+        # 기록 전에 종료되어 목록에 없는 파일은 지금 들어온 것으로 취급, 사라진 파일은 목록에서 제거
+        present = {}
+        if os.path.isdir(self.trash_dir):
+            try:
+                with os.scandir(self.trash_dir) as scan:
+                    for entry in scan:
+                        if entry.name not in (MANIFEST_FILE, MANIFEST_FILE + '.tmp') and entry.is_file():
+                            present[entry.name] = entry.stat().st_size / (1024 * 1024)
+            except OSError as e:
+                logger.error(f"휴지통 확인 오류: {self.trash_dir}, 에러: {e}")
+                present = None
+
+        changed = False
+        if present is not None:
+            now = time.time()
+            changed = len(entries) != sum(1 for name in entries if name in present)
+            entries = {name: entry for name, entry in entries.items() if name in present}
+            for name, size in present.items():
+                if name not in entries:
+                    entries[name] = {'size': size, 'time': now, 'batch': RECOVERED_BATCH}
+                    changed = True
+
+        self._entries = entries
+        if changed:
+            self._save()  # 찾은 시각을 남겨둬야 보관 기간이 계산됨
+        return entries
+
+    def _save(self):
+        """manifest 저장 - 임시 파일에 쓴 뒤 교체 (잠금 안에서 호출)"""
+        if not os.path.isdir(self.trash_dir):
+            return
+        temp_file = self.manifest_file + '.tmp'
+        try:
+            # 잘못된 UTF-8 파일명(surrogate escape)도 저장할 수 있도록 ASCII 로 기록
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(temp_file, self.manifest_file)
+        except (OSError, ValueError) as e:
+            logger.error(f"휴지통 목록 저장 오류: {self.manifest_file}, 에러: {e}")
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
+
+
+class QuarantinePurger:
+    """휴지통을 주기적으로 비우는 백그라운드 스레드
+
+    보관 기간이 지났거나 남은 공간이 기준보다 적으면 삭제 엔진으로 휴지통 파일을 지운다.
+    """
+
+    def __init__(self, quarantine, engine, max_age_days=DEFAULT_MAX_AGE_DAYS,
+                 min_free_ratio=DEFAULT_MIN_FREE_RATIO, interval=DEFAULT_PURGE_INTERVAL):
+        self.quarantine = quarantine
+        self.engine = engine
+        self.max_age_days = max_age_days
+        self.min_free_ratio = min_free_ratio
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """비우기 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='QuarantinePurger', daemon=True)
+        self._thread.start()
+        logger.info(f"♻️ 휴지통 자동 비우기 시작: {self.quarantine.trash_dir}")
+
+    def stop(self):
+        """비우기 스레드 종료 (진행 중인 삭제는 시작한 파일까지만)"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5.0)
+        self._thread = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def purge_soon(self):
+        """다음 주기를 기다리지 않고 바로 확인 (정리 직후 등)"""
+        self._wake_event.set()
+
+    def purge_once(self):
+        """기준에 해당하는 휴지통 파일 한 번 비우기 - 지운 파일 수"""
+        candidates = self.quarantine.purge_candidates(self.max_age_days, self.min_free_ratio)
+        if not candidates:
+            return 0
+        logger.info(f"♻️ 휴지통 자동 비우기: {len(candidates)}개 파일 "
+                    f"({sum(item['size'] for item in candidates) / 1024:.2f}GB)")
+        result = self.quarantine.purge(self.engine, candidates, cancel_event=self._stop_event)
+        return result['deleted_count']
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.purge_once()
+            except Exception as e:
+                logger.error(f"휴지통 자동 비우기 오류: {self.quarantine.trash_dir}, 에러: {e}")
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
@@ -0,0 +1,178 @@
+from datetime import datetime
+import logging
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                             QTreeWidget, QTreeWidgetItem, QMessageBox, QAbstractItemView)
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+from background_workers import run_deletion_with_progress
+from quarantine import RECOVERED_BATCH
+
+logger = logging.getLogger(__name__)
+
+
+class QuarantineDialog(QDialog):
+    """휴지통 관리 다이얼로그 - 정리 작업별 되돌리기 / 완전 삭제
+
+    files_restored: 되돌린 파일의 사용자명 set (메인 트리 갱신용)
+    """
+
+    files_restored = pyqtSignal(object)
+
+    def __init__(self, capacity_finder, parent=None):
+        super().__init__(parent)
+        self.capacity_finder = capacity_finder
+        self.quarantine = capacity_finder.get_quarantine()
+
+        self.setWindowTitle("♻️ 휴지통 관리")
+        self.setGeometry(250, 250, 900, 600)
+        self.setModal(True)
+
+        self.init_ui()
+        self.refresh()
+
+    def init_ui(self):
+        """UI 초기화"""
+        layout = QVBoxLayout(self)
+
+        title_label = QLabel("♻️ 휴지통 (정리 작업별)")
+        title_font = QFont()
+        title_font.setPointSize(14)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        layout.addWidget(title_label)
+
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["정리 작업 / 파일명", "파일 수", "크기", "이동 시각"])
+        self.tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.tree.setColumnWidth(0, 480)
+        layout.addWidget(self.tree)
+
+        button_layout = QHBoxLayout()
+
+        self.restore_button = QPushButton("↩️ 선택 되돌리기")
+        self.restore_button.clicked.connect(self.restore_selected)
+        button_layout.addWidget(self.restore_button)
+
+        self.purge_button = QPushButton("🗑️ 선택 완전 삭제")
+        self.purge_button.clicked.connect(self.purge_selected)
+        button_layout.addWidget(self.purge_button)
+
+        self.purge_all_button = QPushButton("🧹 휴지통 비우기")
+        self.purge_all_button.clicked.connect(self.purge_all)
+        button_layout.addWidget(self.purge_all_button)
+
+        button_layout.addStretch()
+
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        """휴지통 목록 다시 표시"""
+        self.tree.clear()
+        sessions = self.quarantine.sessions()
+        format_size = self.capacity_finder.format_file_size
+
+        for session in sessions:
+            label = "🔎 휴지통에서 발견된 파일" if session['batch'] == RECOVERED_BATCH else "🧹 정리 작업"
+            session_item = QTreeWidgetItem([
+                label,
+                f"{len(session['files'])}개",
+                format_size(session['size']),
+                self._format_time(session['time']),
+            ])
+            session_item.setData(0, Qt.UserRole, [file_info['name'] for file_info in session['files']])
+            for file_info in session['files']:
+                file_item = QTreeWidgetItem([file_info['name'], '', format_size(file_info['size']),
+                                             self._format_time(file_info['time'])])
+                file_item.setData(0, Qt.UserRole, [file_info['name']])
+                session_item.addChild(file_item)
+            self.tree.addTopLevelItem(session_item)
+
+        if sessions:
+            self.tree.topLevelItem(0).setExpanded(True)
+
+        total_count = sum(len(session['files']) for session in sessions)
+        total_size = sum(session['size'] for session in sessions)
+        self.summary_label.setText(
+            f"📦 {total_count}개 파일, {format_size(total_size)} | 위치: {self.quarantine.trash_dir}\n"
+            f"⏱️ 보관 기간이 지나거나 남은 공간이 부족하면 오래된 파일부터 자동으로 비워집니다."
+        )
+
+        has_items = total_count > 0
+        self.restore_button.setEnabled(has_items)
+        self.purge_button.setEnabled(has_items)
+        self.purge_all_button.setEnabled(has_items)
+
+    def _format_time(self, timestamp):
+        return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+    def _selected_names(self):
+        """선택한 정리 작업/파일의 파일명 목록 (중복 제거, 선택 순서)"""
+        names = {}
+        for item in self.tree.selectedItems():
+            for name in item.data(0, Qt.UserRole) or []:
+                names[name] = True
+        return list(names)
+
+    def restore_selected(self):
+        """선택한 파일 되돌리기"""
+        names = self._selected_names()
+        if not names:
+            QMessageBox.warning(self, "선택 없음", "되돌릴 정리 작업이나 파일을 선택해주세요.")
+            return
+
+        result, changed_users = self.capacity_finder.restore_quarantined_files(names)
+        if changed_users:
+            self.files_restored.emit(changed_users)
+
+        msg = f"↩️ {len(result['restored'])}개 파일을 되돌렸습니다."
+        if result['conflicts']:
+            msg += f"\n\n⚠️ 같은 이름의 파일이 이미 있어 되돌리지 못한 파일: {len(result['conflicts'])}개"
+        if result['missing']:
+            msg += f"\n❓ 휴지통에 없던 파일: {len(result['missing'])}개"
+        QMessageBox.information(self, "되돌리기 완료", msg)
+        self.refresh()
+
+    def purge_selected(self):
+        """선택한 파일 완전 삭제"""
+        names = set(self._selected_names())
+        if not names:
+            QMessageBox.warning(self, "선택 없음", "삭제할 정리 작업이나 파일을 선택해주세요.")
+            return
+        self._purge([item for item in self.quarantine.items() if item['name'] in names])
+
+    def purge_all(self):
+        """휴지통 전체 비우기"""
+        self._purge(self.quarantine.items())
+
+    def _purge(self, files):
+        total_size = sum(file_info['size'] for file_info in files)
+        reply = QMessageBox.question(
+            self, "완전 삭제 확인",
+            f"🗑️ 휴지통의 {len(files)}개 파일({self.capacity_finder.format_file_size(total_size)})을 "
+            f"완전히 삭제하시겠습니까?\n\n⚠️ 이 작업은 되돌릴 수 없습니다!",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+
+        try:
+            result = run_deletion_with_progress(
+                self, self.capacity_finder.deletion_engine, self.quarantine.trash_dir, files, "휴지통 비우기"
+            )
+        except Exception as e:
+            logger.error(f"휴지통 비우기 오류: {e}")
+            QMessageBox.critical(self, "삭제 오류", f"휴지통 비우기 중 오류가 발생했습니다:\n{e}")
+            return
+
+        self.quarantine.forget_purged(result)
+        logger.info(f"♻️ 휴지통 비움: {result['deleted_count']}개 파일, {result['deleted_size'] / 1024:.2f}GB")
+        self.refresh()
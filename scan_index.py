@@ -0,0 +1,187 @@
+"""
+스캔 인덱스 모듈
+
+디렉토리별 파일의 크기/수정시각과 파싱 결과(사용자명, 사이트, 타임스탬프)를
+SQLite 파일(path_history.json 옆의 scan_index.db)에 저장해두고,
+재스캔 시 디렉토리 항목이 바뀐 파일만 다시 처리할 수 있게 해주는 모듈
+UTF-8 로 인코딩할 수 없는 파일명/경로는 os.fsencode 바이트(BLOB)로 저장한다.
+
+사용자별 기본 파일 점수도 같은 DB 에 (디렉토리, 사용자) 단위로 저장해서,
+파일 목록이 그대로인 사용자는 재시작 후에도 점수를 다시 계산하지 않는다.
+"""
+
+import os
+import sqlite3
+from array import array
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _db_text(value):
+    """SQLite 에 넣을 문자열 - 잘못된 UTF-8 파일명(surrogate escape)은 원래 바이트(BLOB)로 저장"""
+    if isinstance(value, str):
+        try:
+            value.encode('utf-8')
+        except UnicodeEncodeError:
+            return os.fsencode(value)
+    return value
+
+
+def _from_db_text(value):
+    """_db_text 로 저장한 값 복원 (BLOB 이면 파일명 문자열로)"""
+    return os.fsdecode(value) if isinstance(value, bytes) else value
+
+
+class ScanIndex:
+    """디렉토리별 파일 파싱 결과를 저장하는 영구 스캔 인덱스"""
+
+    def __init__(self, db_file="scan_index.db"):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        # 스캔은 백그라운드 스레드에서도 실행될 수 있으므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._create_tables()
+        logger.info(f"🗂️ 스캔 인덱스 열림: {db_file}")
+
+    def _create_tables(self):
+        """인덱스 테이블 생성"""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    dir_path TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    size REAL NOT NULL,
+                    mtime REAL NOT NULL,
+                    username TEXT,
+                    site TEXT,
+                    timestamp TEXT,
+                    PRIMARY KEY (dir_path, name)
+                ) WITHOUT ROWID
+            """)
+            # 사용자명만으로 키를 잡던 이전 점수 캐시는 버림 (캐시이므로 다시 계산하면 됨)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(user_scores)")]
+            if columns and 'dir_path' not in columns:
+                self._conn.execute("DROP TABLE user_scores")
+            # digest: 사용자 파일 목록(파일명/크기)과 점수 버전의 해시, scores: float64 배열 (파일 목록 순서)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_scores (
+                    dir_path TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    scores BLOB NOT NULL,
+                    PRIMARY KEY (dir_path, username)
+                ) WITHOUT ROWID
+            """)
+
+    @staticmethod
+    def normalize_dir(dir_path):
+        """인덱스 키로 사용할 디렉토리 경로 정규화"""
+        return os.path.abspath(dir_path)
+
+    def load_directory(self, dir_path):
+        """디렉토리의 인덱스 항목 로드
+
+        Returns:
+            dict: {name: (size, mtime, username, site, timestamp)}
+        """
+        key = _db_text(self.normalize_dir(dir_path))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, size, mtime, username, site, timestamp FROM files WHERE dir_path = ?",
+                (key,)
+            ).fetchall()
+        entries = {}
+        for name, size, mtime, username, site, timestamp in rows:
+            entries[_from_db_text(name)] = (size, mtime, _from_db_text(username), _from_db_text(site), timestamp)
+        return entries
+
+    def update_directory(self, dir_path, upserts, removed_names):
+        """변경된 항목만 인덱스에 반영 (한 트랜잭션)
+
+        Args:
+            dir_path: 디렉토리 경로
+            upserts: [(name, size, mtime, username, site, timestamp), ...] 새로 추가/변경된 항목
+            removed_names: 디렉토리에서 사라진 파일명들
+        """
+        if not upserts and not removed_names:
+            return
+
+        key = _db_text(self.normalize_dir(dir_path))
+        with self._lock, self._conn:
+            if removed_names:
+                self._conn.executemany(
+                    "DELETE FROM files WHERE dir_path = ? AND name = ?",
+                    ((key, _db_text(name)) for name in removed_names)
+                )
+            if upserts:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files (dir_path, name, size, mtime, username, site, timestamp) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    ((key,) + tuple(_db_text(value) for value in record) for record in upserts)
+                )
+        logger.info(f"🗂️ 스캔 인덱스 갱신: {len(upserts)}개 추가/변경, {len(removed_names)}개 제거")
+
+    def clear_directory(self, dir_path):
+        """디렉토리의 인덱스 항목 전체 삭제"""
+        key = _db_text(self.normalize_dir(dir_path))
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM files WHERE dir_path = ?", (key,))
+
+    def load_user_scores(self, dir_path):
+        """디렉토리에 저장된 사용자별 기본 파일 점수 전체 로드
+
+        Returns:
+            dict: {username: (digest, [score, ...])}
+        """
+        key = _db_text(self.normalize_dir(dir_path))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT username, digest, scores FROM user_scores WHERE dir_path = ?", (key,)
+            ).fetchall()
+        result = {}
+        for username, digest, blob in rows:
+            scores = array('d')
+            scores.frombytes(blob)
+            result[_from_db_text(username)] = (digest, scores.tolist())
+        return result
+
+    def save_user_scores(self, dir_path, entries):
+        """디렉토리의 사용자별 기본 파일 점수 저장 (한 트랜잭션)
+
+        Args:
+            entries: [(username, digest, [score, ...]), ...]
+        """
+        if not entries:
+            return
+        key = _db_text(self.normalize_dir(dir_path))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO user_scores (dir_path, username, digest, scores) VALUES (?, ?, ?, ?)",
+                ((key, _db_text(username), digest, array('d', scores).tobytes()) for username, digest, scores in entries)
+            )
+        logger.debug(f"🗂️ 점수 캐시 저장: {len(entries)}명")
+
+    def prune_user_scores(self, dir_path, usernames):
+        """디렉토리에 더 이상 없는 사용자의 점수 삭제 - 삭제한 사용자 수"""
+        key = _db_text(self.normalize_dir(dir_path))
+        keep = {_db_text(username) for username in usernames}
+        with self._lock, self._conn:
+            stale = [
+                row[0] for row in self._conn.execute("SELECT username FROM user_scores WHERE dir_path = ?", (key,))
+                if row[0] not in keep
+            ]
+            if stale:
+                self._conn.executemany(
+                    "DELETE FROM user_scores WHERE dir_path = ? AND username = ?",
+                    ((key, username) for username in stale)
+                )
+        if stale:
+            logger.debug(f"🗂️ 점수 캐시 정리: {len(stale)}명")
+        return len(stale)
+
+    def close(self):
+        """인덱스 연결 닫기"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,137 @@
+"""
+점수 계산 엔진 모듈
+
+IntelligentCurationSystem 의 파일 점수를 파일마다 따로 구하지 않고
+사용자(또는 라이브러리 전체) 단위로 한 번에 계산하는 배치 API.
+사용자 파일 크기의 최소/최대를 한 번만 구하므로 사용자당 O(n²) 이던 계산이 O(n) 이 되고,
+NumPy 가 설치되어 있으면 배열 연산으로, 없으면 같은 계산을 순수 파이썬으로 수행한다.
+
+다양성 보정의 미세 조정 값은 파일명(없으면 점수 문자열)의 고정 64비트 해시로 정하므로
+실행마다 값이 달라지지 않고, 계산한 점수를 스캔 인덱스에 저장해 재시작 후에도 재사용할 수 있다.
+
+Qt 에 의존하지 않으므로 CLI 나 워커 프로세스에서도 그대로 사용할 수 있다.
+"""
+
+import math
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 는 선택 사항
+    np = None
+
+# 기본 파일 점수 가중치 (크기 / 희귀성 / 날짜)
+SIZE_WEIGHT = 0.6
+RARITY_WEIGHT = 0.25
+DATE_WEIGHT = 0.15
+
+# 기본 파일 점수의 고정 구성 요소
+DEFAULT_RARITY_SCORE = 0.5
+DEFAULT_DATE_SCORE = 0.4
+UNIFORM_SIZE_SCORE = 0.6  # 사용자 파일 크기가 모두 같을 때
+
+# 복합 점수 가중치 (파일 점수 / 레이팅 점수)
+FILE_SCORE_WEIGHT = 0.6
+RATING_SCORE_WEIGHT = 0.4
+
+# NumPy 를 쓸 만한 최소 파일 수 (더 적으면 배열 변환 비용이 더 큼)
+NUMPY_MIN_FILES = 64
+
+# 점수 계산 방식 버전 - 공식이 바뀌면 올려서 저장된 점수 캐시를 무효화
+SCORE_VERSION = 2
+
+
+def stable_jitter(key):
+    """다양성 보정용 미세 조정 값 (-0.05 ~ +0.05, 프로세스/실행과 무관하게 항상 같은 값)
+
+    잘못된 UTF-8 파일명(surrogate escape)은 원래 바이트로 되돌려 해시
+    """
+    digest = hashlib.blake2b(key.encode('utf-8', 'surrogateescape'), digest_size=8).digest()
+    return (int.from_bytes(digest, 'little') % 100) / 1000.0 - 0.05
+
+
+def files_digest(names, sizes):
+    """파일 목록(파일명/크기)과 점수 버전의 해시 - 저장된 점수를 재사용해도 되는지 확인용"""
+    hasher = hashlib.blake2b(f"v{SCORE_VERSION}".encode('utf-8'), digest_size=16)
+    hasher.update('\n'.join(f"{name}\t{size!r}" for name, size in zip(names, sizes)).encode('utf-8', 'surrogateescape'))
+    return hasher.hexdigest()
+
+
+def diversity_adjust(score, key=None):
+    """다양성 유지 보정 - 부드러운 곡선으로 0.01~0.99 범위에서 고르게 분포 (단일 값)
+
+    key: 미세 조정에 사용할 문자열 (파일명 등, 없으면 점수 문자열)
+    """
+    # 입력 범위 [0,1]을 [-6,6] 범위로 변환 후 시그모이드
+    x = (score - 0.5) * 12
+    sigmoid = 1.0 / (1.0 + math.exp(-x))
+
+    # 0.01 ~ 0.99 범위로 스케일링
+    adjusted = 0.01 + (sigmoid * 0.98)
+
+    # 중간 영역에서 약간의 랜덤성 추가 (고정 해시 기반, -0.05 ~ +0.05)
+    if 0.3 <= score <= 0.7:
+        adjusted += stable_jitter(str(score) if key is None else key)
+
+    return max(0.01, min(0.99, adjusted))
+
+
+def file_score_from_size(file_size, min_size, max_size):
+    """크기 범위 안에서 파일 하나의 기본 파일 점수 (보정 전 원점수)"""
+    if max_size > min_size:
+        normalized_score = (file_size - min_size) / (max_size - min_size)
+        size_score = normalized_score ** 1.5  # 너무 극단적이지 않은 곡선
+    else:
+        size_score = UNIFORM_SIZE_SCORE
+    return size_score * SIZE_WEIGHT + DEFAULT_RARITY_SCORE * RARITY_WEIGHT + DEFAULT_DATE_SCORE * DATE_WEIGHT
+
+
+def file_scores_basic(sizes, names=None):
+    """사용자 파일 크기 목록 → 기본 파일 점수 목록 (다양성 보정 포함, 입력 순서 유지)
+
+    names: sizes 와 같은 순서의 파일명 (미세 조정 키, 없으면 점수 문자열 사용)
+    """
+    count = len(sizes)
+    if not count:
+        return []
+    if names is None:
+        names = [None] * count
+
+    if np is not None and count >= NUMPY_MIN_FILES:
+        return _file_scores_numpy(np.asarray(sizes, dtype=np.float64), names)
+
+    min_size = min(sizes)
+    max_size = max(sizes)
+    return [
+        diversity_adjust(file_score_from_size(size, min_size, max_size), name)
+        for size, name in zip(sizes, names)
+    ]
+
+
+def composite_scores(file_scores, rating_score):
+    """기본 파일 점수 목록 + 사용자 레이팅 점수 → 복합 점수 목록"""
+    rating_part = rating_score * RATING_SCORE_WEIGHT
+    return [(file_score * FILE_SCORE_WEIGHT) + rating_part for file_score in file_scores]
+
+
+def _file_scores_numpy(sizes, names):
+    """file_scores_basic 의 NumPy 버전"""
+    min_size = sizes.min()
+    max_size = sizes.max()
+    if max_size > min_size:
+        size_scores = ((sizes - min_size) / (max_size - min_size)) ** 1.5
+    else:
+        size_scores = np.full(sizes.shape, UNIFORM_SIZE_SCORE)
+    raw = size_scores * SIZE_WEIGHT + DEFAULT_RARITY_SCORE * RARITY_WEIGHT + DEFAULT_DATE_SCORE * DATE_WEIGHT
+
+    adjusted = 0.01 + (1.0 / (1.0 + np.exp(-((raw - 0.5) * 12))) * 0.98)
+
+    # 해시 기반 미세 조정은 값마다 문자열 해시가 필요하므로 중간 영역만 파이썬으로 처리
+    middle = np.flatnonzero((raw >= 0.3) & (raw <= 0.7))
+    if middle.size:
+        adjusted[middle] += [
+            stable_jitter(str(score) if names[index] is None else names[index])
+            for index, score in zip(middle.tolist(), raw[middle].tolist())
+        ]
+
+    return np.clip(adjusted, 0.01, 0.99).tolist()
@@ -0,0 +1,54 @@
+"""deletion_planner 테스트용 무작위 후보 생성/단순 참조 계산"""
+
+from collections import Counter
+
+from deletion_planner import TargetSavingsSelector
+
+CAPS = {
+    'none': lambda eligible, total: eligible,
+    'relative': TargetSavingsSelector.relative_cap(0.5),
+    'total': TargetSavingsSelector.total_cap(0.6),
+}
+
+
+def make_candidates(rng, max_users=3, max_files=5, equal_size=False):
+    """{username: [file_data, ...]} (사용자별 점수 낮은 순, 동점이 나오도록 점수는 0.1 단위)"""
+    candidates = {}
+    for user_index in range(rng.randint(1, max_users)):
+        username = f"user{user_index}"
+        files = [
+            {
+                'name': f"{username}-{file_index}.mp4",
+                'username': username,
+                'size': 10 if equal_size else rng.randint(1, 50),
+                'composite_score': rng.randint(0, 10) / 10,
+            }
+            for file_index in range(rng.randint(1, max_files))
+        ]
+        files.sort(key=lambda file_data: file_data['composite_score'])
+        candidates[username] = files
+    return candidates
+
+
+def reference_prefix(candidates, threshold, cap):
+    """사용자별로 점수 낮은 파일부터 상한까지 고른 파일 (기준 이하만)"""
+    chosen = []
+    for files in candidates.values():
+        eligible = sum(1 for file_data in files if file_data['composite_score'] <= threshold)
+        limit = cap(eligible, len(files)) if eligible else 0
+        chosen.extend(files[:limit])
+    return chosen
+
+
+def reference_limits(candidates, threshold, cap):
+    limits = {}
+    for username, files in candidates.items():
+        eligible = sum(1 for file_data in files if file_data['composite_score'] <= threshold)
+        limits[username] = cap(eligible, len(files)) if eligible else 0
+    return limits
+
+
+def assert_within_limits(selected, limits):
+    per_user = Counter(file_data['username'] for file_data in selected)
+    for username, count in per_user.items():
+        assert count <= limits[username]
@@ -0,0 +1,171 @@
+"""DeletionJournal / DeletionEngine 중단-이어서 삭제 계약 테스트"""
+
+import json
+import os
+import threading
+
+import pytest
+
+from deletion_engine import (DeletionEngine, DeletionJournal, MODE_DELETE, STATUS_DELETED, STATUS_ERROR,
+                             STATUS_MISSING)
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return DeletionJournal(journal_file=str(tmp_path / 'deletion_journal.jsonl'))
+
+
+def make_files(dir_path, names, size_mb=1.0):
+    """실제 파일 생성 + 엔진에 넘길 목록"""
+    for name in names:
+        (dir_path / name).write_bytes(b'x')
+    return [{'name': name, 'size': size_mb} for name in names]
+
+
+def read_lines(journal):
+    with open(journal.journal_file, 'r', encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_pending_batches_excludes_finished_files_and_retries_errors(journal, tmp_path):
+    files = [{'name': name, 'size': 1.0} for name in ('a.mp4', 'b.mp4', 'c.mp4', 'd.mp4')]
+    journal.begin('batch1', str(tmp_path), files)
+    journal.record('batch1', 'a.mp4', STATUS_DELETED)
+    journal.record('batch1', 'b.mp4', STATUS_MISSING)
+    journal.record('batch1', 'c.mp4', STATUS_ERROR, 'Permission denied')
+
+    pending = journal.pending_batches()
+    assert len(pending) == 1
+    batch = pending[0]
+    assert batch['batch'] == 'batch1'
+    assert batch['dir'] == str(tmp_path)
+    assert batch['mode'] == MODE_DELETE
+    # 삭제/없음은 끝난 파일, 오류 파일은 다시 시도
+    assert [file_info['name'] for file_info in batch['files']] == ['c.mp4', 'd.mp4']
+
+
+def test_ended_batches_are_not_pending(journal, tmp_path):
+    journal.begin('batch1', str(tmp_path), [{'name': 'a.mp4', 'size': 1.0}])
+    journal.begin('batch2', str(tmp_path), [{'name': 'b.mp4', 'size': 1.0}])
+    journal.end('batch1')
+
+    assert [batch['batch'] for batch in journal.pending_batches()] == ['batch2']
+
+
+def test_partial_trailing_line_is_ignored_and_terminated(journal, tmp_path):
+    journal.begin('batch1', str(tmp_path), [{'name': 'a.mp4', 'size': 1.0}, {'name': 'b.mp4', 'size': 1.0}])
+    # 기록 도중 종료: 줄바꿈 없이 끊긴 마지막 줄
+    with open(journal.journal_file, 'a', encoding='utf-8') as f:
+        f.write('{"op": "done", "batch": "batch1", "na')
+
+    # 다시 시작한 프로그램의 저널
+    reopened = DeletionJournal(journal_file=journal.journal_file)
+    pending = reopened.pending_batches()
+    assert [file_info['name'] for file_info in pending[0]['files']] == ['a.mp4', 'b.mp4']
+
+    # 새 기록은 끊긴 줄 뒤에 이어 붙지 않고 다음 줄에 써야 읽힘
+    reopened.record('batch1', 'a.mp4', STATUS_DELETED)
+    lines = read_lines(reopened)
+    assert json.loads(lines[-1]) == {'op': 'done', 'batch': 'batch1', 'name': 'a.mp4', 'status': STATUS_DELETED}
+    assert [file_info['name'] for file_info in reopened.pending_batches()[0]['files']] == ['b.mp4']
+
+
+def test_journal_truncated_only_when_nothing_pending(journal, tmp_path):
+    journal.begin('batch1', str(tmp_path), [{'name': 'a.mp4', 'size': 1.0}])
+    journal.begin('batch2', str(tmp_path), [{'name': 'b.mp4', 'size': 1.0}])
+
+    journal.end('batch1')
+    assert os.path.getsize(journal.journal_file) > 0
+    assert [batch['batch'] for batch in journal.pending_batches()] == ['batch2']
+
+    journal.abandon('batch2')
+    assert os.path.getsize(journal.journal_file) == 0
+    assert journal.pending_batches() == []
+
+
+def test_run_deletes_and_clears_journal(journal, tmp_path):
+    files = make_files(tmp_path, ['a.mp4', 'b.mp4'])
+    files.append({'name': 'gone.mp4', 'size': 2.0})
+    engine = DeletionEngine(journal)
+
+    result = engine.run(str(tmp_path), files)
+
+    assert [file_info['name'] for file_info in result['deleted_files']] == ['a.mp4', 'b.mp4']
+    assert [file_info['name'] for file_info in result['missing_files']] == ['gone.mp4']
+    assert result['deleted_count'] == 2
+    assert result['deleted_size'] == pytest.approx(2.0)
+    assert not result['cancelled']
+    assert not (tmp_path / 'a.mp4').exists()
+    assert os.path.getsize(journal.journal_file) == 0
+
+
+def test_resume_after_crash_deletes_only_remaining_files(journal, tmp_path):
+    files = make_files(tmp_path, ['a.mp4', 'b.mp4', 'c.mp4'])
+    # 'a' 를 지운 뒤 종료된 상황, 'b' 는 오류였음
+    journal.begin('batch1', str(tmp_path), files)
+    os.remove(tmp_path / 'a.mp4')
+    journal.record('batch1', 'a.mp4', STATUS_DELETED)
+    journal.record('batch1', 'b.mp4', STATUS_ERROR, 'busy')
+
+    engine = DeletionEngine(DeletionJournal(journal_file=journal.journal_file))
+    (batch,) = engine.pending_batches()
+    result = engine.resume(batch)
+
+    assert result['batch'] == 'batch1'
+    assert not result['quarantined']
+    assert sorted(file_info['name'] for file_info in result['deleted_files']) == ['b.mp4', 'c.mp4']
+    assert result['missing_files'] == []
+    assert not any((tmp_path / name).exists() for name in ('a.mp4', 'b.mp4', 'c.mp4'))
+    assert engine.pending_batches() == []
+    assert os.path.getsize(journal.journal_file) == 0
+
+
+def test_failed_files_stay_pending_until_batch_ends(journal, tmp_path):
+    # 디렉토리는 os.remove 로 지울 수 없으므로 오류가 남
+    (tmp_path / 'stuck.mp4').mkdir()
+    files = make_files(tmp_path, ['a.mp4'])
+    files.append({'name': 'stuck.mp4', 'size': 1.0})
+
+    class CrashingJournal(DeletionJournal):
+        """end 기록 전에 종료된 것처럼 동작"""
+        def end(self, batch_id, reason='completed'):
+            pass
+
+    crashing = CrashingJournal(journal_file=journal.journal_file)
+    result = DeletionEngine(crashing).run(str(tmp_path), files)
+    assert [file_info['name'] for file_info, _ in result['failed_files']] == ['stuck.mp4']
+
+    (batch,) = journal.pending_batches()
+    assert [file_info['name'] for file_info in batch['files']] == ['stuck.mp4']
+
+
+def test_cancelled_files_are_not_recorded(journal, tmp_path):
+    files = make_files(tmp_path, ['a.mp4', 'b.mp4'])
+    cancel_event = threading.Event()
+    cancel_event.set()
+
+    result = DeletionEngine(journal).run(str(tmp_path), files, cancel_event=cancel_event)
+
+    assert result['cancelled']
+    assert result['deleted_count'] == 0
+    assert (tmp_path / 'a.mp4').exists()
+    # 취소된 배치도 end 가 기록되므로 이어서 삭제할 목록에 남지 않음
+    assert journal.pending_batches() == []
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Windows 파일명은 항상 유니코드")
+def test_run_deletes_non_utf8_file_names(journal, tmp_path):
+    raw_name = b'chaturbate-alice-2024-01-01T10_00_00+09_00\xff.mp4'
+    with open(os.path.join(os.fsencode(str(tmp_path)), raw_name), 'wb') as f:
+        f.write(b'x')
+    name = os.fsdecode(raw_name)  # surrogate escape 포함
+
+    engine = DeletionEngine(journal)
+    journal.begin('batch1', str(tmp_path), [{'name': name, 'size': 1.0}])
+    assert [file_info['name'] for file_info in journal.pending_batches()[0]['files']] == [name]
+    journal.abandon('batch1')
+
+    result = engine.run(str(tmp_path), [{'name': name, 'size': 1.0}])
+
+    assert result['deleted_count'] == 1
+    assert os.listdir(tmp_path) == ['deletion_journal.jsonl']
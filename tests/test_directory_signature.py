@@ -0,0 +1,103 @@
+"""CapacityFinder 디렉토리 시그니처 (변경 없으면 재스캔 생략) 테스트"""
+
+import os
+import time
+
+import pytest
+
+import main
+from main import CapacityFinder
+
+
+def make_file(dir_path, name, size=100):
+    with open(os.path.join(dir_path, name), 'wb') as f:
+        f.write(b'x' * size)
+
+
+def alice(day):
+    return f"chaturbate-alice-2024-01-0{day}T10_00_00+09_00.mp4"
+
+
+BOB = "chaturbate-bob-2024-01-01T10_00_00+09_00.mp4"
+
+
+@pytest.fixture
+def finder(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # 경로 기록/스캔 인덱스/삭제 저널은 현재 디렉토리에 생김
+    lib = tmp_path / 'lib'
+    lib.mkdir()
+    for day in (1, 2, 3):
+        make_file(str(lib), alice(day))
+    capacity_finder = CapacityFinder()
+    capacity_finder.use_quarantine = False
+    capacity_finder.scan_path(str(lib))
+    yield capacity_finder
+    capacity_finder.intelligent_system.parallel_scorer.close()
+    if capacity_finder.scan_index:
+        capacity_finder.scan_index.close()
+
+
+@pytest.fixture
+def scandir_calls(monkeypatch):
+    """디렉토리 파일명 읽기 횟수"""
+    calls = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(main.os, 'scandir', counting_scandir)
+    return calls
+
+
+@pytest.fixture
+def coarse_mtime(monkeypatch):
+    """수정시각을 초 단위로만 알려주는 파일시스템 흉내"""
+    real_stat = os.stat
+
+    class CoarseStat:
+        def __init__(self, stat_result):
+            self._stat_result = stat_result
+            self.st_mtime_ns = stat_result.st_mtime_ns // 1_000_000_000 * 1_000_000_000
+
+        def __getattr__(self, name):
+            return getattr(self._stat_result, name)
+
+    monkeypatch.setattr(main.os, 'stat', lambda path, *args, **kwargs: CoarseStat(real_stat(path, *args, **kwargs)))
+
+
+def test_fresh_scan_checks_names(finder, scandir_calls):
+    path = finder.current_path
+    assert finder.is_directory_unchanged(path)
+    assert scandir_calls == [path]
+
+
+def test_own_delete_needs_only_one_stat(finder, scandir_calls):
+    path = finder.current_path
+    finder.delete_files([finder.dic_files['alice']['files'][0]])
+
+    assert finder.is_directory_unchanged(path)
+    assert scandir_calls == []
+
+
+def test_outside_change_before_own_delete_forces_rescan(finder):
+    path = finder.current_path
+    time.sleep(0.01)
+    make_file(path, BOB)
+    finder.delete_files([finder.dic_files['alice']['files'][0]])
+
+    assert not finder.is_directory_unchanged(path)
+
+
+def test_coarse_mtime_keeps_name_check_after_own_delete(finder, coarse_mtime, scandir_calls):
+    path = finder.current_path
+    finder.scan_path(path)  # 초 단위 수정시각으로 시그니처 기록
+    scandir_calls.clear()
+    finder.delete_files([finder.dic_files['alice']['files'][0]])
+    assert finder.is_directory_unchanged(path)
+    assert scandir_calls == [path]
+
+    # 같은 초 안에 다른 프로그램이 파일 추가 - 수정시각은 같아도 파일명 비교로 알아챔
+    make_file(path, BOB)
+    assert not finder.is_directory_unchanged(path)
@@ -0,0 +1,58 @@
+"""FairShareAllocator 를 라운드별 단순 계산 결과와 비교"""
+
+import itertools
+import random
+from collections import Counter
+
+import pytest
+
+from deletion_planner import FairShareAllocator, ratio_caps
+from planner_helpers import make_candidates
+
+
+def reference_fair_order(candidates, caps):
+    """라운드마다 아직 남은 사용자의 k 번째 파일을 점수(같으면 사용자 순서) 순으로"""
+    limits = {username: min(len(files), caps.get(username, len(files))) for username, files in candidates.items()}
+    order = []
+    for round_index in range(max(limits.values(), default=0)):
+        round_files = [
+            (files[round_index]['composite_score'], user_order, files[round_index])
+            for user_order, (username, files) in enumerate(candidates.items())
+            if round_index < limits[username]
+        ]
+        order.extend(file_data for _, _, file_data in sorted(round_files, key=lambda item: item[:2]))
+    return order
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_fair_share_allocator_round_robin_within_caps(seed):
+    rng = random.Random(seed)
+    candidates = make_candidates(rng, max_users=4, max_files=6)
+    caps = ratio_caps(candidates, 0.5) if seed % 2 else {}
+
+    allocator = FairShareAllocator(candidates, caps)
+    order = list(allocator)
+    assert order == reference_fair_order(candidates, caps)
+
+    for username, files in candidates.items():
+        assert allocator.selected_counts[username] == min(len(files), caps.get(username, len(files)))
+
+    # 어느 시점에서 멈춰도 사용자별 선택 수 차이는 (상한/후보가 남은 사용자끼리) 1 이하
+    counts = Counter()
+    for file_data in order:
+        counts[file_data['username']] += 1
+        open_counts = [counts[username] for username in candidates
+                       if counts[username] < allocator.limits[username]]
+        if open_counts:
+            assert max(open_counts) - min(open_counts) <= 1
+
+
+def test_fair_share_allocator_stops_early():
+    candidates = {
+        'alice': [{'username': 'alice', 'size': 1, 'composite_score': score} for score in (0.1, 0.2, 0.3)],
+        'bob': [{'username': 'bob', 'size': 1, 'composite_score': score} for score in (0.5, 0.6)],
+    }
+    allocator = FairShareAllocator(candidates, {'alice': 2})
+    taken = list(itertools.islice(allocator, 3))
+    assert [file_data['username'] for file_data in taken] == ['alice', 'bob', 'alice']
+    assert allocator.selected_counts == Counter({'alice': 2, 'bob': 1})
@@ -0,0 +1,196 @@
+"""Quarantine manifest 맞춤 / 자동 비우기 후보 / 휴지통 배치 이어서 실행 테스트"""
+
+import json
+import os
+from collections import namedtuple
+
+import pytest
+
+import quarantine as quarantine_module
+from deletion_engine import DeletionEngine, DeletionJournal, MODE_QUARANTINE
+from quarantine import MANIFEST_FILE, RECOVERED_BATCH, TRASH_DIR_NAME, Quarantine
+
+DiskUsage = namedtuple('DiskUsage', 'total used free')
+MB = 1024 * 1024
+DAY = 86400
+
+
+def write_manifest(trash_dir, entries):
+    with open(trash_dir / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(entries, f)
+
+
+def read_manifest(trash_dir):
+    with open(trash_dir / MANIFEST_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def trash_dir(tmp_path):
+    path = tmp_path / TRASH_DIR_NAME
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def disk_free(monkeypatch):
+    """shutil.disk_usage 대체 - free_ratio 를 바꿔가며 사용"""
+    state = {'free_ratio': 0.5}
+
+    def fake_disk_usage(path):
+        total = 1000 * MB
+        free = int(total * state['free_ratio'])
+        return DiskUsage(total, total - free, free)
+
+    monkeypatch.setattr(quarantine_module.shutil, 'disk_usage', fake_disk_usage)
+    return state
+
+
+def test_load_reconciles_manifest_with_trash_contents(tmp_path, trash_dir):
+    (trash_dir / 'known.mp4').write_bytes(b'x' * 10)
+    (trash_dir / 'unrecorded.mp4').write_bytes(b'x' * MB)
+    (trash_dir / (MANIFEST_FILE + '.tmp')).write_text('{')
+    write_manifest(trash_dir, {
+        'known.mp4': {'size': 5.0, 'time': 100.0, 'batch': 'batch1'},
+        'vanished.mp4': {'size': 7.0, 'time': 100.0, 'batch': 'batch1'},
+    })
+
+    items = {item['name']: item for item in Quarantine(str(tmp_path)).items()}
+
+    # 목록의 파일은 그대로, 사라진 파일은 제거, 목록에 없던 파일은 복구 배치로 추가 (manifest/임시 파일 제외)
+    assert set(items) == {'known.mp4', 'unrecorded.mp4'}
+    assert items['known.mp4'] == {'name': 'known.mp4', 'size': 5.0, 'time': 100.0, 'batch': 'batch1'}
+    assert items['unrecorded.mp4']['batch'] == RECOVERED_BATCH
+    assert items['unrecorded.mp4']['size'] == pytest.approx(1.0)
+
+    # 찾은 시각이 남도록 바로 저장됨
+    saved = read_manifest(trash_dir)
+    assert set(saved) == {'known.mp4', 'unrecorded.mp4'}
+    assert saved['unrecorded.mp4']['time'] == items['unrecorded.mp4']['time']
+
+
+def test_load_without_trash_dir_or_manifest(tmp_path):
+    quarantine = Quarantine(str(tmp_path))
+    assert quarantine.items() == []
+    assert not os.path.exists(quarantine.trash_dir)
+
+
+def test_load_survives_corrupt_manifest(tmp_path, trash_dir):
+    (trash_dir / 'a.mp4').write_bytes(b'x')
+    (trash_dir / MANIFEST_FILE).write_text('{"a.mp4": ')
+
+    items = Quarantine(str(tmp_path)).items()
+
+    assert [(item['name'], item['batch']) for item in items] == [('a.mp4', RECOVERED_BATCH)]
+
+
+def test_stash_record_restore_round_trip(tmp_path):
+    (tmp_path / 'a.mp4').write_bytes(b'x')
+    (tmp_path / 'b.mp4').write_bytes(b'x')
+    quarantine = Quarantine(str(tmp_path))
+
+    quarantine.stash('a.mp4')
+    quarantine.stash('b.mp4')
+    quarantine.record('batch1', [{'name': 'a.mp4', 'size': 3.0}, {'name': 'b.mp4', 'size': 4.0}], when=50.0)
+    (tmp_path / 'b.mp4').write_bytes(b'new')  # 같은 이름 파일이 다시 생김
+
+    result = quarantine.restore(['a.mp4', 'b.mp4', 'c.mp4'])
+
+    assert result['restored'] == [{'name': 'a.mp4', 'size': 3.0}]
+    assert result['conflicts'] == ['b.mp4']
+    assert result['missing'] == ['c.mp4']
+    assert (tmp_path / 'a.mp4').exists()
+    assert [item['name'] for item in Quarantine(str(tmp_path)).items()] == ['b.mp4']
+
+
+def test_purge_candidates_by_age(tmp_path, trash_dir, disk_free):
+    now = 100 * DAY
+    quarantine = Quarantine(str(tmp_path))
+    for name, age_days in (('old.mp4', 8), ('edge.mp4', 7), ('new.mp4', 1)):
+        (trash_dir / name).write_bytes(b'x')
+        quarantine.record('batch1', [{'name': name, 'size': 10.0}], when=now - age_days * DAY)
+
+    candidates = quarantine.purge_candidates(max_age_days=7, min_free_ratio=0.1, now=now)
+
+    assert [item['name'] for item in candidates] == ['old.mp4', 'edge.mp4']
+    assert quarantine.purge_candidates(max_age_days=None, min_free_ratio=None, now=now) == []
+
+
+def test_purge_candidates_restore_free_space_oldest_first(tmp_path, trash_dir, disk_free):
+    now = 100 * DAY
+    quarantine = Quarantine(str(tmp_path))
+    for index, name in enumerate(('a.mp4', 'b.mp4', 'c.mp4', 'd.mp4')):
+        (trash_dir / name).write_bytes(b'x')
+        quarantine.record('batch1', [{'name': name, 'size': 30.0}], when=now - (4 - index) * 60)
+
+    # 전체 1000MB 중 10% = 100MB 를 남겨야 하는데 45MB 만 남음 → 55MB 부족 → 30MB 파일 2개
+    disk_free['free_ratio'] = 0.045
+    candidates = quarantine.purge_candidates(max_age_days=7, min_free_ratio=0.1, now=now)
+    assert [item['name'] for item in candidates] == ['a.mp4', 'b.mp4']
+
+    # 공간이 충분하면 보관 기간 안의 파일은 그대로
+    disk_free['free_ratio'] = 0.5
+    assert quarantine.purge_candidates(max_age_days=7, min_free_ratio=0.1, now=now) == []
+
+
+def test_purge_candidates_counts_expired_files_toward_shortfall(tmp_path, trash_dir, disk_free):
+    now = 100 * DAY
+    quarantine = Quarantine(str(tmp_path))
+    (trash_dir / 'expired.mp4').write_bytes(b'x')
+    (trash_dir / 'recent.mp4').write_bytes(b'x')
+    quarantine.record('batch1', [{'name': 'expired.mp4', 'size': 60.0}], when=now - 10 * DAY)
+    quarantine.record('batch2', [{'name': 'recent.mp4', 'size': 60.0}], when=now - 60)
+
+    # 55MB 부족 - 기간이 지난 60MB 파일만으로 채워짐
+    disk_free['free_ratio'] = 0.045
+    candidates = quarantine.purge_candidates(max_age_days=7, min_free_ratio=0.1, now=now)
+
+    assert [item['name'] for item in candidates] == ['expired.mp4']
+
+
+def test_purge_deletes_files_and_forgets_them(tmp_path, trash_dir):
+    quarantine = Quarantine(str(tmp_path))
+    for name in ('a.mp4', 'b.mp4'):
+        (trash_dir / name).write_bytes(b'x')
+    quarantine.record('batch1', [{'name': 'a.mp4', 'size': 1.0}, {'name': 'b.mp4', 'size': 1.0}])
+    engine = DeletionEngine(DeletionJournal(journal_file=str(tmp_path / 'journal.jsonl')))
+
+    result = quarantine.purge(engine, [item for item in quarantine.items() if item['name'] == 'a.mp4'])
+
+    assert result['deleted_count'] == 1
+    assert not (trash_dir / 'a.mp4').exists()
+    assert [item['name'] for item in quarantine.items()] == ['b.mp4']
+    assert list(read_manifest(trash_dir)) == ['b.mp4']
+
+
+def test_resumed_quarantine_batch_moves_remaining_files(tmp_path):
+    (tmp_path / 'a.mp4').write_bytes(b'x')
+    (tmp_path / 'b.mp4').write_bytes(b'x')
+    journal = DeletionJournal(journal_file=str(tmp_path / 'journal.jsonl'))
+    journal.begin('batch1', str(tmp_path), [{'name': 'a.mp4', 'size': 1.0}, {'name': 'b.mp4', 'size': 2.0}],
+                  MODE_QUARANTINE)
+
+    engine = DeletionEngine(journal)
+    (batch,) = engine.pending_batches()
+    result = engine.resume(batch)
+
+    assert result['quarantined']
+    assert not (tmp_path / 'a.mp4').exists()
+    items = {item['name']: item for item in Quarantine(str(tmp_path)).items()}
+    assert set(items) == {'a.mp4', 'b.mp4'}
+    assert items['b.mp4']['batch'] == 'batch1'
+    assert items['b.mp4']['size'] == 2.0
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Windows 파일명은 항상 유니코드")
+def test_record_and_reload_non_utf8_file_names(tmp_path, trash_dir):
+    raw_name = b'chaturbate-alice-2024-01-01T10_00_00+09_00\xff.mp4'
+    with open(os.path.join(os.fsencode(str(trash_dir)), raw_name), 'wb') as f:
+        f.write(b'x')
+    name = os.fsdecode(raw_name)  # surrogate escape 포함
+
+    Quarantine(str(tmp_path)).record('batch1', [{'name': name, 'size': 1.0}])
+
+    assert not (trash_dir / (MANIFEST_FILE + '.tmp')).exists()
+    items = Quarantine(str(tmp_path)).items()
+    assert [(item['name'], item['batch']) for item in items] == [(name, 'batch1')]
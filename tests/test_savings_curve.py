@@ -0,0 +1,62 @@
+"""deletion_planner 절약 곡선을 available() / select_knapsack 결과와 비교"""
+
+import random
+
+import pytest
+
+from deletion_planner import TargetSavingsSelector
+from planner_helpers import CAPS, assert_within_limits, make_candidates, reference_limits, reference_prefix
+
+
+@pytest.mark.parametrize('cap_name', sorted(CAPS))
+@pytest.mark.parametrize('seed', range(40))
+def test_savings_curve_matches_available(seed, cap_name):
+    rng = random.Random(seed)
+    cap = CAPS[cap_name]
+    candidates = make_candidates(rng)
+    selector = TargetSavingsSelector(candidates)
+    max_score = rng.choice([0.5, 1.0])
+
+    curve = selector.savings_curve(cap, max_score)
+    expected_thresholds = [threshold for threshold in selector.thresholds if threshold <= max_score]
+    assert [point.threshold for point in curve.points] == expected_thresholds
+
+    for point in curve.points:
+        chosen = reference_prefix(candidates, point.threshold, cap)
+        assert point.savings_mb == pytest.approx(selector.available(point.threshold, cap))
+        assert point.savings_mb == pytest.approx(sum(file_data['size'] for file_data in chosen))
+        assert point.file_count == len(chosen)
+        assert point.score_loss == pytest.approx(sum(file_data['composite_score'] for file_data in chosen))
+
+    # 목표 조회는 목표 이상을 절약하는 첫 점
+    for target in (0, 1, curve.max_savings_mb / 2, curve.max_savings_mb, curve.max_savings_mb + 1):
+        point = curve.at_target(target)
+        if point is None:
+            assert not curve.points
+            continue
+        reaching = [candidate for candidate in curve.points if candidate.savings_mb >= target]
+        assert point is (reaching[0] if reaching else curve.points[-1])
+
+
+@pytest.mark.parametrize('cap_name', sorted(CAPS))
+@pytest.mark.parametrize('seed', range(40))
+def test_knapsack_curve_follows_select_knapsack_order(seed, cap_name):
+    rng = random.Random(seed)
+    cap = CAPS[cap_name]
+    candidates = make_candidates(rng)
+    selector = TargetSavingsSelector(candidates)
+    max_score = rng.choice([0.5, 1.0])
+    limits = reference_limits(candidates, max_score, cap)
+
+    curve = selector.knapsack_curve(cap, max_score)
+    ratios = [point.threshold for point in curve.points]
+    assert ratios == sorted(ratios)
+    assert [point.file_count for point in curve.points] == list(range(1, len(curve) + 1))
+    savings = [point.savings_mb for point in curve.points]
+    assert savings == sorted(savings)
+
+    # 곡선 끝 = 목표 없이 상한까지 모두 채운 select_knapsack
+    everything = selector.select_knapsack(float('inf'), cap, max_score)
+    assert_within_limits(everything, limits)
+    assert len(everything) == len(curve)
+    assert curve.max_savings_mb == pytest.approx(sum(file_data['size'] for file_data in everything))
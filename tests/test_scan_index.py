@@ -0,0 +1,98 @@
+"""ScanIndex 저장/복원 테스트"""
+
+import os
+
+import pytest
+
+from scan_index import ScanIndex
+
+GOOD_NAME = "chaturbate-alice-2024-01-01T10_00_00+09_00.mp4"
+# 잘못된 UTF-8 바이트가 섞인 파일명 (Linux 에서 os.listdir 이 surrogate escape 로 돌려주는 형태)
+BAD_NAME = os.fsdecode(b"chaturbate-al\xffice-2024-01-01T10_00_00+09_00.mp4")
+BAD_USER = os.fsdecode(b"al\xffice")
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason="Windows 파일명은 항상 유니코드")
+
+
+@pytest.fixture
+def index(tmp_path):
+    scan_index = ScanIndex(db_file=str(tmp_path / 'scan_index.db'))
+    yield scan_index
+    scan_index.close()
+
+
+def test_update_and_load_directory_round_trip(index, tmp_path):
+    index.update_directory(str(tmp_path), [
+        (GOOD_NAME, 10.0, 1.5, 'alice', 'chaturbate', '2024-01-01T10:00:00'),
+        (BAD_NAME, 20.0, 2.5, BAD_USER, 'chaturbate', '2024-01-01T10:00:00'),
+    ], [])
+
+    entries = index.load_directory(str(tmp_path))
+
+    assert entries == {
+        GOOD_NAME: (10.0, 1.5, 'alice', 'chaturbate', '2024-01-01T10:00:00'),
+        BAD_NAME: (20.0, 2.5, BAD_USER, 'chaturbate', '2024-01-01T10:00:00'),
+    }
+
+
+def test_removed_non_utf8_names_are_deleted(index, tmp_path):
+    index.update_directory(str(tmp_path), [
+        (GOOD_NAME, 10.0, 1.5, 'alice', 'chaturbate', None),
+        (BAD_NAME, 20.0, 2.5, BAD_USER, 'chaturbate', None),
+    ], [])
+
+    index.update_directory(str(tmp_path), [], [BAD_NAME])
+
+    assert list(index.load_directory(str(tmp_path))) == [GOOD_NAME]
+
+
+def test_non_utf8_directory_path(index, tmp_path):
+    dir_path = os.path.join(str(tmp_path), os.fsdecode(b"lib\xff"))
+    index.update_directory(dir_path, [(GOOD_NAME, 10.0, 1.5, 'alice', 'chaturbate', None)], [])
+
+    assert list(index.load_directory(dir_path)) == [GOOD_NAME]
+    assert index.load_directory(str(tmp_path)) == {}
+
+    index.clear_directory(dir_path)
+    assert index.load_directory(dir_path) == {}
+
+
+def test_user_scores_are_kept_per_directory(index, tmp_path):
+    lib_a = str(tmp_path / 'a')
+    lib_b = str(tmp_path / 'b')
+    index.save_user_scores(lib_a, [('alice', 'digest-a', [0.1, 0.2])])
+    index.save_user_scores(lib_b, [('alice', 'digest-b', [0.9]), (BAD_USER, 'digest-bad', [0.5])])
+
+    assert index.load_user_scores(lib_a) == {'alice': ('digest-a', [0.1, 0.2])}
+    assert index.load_user_scores(lib_b) == {'alice': ('digest-b', [0.9]), BAD_USER: ('digest-bad', [0.5])}
+
+
+def test_prune_user_scores_drops_missing_users_of_one_directory(index, tmp_path):
+    lib_a = str(tmp_path / 'a')
+    lib_b = str(tmp_path / 'b')
+    index.save_user_scores(lib_a, [('alice', 'a1', [0.1]), ('bob', 'a2', [0.2]), (BAD_USER, 'a3', [0.3])])
+    index.save_user_scores(lib_b, [('bob', 'b1', [0.4])])
+
+    assert index.prune_user_scores(lib_a, ['alice', BAD_USER]) == 1
+
+    assert set(index.load_user_scores(lib_a)) == {'alice', BAD_USER}
+    assert set(index.load_user_scores(lib_b)) == {'bob'}
+
+
+def test_old_user_scores_table_is_replaced(tmp_path):
+    import sqlite3
+
+    db_file = str(tmp_path / 'scan_index.db')
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE user_scores (username TEXT PRIMARY KEY, digest TEXT NOT NULL, scores BLOB NOT NULL)")
+    conn.execute("INSERT INTO user_scores VALUES ('alice', 'old', x'')")
+    conn.commit()
+    conn.close()
+
+    scan_index = ScanIndex(db_file=db_file)
+    try:
+        assert scan_index.load_user_scores(str(tmp_path)) == {}
+        scan_index.save_user_scores(str(tmp_path), [('alice', 'new', [0.5])])
+        assert scan_index.load_user_scores(str(tmp_path)) == {'alice': ('new', [0.5])}
+    finally:
+        scan_index.close()
@@ -0,0 +1,69 @@
+"""IntelligentCurationSystem 기본 파일 점수 캐시 - 디렉토리별 저장/정리 테스트"""
+
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from main import IntelligentCurationSystem  # noqa: E402
+from scan_index import ScanIndex  # noqa: E402
+from scoring_engine import files_digest  # noqa: E402
+
+
+def user_files(username, sizes):
+    return [{'name': f"chaturbate-{username}-2024-01-0{i + 1}T10_00_00+09_00.mp4", 'size': size}
+            for i, size in enumerate(sizes)]
+
+
+@pytest.fixture
+def score_store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # 레이팅/키워드/보호 목록 파일은 현재 디렉토리에서 읽음
+    store = ScanIndex(db_file=str(tmp_path / 'scan_index.db'))
+    yield store
+    store.close()
+
+
+def make_system(score_store):
+    return IntelligentCurationSystem(ratings_file='user_ratings.json', score_store=score_store)
+
+
+def test_scores_of_shared_users_do_not_overwrite_each_other(score_store, tmp_path):
+    lib_a, lib_b = str(tmp_path / 'a'), str(tmp_path / 'b')
+    files_a = user_files('alice', [100.0, 200.0, 300.0])
+    files_b = user_files('alice', [50.0, 60.0])
+
+    system = make_system(score_store)
+    system.set_score_directory(lib_a, ['alice'])
+    system.score_user_files('alice', files_a)
+    system.set_score_directory(lib_b, ['alice'])  # 경로를 바꾸면 이전 경로 점수가 저장됨
+    system.score_user_files('alice', files_b)
+    system.save_score_cache()
+    system.parallel_scorer.close()
+
+    stored_a = score_store.load_user_scores(lib_a)['alice']
+    stored_b = score_store.load_user_scores(lib_b)['alice']
+    assert stored_a[0] == files_digest([f['name'] for f in files_a], [f['size'] for f in files_a])
+    assert stored_b[0] == files_digest([f['name'] for f in files_b], [f['size'] for f in files_b])
+    assert len(stored_a[1]) == 3 and len(stored_b[1]) == 2
+
+    # 재시작 후 같은 경로를 열면 저장된 점수 재사용 (다시 계산하지 않음)
+    restarted = make_system(score_store)
+    restarted.set_score_directory(lib_a, ['alice'])
+    _, file_scores, _ = restarted.score_user_files('alice', files_a)
+    assert file_scores == stored_a[1]
+    assert not restarted._dirty_file_scores
+    restarted.parallel_scorer.close()
+
+
+def test_users_missing_from_scan_are_pruned(score_store, tmp_path):
+    lib = str(tmp_path / 'lib')
+    system = make_system(score_store)
+    system.set_score_directory(lib, ['alice', 'bob'])
+    system.score_user_files('alice', user_files('alice', [100.0, 200.0]))
+    system.score_user_files('bob', user_files('bob', [100.0]))
+    system.save_score_cache()
+
+    system.set_score_directory(lib, ['alice'])
+
+    assert set(score_store.load_user_scores(lib)) == {'alice'}
+    assert set(system._load_file_score_cache()) == {'alice'}
+    system.parallel_scorer.close()
@@ -0,0 +1,30 @@
+"""scoring_engine 고정 해시(미세 조정 값 / 점수 캐시 키) 테스트"""
+
+import hashlib
+import os
+
+from scoring_engine import file_scores_basic, files_digest, stable_jitter
+
+NAME = "chaturbate-alice-2024-01-01T10_00_00+09_00.mp4"
+# 잘못된 UTF-8 바이트가 섞인 파일명 (Linux 에서 os.listdir 이 surrogate escape 로 돌려주는 형태)
+BAD_NAME = os.fsdecode(b"chaturbate-alice-2024-01-01T10_00_00+09_00\xff.mp4") if os.name != 'nt' else "bad\udcff.mp4"
+
+
+def test_stable_jitter_is_fixed_and_bounded():
+    digest = hashlib.blake2b(NAME.encode('utf-8'), digest_size=8).digest()
+    assert stable_jitter(NAME) == (int.from_bytes(digest, 'little') % 100) / 1000.0 - 0.05
+    assert -0.05 <= stable_jitter(BAD_NAME) <= 0.05
+    assert stable_jitter(BAD_NAME) == stable_jitter(BAD_NAME)
+
+
+def test_files_digest_accepts_non_utf8_names():
+    digest = files_digest([NAME, BAD_NAME], [100.0, 200.0])
+    assert digest == files_digest([NAME, BAD_NAME], [100.0, 200.0])
+    assert digest != files_digest([NAME, BAD_NAME], [100.0, 201.0])
+    assert digest != files_digest([NAME], [100.0])
+
+
+def test_file_scores_with_non_utf8_name():
+    scores = file_scores_basic([100.0, 300.0, 500.0], [NAME, BAD_NAME, "c.mp4"])
+    assert len(scores) == 3
+    assert all(0.0 <= score <= 1.0 for score in scores)
@@ -0,0 +1,109 @@
+"""TargetSavingsSelector 기준 점수/선택을 작은 무작위 입력의 단순 계산/완전 탐색 결과와 비교"""
+
+import itertools
+import random
+from collections import Counter
+
+import pytest
+
+from deletion_planner import TargetSavingsSelector
+from planner_helpers import CAPS, assert_within_limits, make_candidates, reference_limits, reference_prefix
+
+
+def reference_threshold(candidates, target, cap, max_score):
+    """목표를 채우는 가장 낮은 점수 기준 - 모든 점수를 차례로 확인"""
+    scores = sorted({file_data['composite_score'] for files in candidates.values() for file_data in files})
+    for threshold in scores:
+        if threshold > max_score:
+            break
+        if sum(file_data['size'] for file_data in reference_prefix(candidates, threshold, cap)) >= target:
+            return threshold
+    return None
+
+
+def optimal_knapsack_loss(candidates, target, limits, max_score):
+    """상한 안에서 target 이상을 채우는 조합 중 최소 점수 합 (완전 탐색, 없으면 None)"""
+    eligible = [file_data for files in candidates.values() for file_data in files
+                if file_data['composite_score'] <= max_score]
+    best = None
+    for count in range(len(eligible) + 1):
+        for combo in itertools.combinations(eligible, count):
+            if sum(file_data['size'] for file_data in combo) < target:
+                continue
+            per_user = Counter(file_data['username'] for file_data in combo)
+            if any(per_user[username] > limits[username] for username in per_user):
+                continue
+            loss = sum(file_data['composite_score'] for file_data in combo)
+            if best is None or loss < best:
+                best = loss
+    return best
+
+
+@pytest.mark.parametrize('cap_name', sorted(CAPS))
+@pytest.mark.parametrize('seed', range(40))
+def test_find_threshold_and_select_match_reference(seed, cap_name):
+    rng = random.Random(seed)
+    cap = CAPS[cap_name]
+    candidates = make_candidates(rng)
+    selector = TargetSavingsSelector(candidates)
+    total_size = sum(file_data['size'] for files in candidates.values() for file_data in files)
+    max_score = rng.choice([0.5, 0.85, 1.0])
+
+    for target in (1, total_size // 3, total_size // 2, total_size, total_size + 1):
+        threshold = selector.find_threshold(target, cap, max_score)
+        assert threshold == reference_threshold(candidates, target, cap, max_score)
+        if threshold is None:
+            continue
+
+        selected = selector.select(threshold, cap, target)
+        limits = reference_limits(candidates, threshold, cap)
+        assert_within_limits(selected, limits)
+        assert all(file_data['composite_score'] <= threshold for file_data in selected)
+        assert sum(file_data['size'] for file_data in selected) >= target
+        # 점수 낮은 순으로 고르고 목표를 채우면 멈춤 - 마지막 파일 전까지는 목표 미달
+        scores = [file_data['composite_score'] for file_data in selected]
+        assert scores == sorted(scores)
+        assert sum(file_data['size'] for file_data in selected[:-1]) < target
+
+
+@pytest.mark.parametrize('cap_name', sorted(CAPS))
+@pytest.mark.parametrize('seed', range(40))
+def test_select_knapsack_respects_caps_and_is_minimal(seed, cap_name):
+    rng = random.Random(seed)
+    cap = CAPS[cap_name]
+    candidates = make_candidates(rng, max_users=3, max_files=4)
+    selector = TargetSavingsSelector(candidates)
+    max_score = rng.choice([0.5, 1.0])
+    limits = reference_limits(candidates, max_score, cap)
+    reachable = sum(file_data['size'] for file_data in reference_prefix(candidates, max_score, CAPS['none']))
+
+    for target in (1, reachable // 2, reachable):
+        selected = selector.select_knapsack(target, cap, max_score)
+        assert_within_limits(selected, limits)
+        assert all(file_data['composite_score'] <= max_score for file_data in selected)
+        savings = sum(file_data['size'] for file_data in selected)
+
+        optimum = optimal_knapsack_loss(candidates, target, limits, max_score)
+        if savings >= target:
+            # 넘친 파일을 뺀 뒤에는 어떤 파일을 빼도 목표 미달
+            assert all(savings - file_data['size'] < target for file_data in selected)
+            assert optimum is not None
+            assert sum(file_data['composite_score'] for file_data in selected) >= optimum - 1e-9
+        if cap_name == 'none':
+            # 상한이 없으면 채울 수 있을 때는 반드시 채움
+            assert (savings >= target) == (optimum is not None)
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_select_knapsack_is_optimal_for_equal_sizes(seed):
+    rng = random.Random(seed)
+    candidates = make_candidates(rng, max_users=3, max_files=4, equal_size=True)
+    selector = TargetSavingsSelector(candidates)
+    cap = CAPS['none']
+    limits = reference_limits(candidates, 1.0, cap)
+    total_size = sum(file_data['size'] for files in candidates.values() for file_data in files)
+
+    for target in range(10, total_size + 1, 10):
+        selected = selector.select_knapsack(target, cap, 1.0)
+        optimum = optimal_knapsack_loss(candidates, target, limits, 1.0)
+        assert sum(file_data['composite_score'] for file_data in selected) == pytest.approx(optimum)
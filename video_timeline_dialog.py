@@ -4,7 +4,6 @@
 import sys
 import os
 import subprocess
-import re
 from datetime import datetime
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget, 
                              QListWidgetItem, QLabel, QPushButton, QLineEdit,
@@ -12,6 +11,7 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QListWidget,
                              QWidget, QToolTip)
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QPixmap, QFont, QIcon, QPainter, QPen, QColor
+from filename_parser import parse_filename
 
 class VideoTimelineDialog(QDialog):
     def __init__(self, capacity_finder, parent=None):
@@ -322,19 +322,9 @@ class VideoTimelineDialog(QDialog):
             return None
             
     def extract_date_from_filename(self, file_name):
-        """파일명에서 날짜 추출 (CapacityFinder와 동일한 로직)"""
-        try:
-            # 날짜 패턴 (2025-06-26T15_09_46+09_00 형식)
-            date_pattern = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}_\d{2}_\d{2}[+-]\d{2}_\d{2}')
-            date_match = date_pattern.search(file_name)
-            if date_match:
-                date_str = date_match.group()
-                # 2025-06-26T15_09_46+09_00 -> datetime 변환
-                file_date = datetime.fromisoformat(date_str.replace('_', ':'))
-                return file_date
-        except Exception as e:
-            print(f"날짜 추출 오류: {file_name}, 에러: {e}")
-        return None
+        """파일명에서 날짜 추출 (CapacityFinder와 같은 공용 파서 사용)"""
+        parsed = parse_filename(file_name)
+        return parsed.date_time if parsed else None
         
     def format_file_size(self, size_mb):
         """파일 크기 포맷팅"""
@@ -20,6 +20,7 @@ logger = logging.getLogger('visual_selection_dialog')
 
 # FFmpeg 관리자 import
 from ffmpeg_manager import FFmpegManager
+from io_concurrency import get_io_controller, is_network_path
 
 class ThumbnailExtractorThread(QThread):
     """썸네일 추출을 백그라운드에서 처리하는 스레드"""
@@ -71,15 +72,18 @@ class ThumbnailExtractorThread(QThread):
             logger.warning("🛑 시작 전 중단 요청으로 작업 취소")
             return
         
-        # 네트워크 드라이브 확인 및 적응적 스레드 수 결정
-        first_file_path = os.path.join(self.current_path, self.file_list[0]['name']) if self.file_list else ""
-        is_network_path = first_file_path.startswith('\\\\') or first_file_path.startswith('//')
-        
-        if is_network_path:
-            max_workers = 1  # 네트워크 드라이브는 순차 처리
-            logger.info("🌐 네트워크 드라이브 감지 - 순차 썸네일 생성 모드")
-        else:
-            max_workers = min(3, len(self.file_list))  # 로컬은 최대 3개 동시 처리
+        # 동시 추출 수는 저장소 반응(지연/처리량)에 따라 제어기가 조절
+        # 네트워크 드라이브는 1개로 시작해서 혼잡하지 않은 만큼만 늘림
+        network_path = is_network_path(self.current_path)
+        io_controller = get_io_controller(
+            self.current_path or '.', 'thumbnail',
+            initial=1 if network_path else 3,
+            max_limit=4 if network_path else max(3, min(8, os.cpu_count() or 3)),
+            min_latency_delta=0.5
+        )
+        max_workers = max(1, min(io_controller.max_limit, len(self.file_list)))
+        if network_path:
+            logger.info(f"🌐 네트워크 드라이브 감지 - 적응형 썸네일 생성 (현재 동시 {io_controller.limit}개)")
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # 모든 썸네일 추출 작업 제출
@@ -94,7 +98,7 @@ class ThumbnailExtractorThread(QThread):
                 file_path = os.path.join(self.current_path, file_name)
                 
                 if os.path.exists(file_path):
-                    future = executor.submit(self.extract_thumbnail, file_path)
+                    future = executor.submit(io_controller.run, self.extract_thumbnail, file_path)
                     future_to_file[future] = file_name
             
             # 제출된 작업이 없으면 종료
@@ -215,7 +219,7 @@ class ThumbnailExtractorThread(QThread):
             logger.warning(f"🛑 썸네일 추출 중단됨: {completed_count}개 완료, {elapsed_time:.1f}초 소요")
         else:
             logger.info(f"🎯 배치 추출 완료: {len(self.file_list)}개 파일, {elapsed_time:.1f}초 소요")
-            logger.info(f"   ⚡ 평균 속도: {len(self.file_list)/elapsed_time:.1f}개/초")
+            logger.info(f"   ⚡ 평균 속도: {len(self.file_list)/elapsed_time:.1f}개/초 (동시 작업 수: {io_controller.limit})")
 
     def handle_timeout_dialog(self, completed_count, remaining_count, future_to_file):
         """타임아웃 발생시 사용자 선택 다이얼로그"""